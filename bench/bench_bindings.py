@@ -0,0 +1,366 @@
+# Per-binding microbenchmark: runs every function of export_api_list in
+# bindgen.py, plus the hand-written ones, many times inside a headless frame.
+# For each binding it reports
+#   ns_per_call          python -> binding -> ImGui, loop overhead subtracted
+#   native_ns_per_call   the same calls replayed from a CommandBuffer, i.e. ImGui itself
+#   binding_overhead     share of ns_per_call not spent in native_ns_per_call
+#   allocs_per_call      python allocations per call
+#
+#   python bench/bench_bindings.py [--module imgui_bench] [-o results.json]
+import argparse
+import array
+import ast
+import gc
+import importlib
+import json
+import os
+import re
+import sys
+import time
+
+parser = argparse.ArgumentParser(prog='bench_bindings', description='ImGui per-binding microbenchmark')
+parser.add_argument('--module', default='imgui_bench', help='module the binding is compiled into, see imgui_bench.cpp')
+parser.add_argument('-n', '--number', type=int, default=2000, help='calls per frame')
+parser.add_argument('-r', '--repeat', type=int, default=5, help='frames per binding, the best one is reported')
+parser.add_argument('-k', '--filter', default='', help='only run bindings matching this regex')
+parser.add_argument('-o', '--out', default='', help='write results as JSON to this file')
+args = parser.parse_args()
+
+ImGui = importlib.import_module(args.module)
+
+# functions of the host module, not of the binding
+host_functions = {'CreateHeadlessContext', 'DestroyContext', 'NewFrame', 'EndFrame',
+                  'StartAllocationCount', 'StopAllocationCount', 'Replay', 'ImVec2', 'ImVec4'}
+
+# openers and their closers, closers only run when the opener returned true if `conditional`
+pairs = {
+    'Begin': ('End', False),
+    'BeginChild': ('EndChild', False),
+    'BeginChildFrame': ('EndChildFrame', False),
+    'BeginGroup': ('EndGroup', False),
+    'BeginDisabled': ('EndDisabled', False),
+    'BeginTooltip': ('EndTooltip', True),
+    'BeginItemTooltip': ('EndTooltip', True),
+    'BeginCombo': ('EndCombo', True),
+    'BeginListBox': ('EndListBox', True),
+    'BeginMenuBar': ('EndMenuBar', True),
+    'BeginMainMenuBar': ('EndMainMenuBar', True),
+    'BeginMenu': ('EndMenu', True),
+    'BeginPopup': ('EndPopup', True),
+    'BeginPopupModal': ('EndPopup', True),
+    'BeginPopupContextItem': ('EndPopup', True),
+    'BeginPopupContextWindow': ('EndPopup', True),
+    'BeginPopupContextVoid': ('EndPopup', True),
+    'BeginTable': ('EndTable', True),
+    'BeginTabBar': ('EndTabBar', True),
+    'BeginTabItem': ('EndTabItem', True),
+    'TreeNode': ('TreePop', True),
+    'TreePush': ('TreePop', False),
+    'PushID': ('PopID', False),
+    'PushStyleColor': ('PopStyleColor', False),
+    'PushStyleVar': ('PopStyleVar', False),
+    'PushStylePreset': ('PopStylePreset', False),
+    'PushTabStop': ('PopTabStop', False),
+    'PushButtonRepeat': ('PopButtonRepeat', False),
+    'PushItemWidth': ('PopItemWidth', False),
+    'PushTextWrapPos': ('PopTextWrapPos', False),
+}
+closers = {closer for closer, conditional in pairs.values()}
+# closers taking the arguments of their opener
+closers_with_args = {'PopStylePreset'}
+
+skipped = {
+    'CloseCurrentPopup': 'needs an open popup',
+}
+
+# bindings that only work inside a table or a tab bar:
+# (opener, its arguments), calls made before the benchmarked one, closer, and whether
+# the scope is re-entered for every call or entered once around all of them
+table_args = ('bench_table', 4, ImGui.TableFlags.Hideable)
+scopes = {
+    'table_setup': (('BeginTable', table_args), [], 'EndTable', True),
+    'table': (('BeginTable', table_args), [('TableNextRow', ()), ('TableNextColumn', ())], 'EndTable', False),
+    'tabbar': (('BeginTabBar', ('bench_tabbar',)), [], 'EndTabBar', False),
+}
+def scope_of(name):
+    if name in ('TableSetupColumn', 'TableSetupScrollFreeze', 'TableHeadersRow'):
+        return 'table_setup'
+    if name.startswith('Table'):
+        return 'table'
+    if name in ('BeginTabItem', 'TabItemButton', 'SetTabItemClosed'):
+        return 'tabbar'
+    return None
+
+# arguments for bindings that cannot run with synthesized ones, one entry per benchmarked call
+arg_overrides = {
+    'BeginTable': [table_args],
+    'TableSetBgColor': [(1, 0xff0000ff)],
+    'TabItemButton': [('bench_button',)], # must not collide with the BeginTabItem label
+    'PushStyleVar': [(0, 1.0), (2, ImGui.ImVec2(4, 4))], # Alpha is a float, WindowPadding an ImVec2
+    'DragScalar': [('bench', ImGui.DataType.Float, 1.0), ('bench', array.array('f', [1, 2, 3]))],
+    'SliderScalar': [('bench', ImGui.DataType.Float, 1.0), ('bench', array.array('f', [1, 2, 3]))],
+    'TextLines': [(['bench'] * 100,), (b'bench\n' * 100, array.array('i', range(0, 600, 6)))],
+    'PlotLines': [('bench', array.array('f', range(1000))), ('bench', array.array('d', range(1000)), 500)],
+    'PlotHistogram': [('bench', array.array('f', range(1000))), ('bench', array.array('d', range(1000)), 500)],
+    'InputScalar': [('bench', array.array('f', [1])), ('bench', array.array('i', [1, 2, 3]), 1)],
+    'VSliderScalar': [('bench', ImGui.ImVec2(20, 100), array.array('f', [1])), ('bench', ImGui.ImVec2(20, 100), array.array('i', [1]))],
+    'TableColumns': [('bench_columns', [array.array('d', range(10000)), array.array('i', range(10000)), [str(i) for i in range(10000)]],
+                      ['float', 'int', 'str'], [None, '%08d', None])],
+}
+
+# an ID as a str and, built with --labels, as a Label hashed once
+long_id = '/sensors/rack3/unit17/temperature/history'
+if hasattr(ImGui, 'Label'):
+    long_label = ImGui.Label(long_id)
+    arg_overrides['PushID'] = [(long_id,), (long_label,), (1,)]
+    arg_overrides['GetID'] = [(long_id,), (long_label,)]
+
+# bindings drawing too many vertices for the 16-bit indices of a draw list at --number calls per frame,
+# or only measured when visible
+max_calls = {
+    'TableColumns': 1, # each further call in a frame would be a table below the window, clipped
+    'ColorPicker3': 500,
+    'ColorPicker4': 500,
+    'BeginTabItem': 500,
+    'TabItemButton': 500,
+}
+
+state_store = ImGui.StateStore()
+input_snapshot = ImGui.InputSnapshot()
+# the colors and vars of a typical themed section
+style_preset = ImGui.StylePreset()
+for col in (ImGui.Col.Text, ImGui.Col.Button, ImGui.Col.ButtonHovered, ImGui.Col.ButtonActive, ImGui.Col.FrameBg, ImGui.Col.Border):
+    style_preset.SetColor(col, 0xff808080)
+style_preset.SetVar(ImGui.StyleVar.FrameRounding, 4.0).SetVar(ImGui.StyleVar.FramePadding, ImGui.ImVec2(6, 3))
+
+def synthesize(param_type, param_name):
+    if param_type == 'str':
+        return 'bench'
+    if param_type == 'float':
+        return 1.0
+    if param_type == 'int':
+        return 1 if param_name.endswith('id') else 0
+    if param_type == 'bool':
+        return False
+    if 'ImVec2' in param_type:
+        return ImGui.ImVec2(10, 10)
+    if 'ImVec4' in param_type:
+        return ImGui.ImVec4(1, 1, 1, 1)
+    if 'TextBuffer' in param_type:
+        return ImGui.TextBuffer('bench')
+    if param_type.endswith('.Key'):
+        return ImGui.Key.A
+    if param_type == 'handle' and param_name == 'key': # a StateStore key
+        return 1
+    if 'StateStore' in param_type:
+        return state_store
+    if 'InputSnapshot' in param_type:
+        return input_snapshot
+    if 'StylePreset' in param_type:
+        return style_preset
+    m = re.fullmatch(r'Annotated\[List\[(\w+)\], FixedSize\((\d)\)\]', param_type)
+    if m:
+        return (synthesize(m.group(1), param_name),) * int(m.group(2))
+    raise TypeError(f'cannot synthesize argument {param_name}: {param_type}')
+
+def split_params(params):
+    parts, depth, word = [], 0, ''
+    for c in params:
+        if c in '[(<':
+            depth += 1
+        elif c in '])>':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            parts.append(word.strip())
+            word = ''
+            continue
+        word += c
+    if word.strip():
+        parts.append(word.strip())
+    return parts
+
+# required arguments of every overload, from the pybind11 generated signatures
+def overload_args(name, func):
+    overloads = []
+    for m in re.finditer(rf'^(?:\d+\. )?{name}\((.*)\) ->', func.__doc__ or '', re.M):
+        params = [p for p in split_params(m.group(1)) if p not in ('*args', '**kwargs')]
+        required = [p.split(':', 1) for p in params if '=' not in p]
+        try:
+            overloads.append(tuple(synthesize(t.strip(), n.strip()) for n, t in required))
+        except TypeError as e:
+            overloads.append(e)
+    return overloads
+
+# export_api_list from bindgen.py, in declaration order
+def export_api_names():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bindgen.py')
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], 'id', '') == 'export_api_list':
+            return [n.strip('[]') for n in node.value.value.split()]
+    return []
+
+def truthy(result):
+    return result[0] if isinstance(result, tuple) else result
+
+def enter_scope(api, scope):
+    (opener, opener_args), prelude, closer, per_call = scope
+    result = getattr(api, opener)(*opener_args)
+    if isinstance(api, ImGui.CommandBuffer):
+        api.If(result)
+    elif not truthy(result):
+        raise RuntimeError(f'{opener} returned false')
+    for name, call_args in prelude:
+        getattr(api, name)(*call_args)
+
+def leave_scope(api, scope):
+    getattr(api, scope[2])()
+    if isinstance(api, ImGui.CommandBuffer):
+        api.EndIf()
+
+# one benchmarked call, and the scope to enter around all calls if any.
+# `api` is either the module or a CommandBuffer recording it
+def make_body(name, call_args):
+    def call(api):
+        result = getattr(api, name)(*call_args)
+        if name in pairs:
+            closer, conditional = pairs[name]
+            if closer in closers_with_args:
+                getattr(api, closer)(*call_args)
+            elif not conditional:
+                getattr(api, closer)()
+            elif isinstance(api, ImGui.CommandBuffer):
+                api.If(result)
+                getattr(api, closer)()
+                api.EndIf()
+            elif truthy(result):
+                getattr(api, closer)()
+    scope = scopes.get(scope_of(name))
+    if scope is None or not scope[3]:
+        return call, scope
+    return make_scoped(scope, call), None
+
+def make_scoped(scope, call):
+    def scoped(api):
+        enter_scope(api, scope)
+        call(api)
+        leave_scope(api, scope)
+    return scoped
+
+def in_frame(run):
+    gc.collect()
+    ImGui.NewFrame()
+    ImGui.SetNextWindowSize(ImGui.ImVec2(800, 600))
+    ImGui.Begin('bench')
+    try:
+        return run()
+    finally:
+        ImGui.End()
+        ImGui.EndFrame()
+
+# best ns and allocations per call of `body` called directly
+def measure_direct(body, outer=None, number=args.number):
+    def run():
+        if outer:
+            enter_scope(ImGui, outer)
+        ImGui.StartAllocationCount()
+        t = time.perf_counter_ns()
+        for _ in range(number):
+            body(ImGui)
+        t = time.perf_counter_ns() - t
+        allocs = ImGui.StopAllocationCount()
+        if outer:
+            leave_scope(ImGui, outer)
+        return t, allocs
+    runs = [in_frame(run) for _ in range(args.repeat)]
+    return min(t for t, a in runs) / number, min(a for t, a in runs) / number
+
+# best ns per call of `body` replayed from a CommandBuffer, None if it cannot be recorded
+def measure_native(body, outer=None, number=args.number):
+    cb = ImGui.CommandBuffer()
+    try:
+        for _ in range(number):
+            body(cb)
+    except (AttributeError, TypeError):
+        return None
+    def run():
+        if outer:
+            enter_scope(ImGui, outer)
+        t = time.perf_counter_ns()
+        ImGui.Replay(cb)
+        t = time.perf_counter_ns() - t
+        if outer:
+            leave_scope(ImGui, outer)
+        return t
+    return min(in_frame(run) for _ in range(args.repeat)) / number
+
+ImGui.CreateHeadlessContext()
+gc.disable()
+
+names = export_api_names()
+names += sorted(n for n in dir(ImGui) if n not in names and n not in host_functions
+                and type(getattr(ImGui, n)).__name__ == 'builtin_function_or_method')
+
+empty = lambda api: None
+baseline = {None: (measure_direct(empty), measure_native(empty))}
+for scope in scopes:
+    if scopes[scope][3]:
+        body = make_scoped(scopes[scope], empty)
+        baseline[scope] = (measure_direct(body), measure_native(body))
+    else:
+        baseline[scope] = (measure_direct(empty, scopes[scope]), measure_native(empty, scopes[scope]))
+
+results = {}
+for name in names:
+    if args.filter and not re.search(args.filter, name):
+        continue
+    if name in closers or name in skipped or not hasattr(ImGui, name):
+        skipped.setdefault(name, f'benchmarked with its opener' if name in closers else 'not bound')
+        continue
+    if name in arg_overrides:
+        calls = arg_overrides[name]
+    else:
+        calls = overload_args(name, getattr(ImGui, name))
+    for i, call_args in enumerate(calls):
+        key = name if len(calls) == 1 else f'{name}#{i+1}'
+        if isinstance(call_args, Exception):
+            skipped[key] = str(call_args)
+            continue
+        body, outer = make_body(name, call_args)
+        try:
+            in_frame(lambda: make_scoped(outer, body)(ImGui) if outer else body(ImGui))
+        except Exception as e:
+            skipped[key] = f'{type(e).__name__}: {e}'
+            continue
+        (base_ns, base_allocs), base_native = baseline[scope_of(name)]
+        number = min(args.number, max_calls.get(name, args.number))
+        ns, allocs = measure_direct(body, outer, number)
+        native = measure_native(body, outer, number)
+        ns, allocs = max(ns - base_ns, 0.0), max(allocs - base_allocs, 0.0)
+        if native is not None:
+            native = max(native - base_native, 0.0)
+        results[key] = {
+            'ns_per_call': round(ns, 1),
+            'native_ns_per_call': None if native is None else round(native, 1),
+            'binding_overhead': None if native is None or ns == 0 else round(max(ns - native, 0.0) / ns, 3),
+            'allocs_per_call': round(allocs, 2),
+        }
+        r = results[key]
+        print(f'{key:32}{r["ns_per_call"]:10.1f} ns{"" if native is None else f"{native:10.1f} ns native":>20}{allocs:8.2f} allocs', file=sys.stderr)
+
+ImGui.DestroyContext()
+
+report = {
+    'imgui_version': ImGui.IMGUI_VERSION,
+    'python_version': sys.version.split()[0],
+    'number': args.number,
+    'repeat': args.repeat,
+    'results': results,
+    'skipped': {k: v for k, v in skipped.items() if not args.filter or re.search(args.filter, k)},
+}
+if args.out:
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+else:
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,44 @@
+# Flag microbenchmark: cost of combining flags and passing them to a bound
+# function, for each way `bindgen.py --enums` can expose them.
+#
+#   python bench/bench_enums.py [--module imgui_bench]
+import argparse
+import enum
+import importlib
+import timeit
+import types
+
+parser = argparse.ArgumentParser(prog='bench_enums', description='ImGui flag enum microbenchmark')
+parser.add_argument('--module', default='imgui_bench', help='module the binding is compiled into, see imgui_bench.cpp')
+parser.add_argument('-n', '--number', type=int, default=200000, help='iterations per measurement')
+args = parser.parse_args()
+
+ImGui = importlib.import_module(args.module)
+
+# the compiled module can only hold one flavour, build the others from its values
+compiled = ImGui.FocusedFlags
+if isinstance(compiled, types.ModuleType):
+    values = {k: v for k, v in vars(compiled).items() if isinstance(v, int)}
+else:
+    values = {k: int(v) for k, v in compiled.__members__.items()}
+
+flavours = {
+    'int': types.SimpleNamespace(**values),
+    'IntFlag': enum.IntFlag('FocusedFlags', list(values.items())),
+}
+if not isinstance(compiled, (types.ModuleType, enum.EnumMeta)):
+    flavours['pybind11 enum'] = compiled
+
+ImGui.CreateHeadlessContext()
+ImGui.NewFrame()
+ImGui.Begin('bench')
+
+print(f'{"":16}{"combine ns":>12}{"call ns":>12}')
+for name, F in flavours.items():
+    combine = timeit.timeit(lambda: F.ChildWindows | F.RootWindow, number=args.number)
+    call = timeit.timeit(lambda: ImGui.IsWindowFocused(F.ChildWindows | F.RootWindow), number=args.number)
+    print(f'{name:16}{combine/args.number*1e9:12.1f}{call/args.number*1e9:12.1f}')
+
+ImGui.End()
+ImGui.EndFrame()
+ImGui.DestroyContext()
@@ -0,0 +1,31 @@
+# Import time of the compiled binding: each sample imports it in a fresh
+# interpreter, so compare builds made with and without `bindgen.py --lazy`
+# and `--strip-docs`. Every build is a directory holding an imgui_bench module.
+#
+#   python bench/bench_import.py [--module imgui_bench] [-r 20] build_dir...
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+parser = argparse.ArgumentParser(prog='bench_import', description='ImGui binding import time')
+parser.add_argument('--module', default='imgui_bench', help='module the binding is compiled into, see imgui_bench.cpp')
+parser.add_argument('-r', '--repeat', type=int, default=20, help='fresh interpreters per build')
+parser.add_argument('builds', nargs='*', default=['.'], help='directories to import the module from')
+args = parser.parse_args()
+
+# time of the import statement alone, without the interpreter start-up
+probe = f'''
+import time
+t = time.perf_counter_ns()
+import {args.module}
+print(time.perf_counter_ns() - t)
+'''
+
+print(f'{"":40}{"median ms":>12}{"min ms":>12}')
+for build in args.builds:
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(build))
+    samples = [int(subprocess.check_output([sys.executable, '-c', probe], env=env)) / 1e6
+               for _ in range(args.repeat)]
+    print(f'{build:40}{statistics.median(samples):12.2f}{min(samples):12.2f}')
@@ -0,0 +1,46 @@
+# Scalar widget microbenchmark: the typed bindings generated for DragFloat3, SliderInt...
+# against the generic DragScalar/SliderScalar, with a python value and with a buffer.
+#
+#   python bench/bench_scalars.py [--module imgui_bench]
+import argparse
+import array
+import importlib
+import timeit
+
+parser = argparse.ArgumentParser(prog='bench_scalars', description='ImGui scalar widget microbenchmark')
+parser.add_argument('--module', default='imgui_bench', help='module the binding is compiled into, see imgui_bench.cpp')
+parser.add_argument('-n', '--number', type=int, default=100000, help='iterations per measurement')
+args = parser.parse_args()
+
+ImGui = importlib.import_module(args.module)
+F, S32 = ImGui.DataType.Float, ImGui.DataType.S32
+
+# (typed call, generic call with a value, generic call with a buffer), the generic calls
+# given the same min and max as the typed ones
+cases = {
+    'DragFloat': (lambda: ImGui.DragFloat('v', 1.0),
+                  lambda: ImGui.DragScalar('v', F, 1.0, 1.0, 0, 0),
+                  lambda b=array.array('f', [1]): ImGui.DragScalar('v', b)),
+    'DragFloat3': (lambda: ImGui.DragFloat3('v', (1.0, 2.0, 3.0)),
+                   lambda: ImGui.DragScalar('v', F, (1.0, 2.0, 3.0), 1.0, 0, 0),
+                   lambda b=array.array('f', [1, 2, 3]): ImGui.DragScalar('v', b)),
+    'SliderInt': (lambda: ImGui.SliderInt('v', 1, 0, 10),
+                  lambda: ImGui.SliderScalar('v', S32, 1, 0, 10, '%d'),
+                  lambda b=array.array('i', [1]): ImGui.SliderScalar('v', b, 0, 10)),
+    'SliderFloat4': (lambda: ImGui.SliderFloat4('v', (1.0, 2.0, 3.0, 4.0), 0, 10),
+                     lambda: ImGui.SliderScalar('v', F, (1.0, 2.0, 3.0, 4.0), 0, 10),
+                     lambda b=array.array('f', [1, 2, 3, 4]): ImGui.SliderScalar('v', b, 0, 10)),
+}
+
+ImGui.CreateHeadlessContext()
+ImGui.NewFrame()
+ImGui.Begin('bench')
+
+print(f'{"":16}{"typed ns":>12}{"generic ns":>12}{"buffer ns":>12}')
+for name, calls in cases.items():
+    ns = [timeit.timeit(call, number=args.number) / args.number * 1e9 for call in calls]
+    print(f'{name:16}' + ''.join(f'{t:12.1f}' for t in ns))
+
+ImGui.End()
+ImGui.EndFrame()
+ImGui.DestroyContext()
@@ -0,0 +1,75 @@
+// Headless host module for the benchmarks: the generated binding, plus just
+// enough context management to run frames without a window or a renderer.
+//
+// Build it next to the generated binding (all of its --shards files), e.g. with the one command
+//   c++ -O2 -std=c++17 -shared -fPIC $(python3 -m pybind11 --includes) -I. -I$IMGUI -I$IMGUI/misc/cpp
+//     bench/imgui_bench.cpp pybind11_imgui*.cpp $IMGUI/imgui*.cpp $IMGUI/misc/cpp/imgui_stdlib.cpp
+//     -o imgui_bench$(python3-config --extension-suffix)
+
+#include "pybind11_imgui.h"
+#include <imgui.h>
+
+namespace py = pybind11;
+
+// counts python allocations by wrapping the PyMem allocators while enabled
+static PyMemAllocatorEx orig_alloc[2];
+static size_t alloc_count = 0;
+
+static void* counting_malloc(void* ctx, size_t size) {
+  ++alloc_count;
+  auto a = static_cast<PyMemAllocatorEx*>(ctx);
+  return a->malloc(a->ctx, size);
+}
+static void* counting_calloc(void* ctx, size_t nelem, size_t elsize) {
+  ++alloc_count;
+  auto a = static_cast<PyMemAllocatorEx*>(ctx);
+  return a->calloc(a->ctx, nelem, elsize);
+}
+static void* counting_realloc(void* ctx, void* ptr, size_t size) {
+  alloc_count += ptr == nullptr;
+  auto a = static_cast<PyMemAllocatorEx*>(ctx);
+  return a->realloc(a->ctx, ptr, size);
+}
+static void counting_free(void* ctx, void* ptr) {
+  auto a = static_cast<PyMemAllocatorEx*>(ctx);
+  a->free(a->ctx, ptr);
+}
+
+PYBIND11_MODULE(imgui_bench, m)
+{
+  bind_imgui_to_py(m);
+
+  m.attr("IMGUI_VERSION") = IMGUI_VERSION;
+
+  m.def("CreateHeadlessContext", [](float width, float height) {
+    ImGui::CreateContext();
+    ImGuiIO& io = ImGui::GetIO();
+    io.DisplaySize = ImVec2(width, height);
+    io.IniFilename = nullptr;
+    // null renderer: the font atlas has to be built, but is never uploaded
+    unsigned char* pixels;
+    int w, h;
+    io.Fonts->GetTexDataAsRGBA32(&pixels, &w, &h);
+  }, py::arg("width") = 1280.f, py::arg("height") = 720.f);
+  m.def("DestroyContext", []{ ImGui::DestroyContext(); });
+  m.def("NewFrame", []{
+    ImGui::GetIO().DeltaTime = 1.f / 60.f;
+    ImGui::NewFrame();
+  });
+  m.def("EndFrame", []{ ImGui::Render(); });
+
+  m.def("StartAllocationCount", []{
+    PyMemAllocatorDomain domains[2] = {PYMEM_DOMAIN_MEM, PYMEM_DOMAIN_OBJ};
+    alloc_count = 0;
+    for (int i = 0; i < 2; ++i) {
+      PyMem_GetAllocator(domains[i], &orig_alloc[i]);
+      PyMemAllocatorEx counting = {&orig_alloc[i], counting_malloc, counting_calloc, counting_realloc, counting_free};
+      PyMem_SetAllocator(domains[i], &counting);
+    }
+  });
+  m.def("StopAllocationCount", []{
+    PyMem_SetAllocator(PYMEM_DOMAIN_MEM, &orig_alloc[0]);
+    PyMem_SetAllocator(PYMEM_DOMAIN_OBJ, &orig_alloc[1]);
+    return alloc_count;
+  }, "stop counting, returns the number of python allocations since StartAllocationCount()");
+}
@@ -1,11 +1,44 @@
 import argparse
+import glob
+import hashlib
 import itertools
 import re
 import os
+import pickle
+import sys
 
 parser = argparse.ArgumentParser(prog='bindgen', description='ImGui Binding Generator')
 parser.add_argument('imgui_dir', help='path to imgui directory')
 parser.add_argument('-o', '--out', default='pybind11_imgui', help='basename of output file')
+parser.add_argument('--enums', choices=['enum', 'int', 'intflag'], default='enum',
+                    help='how enums are exposed: pybind11 enums (default), '
+                         'plain int constants in a namespace per enum, '
+                         'or python enum.IntFlag / enum.IntEnum classes')
+parser.add_argument('--vec', choices=['class', 'tuple', 'structseq'], default='class',
+                    help='how ImVec2/ImVec4 are exposed: pybind11 classes (default), '
+                         'or type casters taking any sequence of numbers and returning '
+                         'plain tuples / struct sequences with x, y, z, w fields')
+parser.add_argument('--instrument', action='store_true',
+                    help='count calls (and optionally time them) per bound function, '
+                         'reported by GetBindingStats()')
+parser.add_argument('--cache-dir', default='.bindgen_cache',
+                    help='where the parsed imgui.h is cached, keyed by a hash of imgui.h and bindgen.py')
+parser.add_argument('--check', action='store_true',
+                    help='only report the output files that are out of date, exit with 1 if any is')
+parser.add_argument('--fastcall', action='store_true',
+                    help='bind functions taking and returning only bools, integers, floats and strings '
+                         'as METH_FASTCALL functions instead of through pybind11')
+parser.add_argument('--lazy', action='store_true',
+                    help='create enums and the CommandBuffer API on first access, through the module __getattr__, '
+                         'to import faster')
+parser.add_argument('--strip-docs', action='store_true',
+                    help='leave the docstrings taken from imgui.h out of the binding')
+parser.add_argument('--labels', action='store_true',
+                    help='let functions taking a label or an ID string also take a Label, which keeps its UTF-8 text '
+                         'and the ID it hashes to across frames')
+parser.add_argument('--shards', type=int, default=1,
+                    help='split the binding into this many .cpp files besides the main one, '
+                         'to compile them in parallel')
 args = parser.parse_args()
 
 outname = args.out
@@ -17,8 +50,97 @@ header_template = '''
 
 void bind_imgui_to_py(pybind11::module& m);
 '''
-with open(outname+'.h', 'w') as h:
-    h.write(header_template)
+# ImVec2/ImVec4 type casters, in the header so that every TU converts them the same way
+header_vec_caster = r'''
+#include <imgui.h>
+
+// ImVec2/ImVec4 are converted from any sequence of 2/4 numbers (tuple, list, NumPy row),
+// and to @RESULT@ without allocating wrapper objects
+@TYPES@namespace pybind11 { namespace detail {
+
+template <class T, int N>
+struct imgui_vec_caster
+{
+  PYBIND11_TYPE_CASTER(T, const_name<N == 2>("ImVec2", "ImVec4"));
+
+  bool load(handle src, bool) {
+    if (!src || PyUnicode_Check(src.ptr()) || PyBytes_Check(src.ptr()))
+      return false;
+    PyObject* seq = PySequence_Fast(src.ptr(), ""); // no copy for tuple and list
+    if (!seq) {
+      PyErr_Clear();
+      return false;
+    }
+    bool ok = PySequence_Fast_GET_SIZE(seq) == N;
+    for (int i = 0; ok && i < N; ++i) {
+      double d = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(seq, i));
+      if (d == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        ok = false;
+      }
+      (&value.x)[i] = float(d);
+    }
+    Py_DECREF(seq);
+    return ok;
+  }
+
+  static handle cast(T const& src, return_value_policy, handle) {
+    PyObject* result = @NEW@;
+    if (!result)
+      return nullptr;
+    for (int i = 0; i < N; ++i)
+      @SET@(result, i, PyFloat_FromDouble((&src.x)[i]));
+    return result;
+  }
+};
+
+template <> struct type_caster<ImVec2> : imgui_vec_caster<ImVec2, 2> {};
+template <> struct type_caster<ImVec4> : imgui_vec_caster<ImVec4, 4> {};
+
+}} // namespace pybind11::detail
+'''
+
+# ImGuiKey, a typed enum, is taken from any int when not bound as a pybind11 enum
+header_key_caster = r'''
+#include <imgui.h>
+
+namespace pybind11 { namespace detail {
+
+template <> struct type_caster<ImGuiKey>
+{
+  PYBIND11_TYPE_CASTER(ImGuiKey, const_name("int"));
+
+  bool load(handle src, bool convert) {
+    make_caster<int> key;
+    if (!key.load(src, convert))
+      return false;
+    value = ImGuiKey(cast_op<int>(key));
+    return true;
+  }
+
+  static handle cast(ImGuiKey src, return_value_policy, handle) {
+    return PyLong_FromLong(long(src));
+  }
+};
+
+}} // namespace pybind11::detail
+'''
+
+h_src = header_template
+if args.enums != 'enum':
+    h_src += header_key_caster
+if args.vec == 'tuple':
+    h_src += (header_vec_caster
+          .replace('@RESULT@', 'tuples')
+          .replace('@TYPES@', '')
+          .replace('@NEW@', 'PyTuple_New(N)')
+          .replace('@SET@', 'PyTuple_SET_ITEM'))
+elif args.vec == 'structseq':
+    h_src += (header_vec_caster
+          .replace('@RESULT@', 'struct sequences (tuples with x, y, z, w fields)')
+          .replace('@TYPES@', '// struct sequence types of ImVec2 and ImVec4, created by bind_imgui_to_py\ninline PyTypeObject* imgui_vec_types[2] = {nullptr, nullptr};\n\n')
+          .replace('@NEW@', 'PyStructSequence_New(imgui_vec_types[N/2-1])')
+          .replace('@SET@', 'PyStructSequence_SET_ITEM'))
 
 #-----------------------------------------
 
@@ -35,11 +157,16 @@ class ImGuiEnum(object):
         self.cppname = ''
         self.fields = []
 
+# py::arg value of the C++ default argument `d`: a NULL pointer is None, not the int 0
+def pyarg_default(d):
+    return 'py::none()' if d.strip() in ('NULL', 'nullptr') else d
+
 class ImGuiApi(object):
     name:str
     rettype:str
     signature:str
     argtypes:list[str]
+    argdims:list[str]
     argdefaults:list[str]
     supported:bool
     #arg_re = re.compile(r'^([\w\s*&]+)\s+(\w+)(\[\d*\])?\s*(=\s*([\w\de+-.%" ]+))?$')
@@ -52,6 +179,7 @@ class ImGuiApi(object):
         self.signature = ''
         self.argtypes = []
         self.argnames = []
+        self.argdims = []
         self.argdefaults = []
         self.supported = True
 
@@ -82,6 +210,7 @@ class ImGuiApi(object):
             if m:
                 self.argtypes.append(m.group(1).strip())
                 self.argnames.append(m.group(2).strip())
+                self.argdims.append(m.group(3))
                 self.argdefaults.append(m.group(5))
                 t = m.group(1).strip()
                 if ('*' in t and 'char' not in t) or \
@@ -100,10 +229,17 @@ class ImGuiApi(object):
         for i in range(len(self.argnames)):
             part = f'py::arg("{self.argnames[i]}")'
             if self.argdefaults[i] is not None:
-                part += f' = {self.argdefaults[i]}'
+                part += f' = {pyarg_default(self.argdefaults[i])}'
             parts.append(part)
         return ', '+(', '.join(parts))
 
+    def policyarg(self):
+        # returned pointers are owned by imgui, never by python
+        if '*' in self.rettype and 'char' not in self.rettype:
+            return ', py::return_value_policy::reference'
+        else:
+            return ''
+
     def docarg(self):
         if self.doc:
             doc = self.doc.replace('"', '\\"')
@@ -116,7 +252,8 @@ imgui_api_list = []
 
 in_enum = False
 in_imgui_namespace = False
-enum_start = re.compile(r'^enum\s+(ImGui(\w+)_)$')
+# the flag enums, and ImGuiKey which functions take as a typed enum
+enum_start = re.compile(r'^enum\s+(ImGui(\w+)_|ImGui(Key))(\s*:\s*int)?$')
 enum_field = re.compile(r'^\s*(ImGui\w+_(\w+))\s*(=?.*?,?\s*)(//\s*(.+))?$')
 enum_end = re.compile(r'^\s*}\s*;\s*$')
 
@@ -146,54 +283,90 @@ def parseAPI(line):
         doc = rest[commentstart+2:].strip()
     return ret.strip(), name, sig, doc
 
-brace_in_namespace = 0
-for line in imgui_h_content.split('\n'):
-    if not in_enum:
-        m = enum_start.match(line)
-        if m:
-            e = ImGuiEnum()
-            e.pyname = m.group(2)
-            e.cppname = m.group(1)
-            imgui_enums.append(e)
-            in_enum = True
-    if in_enum:
-        m = enum_field.match(line)
-        if m:
-            name = m.group(2) if m.group(2)!='None' else 'NONE'
-            if name.lower() == 'count':
+# the parsed model only depends on imgui.h and this script, reuse it when neither changed
+with open(__file__, 'rb') as f:
+    cache_key = hashlib.sha256(imgui_h_content.encode() + f.read()).hexdigest()
+cache_path = os.path.join(args.cache_dir, cache_key + '.pickle')
+if os.path.exists(cache_path):
+    with open(cache_path, 'rb') as f:
+        imgui_enums, imgui_api_list = pickle.load(f)
+else:
+    brace_in_namespace = 0
+    for line in imgui_h_content.split('\n'):
+        if not in_enum:
+            m = enum_start.match(line)
+            if m:
+                e = ImGuiEnum()
+                e.pyname = m.group(2) or m.group(3)
+                e.cppname = m.group(1)
+                imgui_enums.append(e)
+                in_enum = True
+        if in_enum:
+            m = enum_field.match(line)
+            if m:
+                # a line may declare several fields (ImGuiKey_A, ImGuiKey_B, ...), and both
+                # branches of an #ifdef the same ones
+                code = line.split('//')[0]
+                for cppname, name in re.findall(r'(?:^|,)\s*(ImGui[A-Za-z0-9]+_(\w+))', code):
+                    name = name if name!='None' else 'NONE'
+                    if name[0].isdigit():
+                        name = '_' + name
+                    doc = m.group(5)
+                    if name.lower() == 'count' or any(f[0] == name for f in imgui_enums[-1].fields):
+                        continue
+                    imgui_enums[-1].fields.append((name, cppname, doc))
+            elif enum_end.match(line):
+                in_enum = False
+
+        if not in_enum and not in_imgui_namespace:
+            if line.strip()=='namespace ImGui':
+                in_imgui_namespace = True
+                brace_in_namespace = 0
                 continue
-            imgui_enums[-1].fields.append((name, m.group(1), m.group(5)))
-        elif enum_end.match(line):
-            in_enum = False
-
-    if not in_enum and not in_imgui_namespace:
-        if line.strip()=='namespace ImGui':
-            in_imgui_namespace = True
-            brace_in_namespace = 0
-            continue
-    if in_imgui_namespace:
-        if line.strip() == '':
-            continue
-        brace_in_namespace += line.count('{')
-        brace_in_namespace -= line.count('}')
-        if brace_in_namespace <= 0:
-            in_imgui_namespace = False
-    if in_imgui_namespace:
-        m = parseAPI(line)
-        if m:
-            f = ImGuiApi()
-            f.rettype = m[0]
-            f.name = m[1]
-            f.setSignature(m[2])
-            f.doc = m[3]
-            #print(f'{f.name}: <{f.signature}>')
-            imgui_api_list.append(f)
+        if in_imgui_namespace:
+            if line.strip() == '':
+                continue
+            brace_in_namespace += line.count('{')
+            brace_in_namespace -= line.count('}')
+            if brace_in_namespace <= 0:
+                in_imgui_namespace = False
+        if in_imgui_namespace:
+            m = parseAPI(line)
+            if m:
+                f = ImGuiApi()
+                f.rettype = m[0]
+                f.name = m[1]
+                f.setSignature(m[2])
+                f.doc = m[3]
+                #print(f'{f.name}: <{f.signature}>')
+                imgui_api_list.append(f)
+    if not args.check:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump((imgui_enums, imgui_api_list), f)
+        # an edit of imgui.h or of this script makes the previous models unreachable
+        for path in glob.glob(os.path.join(glob.escape(args.cache_dir), '*.pickle')):
+            if path != cache_path:
+                os.remove(path)
+
+# value type of each ImGuiStyleVar, from the comments of its enum (before --strip-docs drops them):
+# 'f' float, 'v' ImVec2, ' ' unknown
+style_var_kinds = ''.join({'float': 'f', 'ImVec2': 'v'}.get((doc or '').split(' ')[0], ' ')
+                          for e in imgui_enums if e.cppname == 'ImGuiStyleVar_' for name, value, doc in e.fields)
+
+if args.strip_docs:
+    for api in imgui_api_list:
+        api.doc = None
+    for e in imgui_enums:
+        e.fields = [(name, value, None) for name, value, doc in e.fields]
 
+# integer typedefs (ImGuiID, ImU32, flags...) which --fastcall converts like int
+imgui_int_typedefs = set(re.findall(r'^typedef\s+(?:(?:signed|unsigned)\s+)?(?:char|short|int)\s+(\w+)\s*;', imgui_h_content, re.M))
+
+# overloads in declaration order, so that the output is the same on every run
 imgui_api_map = {}
 for api in imgui_api_list:
-    if api.name not in imgui_api_map:
-        imgui_api_map[api.name] = set()
-    imgui_api_map[api.name].add(api)
+    imgui_api_map.setdefault(api.name, []).append(api)
 
 # [] are skip marks, those functions should be implemented manually
 export_api_list = '''
@@ -222,7 +395,7 @@ Button SmallButton InvisibleButton ArrowButton
 BeginCombo EndCombo BeginListBox EndListBox
 TreeNode TreePush TreePop GetTreeNodeToLabelSpacing CollapsingHeader SetNextItemOpen Selectable
 
-GetMainViewport
+GetMainViewport GetWindowDrawList GetBackgroundDrawList GetForegroundDrawList
 BeginMenuBar EndMenuBar BeginMainMenuBar EndMainMenuBar BeginMenu EndMenu MenuItem
 BeginTooltip EndTooltip BeginItemTooltip
 [SetTooltip] [SetItemTooltip]
@@ -232,6 +405,12 @@ BeginPopupContextItem BeginPopupContextWindow BeginPopupContextVoid IsPopupOpen
 BeginTable EndTable TableNextRow TableNextColumn TableSetColumnIndex
 TableSetupColumn TableSetupScrollFreeze TableHeadersRow TableHeader
 TableGetColumnCount TableGetColumnIndex TableGetRowIndex TableGetColumnName TableGetColumnFlags TableSetColumnEnabled TableSetBgColor
+TableGetSortSpecs
+
+DragFloat DragFloat2 DragFloat3 DragFloat4 DragInt DragInt2 DragInt3 DragInt4
+SliderFloat SliderFloat2 SliderFloat3 SliderFloat4 SliderAngle SliderInt SliderInt2 SliderInt3 SliderInt4 VSliderFloat VSliderInt
+InputFloat InputFloat2 InputFloat3 InputFloat4 InputInt InputInt2 InputInt3 InputInt4 InputDouble
+ColorEdit3 ColorEdit4 ColorPicker3 ColorPicker4 ColorButton
 
 BeginTabBar EndTabBar [BeginTabItem] EndTabItem TabItemButton SetTabItemClosed
 BeginDisabled EndDisabled
@@ -249,7 +428,1129 @@ IsMouseDragging GetMouseDragDelta ResetMouseDragDelta GetMouseCursor SetMouseCur
 GetClipboardText SetClipboardText
 '''
 
-manual_impl_pre = r'''
+# file scope helpers for the manual implementations below
+manual_impl_helpers = r'''
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <memory>
+#include <unordered_map>
+
+// ImGuiDataType of the elements in a buffer, ImGuiDataType_COUNT if there is none
+static ImGuiDataType buffer_data_type(py::buffer_info const& info)
+{
+  char code = info.format.empty() ? 0 : info.format.back();
+  if (info.format.size() > 1 && info.format[0] != '@' && info.format[0] != '=' && info.format[0] != '<')
+    return ImGuiDataType_COUNT; // non-native byte order
+  switch (code) {
+    case 'f': return info.itemsize == 4 ? ImGuiDataType_Float : ImGuiDataType_COUNT;
+    case 'd': return info.itemsize == 8 ? ImGuiDataType_Double : ImGuiDataType_COUNT;
+    case 'b': case 'h': case 'i': case 'l': case 'q':
+      switch (info.itemsize) {
+        case 1: return ImGuiDataType_S8;
+        case 2: return ImGuiDataType_S16;
+        case 4: return ImGuiDataType_S32;
+        case 8: return ImGuiDataType_S64;
+      }
+      break;
+    case 'B': case 'H': case 'I': case 'L': case 'Q':
+      switch (info.itemsize) {
+        case 1: return ImGuiDataType_U8;
+        case 2: return ImGuiDataType_U16;
+        case 4: return ImGuiDataType_U32;
+        case 8: return ImGuiDataType_U64;
+      }
+      break;
+  }
+  return ImGuiDataType_COUNT;
+}
+
+// writable, contiguous 1 to 4 component buffer for the *ScalarN widgets
+static py::buffer_info request_scalar_buffer(py::buffer& value, ImGuiDataType& type)
+{
+  py::buffer_info info = value.request(true);
+  type = buffer_data_type(info);
+  if (type == ImGuiDataType_COUNT)
+    throw py::type_error("unsupported buffer format '" + info.format + "'");
+  if (info.ndim > 1 || (info.ndim == 1 && info.size > 1 && info.strides[0] != info.itemsize))
+    throw py::value_error("expected a contiguous 1-d buffer");
+  if (info.size < 1 || info.size > 4)
+    throw std::range_error("number of component not in range [1,4]");
+  return info;
+}
+
+// convert `src` to `type` and store it in `dst`, which must be large enough for any ImGuiDataType
+static void cast_data_type(py::handle src, ImGuiDataType type, void* dst)
+{
+#define TYPE_CASE(X, T) \
+    case ImGuiDataType_##X: *static_cast<T*>(dst) = py::cast<T>(src); break
+  switch(type) {
+    TYPE_CASE(S8, int8_t);
+    TYPE_CASE(U8, uint8_t);
+    TYPE_CASE(S16, int16_t);
+    TYPE_CASE(U16, uint16_t);
+    TYPE_CASE(S32, int32_t);
+    TYPE_CASE(U32, uint32_t);
+    TYPE_CASE(S64, int64_t);
+    TYPE_CASE(U64, uint64_t);
+    TYPE_CASE(Float, float);
+    TYPE_CASE(Double, double);
+    default:
+      throw std::runtime_error("unsupported data type");
+  }
+#undef TYPE_CASE
+}
+
+// 1-d buffer of integers of any width, for offsets, indices and colors
+static py::buffer_info request_int_buffer(py::handle obj, ImGuiDataType& type, char const* what)
+{
+  py::buffer_info info = py::reinterpret_borrow<py::buffer>(obj).request();
+  type = buffer_data_type(info);
+  if (type == ImGuiDataType_Float || type == ImGuiDataType_Double || type == ImGuiDataType_COUNT)
+    throw py::type_error(std::string(what) + " must be a buffer of integers");
+  if (info.ndim != 1)
+    throw py::value_error(std::string(what) + " must be a 1-d buffer");
+  return info;
+}
+
+static uint64_t int_buffer_at(py::buffer_info const& info, ImGuiDataType type, ssize_t i)
+{
+  char const* p = static_cast<char const*>(info.ptr) + i * info.strides[0];
+  switch (type) {
+    case ImGuiDataType_S8:  return *reinterpret_cast<int8_t const*>(p);
+    case ImGuiDataType_U8:  return *reinterpret_cast<uint8_t const*>(p);
+    case ImGuiDataType_S16: return *reinterpret_cast<int16_t const*>(p);
+    case ImGuiDataType_U16: return *reinterpret_cast<uint16_t const*>(p);
+    case ImGuiDataType_S32: return *reinterpret_cast<int32_t const*>(p);
+    case ImGuiDataType_U32: return *reinterpret_cast<uint32_t const*>(p);
+    case ImGuiDataType_S64: return *reinterpret_cast<int64_t const*>(p);
+    default:                return *reinterpret_cast<uint64_t const*>(p);
+  }
+}
+
+// element at `p` of a buffer of `type`, converted to double
+static double number_at(char const* p, ImGuiDataType type)
+{
+  switch (type) {
+    case ImGuiDataType_Float:  return *reinterpret_cast<float const*>(p);
+    case ImGuiDataType_Double: return *reinterpret_cast<double const*>(p);
+    case ImGuiDataType_S8:     return *reinterpret_cast<int8_t const*>(p);
+    case ImGuiDataType_U8:     return *reinterpret_cast<uint8_t const*>(p);
+    case ImGuiDataType_S16:    return *reinterpret_cast<int16_t const*>(p);
+    case ImGuiDataType_U16:    return *reinterpret_cast<uint16_t const*>(p);
+    case ImGuiDataType_S32:    return *reinterpret_cast<int32_t const*>(p);
+    case ImGuiDataType_U32:    return *reinterpret_cast<uint32_t const*>(p);
+    case ImGuiDataType_S64:    return double(*reinterpret_cast<int64_t const*>(p));
+    default:                   return double(*reinterpret_cast<uint64_t const*>(p));
+  }
+}
+
+namespace {
+
+// N rows of `cols` numbers for the batched ImDrawList primitives: a N x cols buffer, or a flat one of N*cols numbers
+struct BufferRows
+{
+  py::buffer_info info;
+  ImGuiDataType type;
+  ssize_t rows, row_stride, col_stride;
+
+  double value(ssize_t r, ssize_t c) const
+  {
+    return number_at(static_cast<char const*>(info.ptr) + r * row_stride + c * col_stride, type);
+  }
+
+  float at(ssize_t r, ssize_t c) const { return float(value(r, c)); }
+};
+
+static BufferRows request_rows(py::handle obj, ssize_t cols, char const* what)
+{
+  BufferRows rows{py::reinterpret_borrow<py::buffer>(obj).request(), ImGuiDataType_COUNT, 0, 0, 0};
+  rows.type = buffer_data_type(rows.info);
+  if (rows.type == ImGuiDataType_COUNT)
+    throw py::type_error(std::string(what) + ": unsupported buffer format '" + rows.info.format + "'");
+  if (rows.info.ndim == 2 && rows.info.shape[1] == cols) {
+    rows.rows = rows.info.shape[0];
+    rows.row_stride = rows.info.strides[0];
+    rows.col_stride = rows.info.strides[1];
+  } else if (rows.info.ndim == 1 && rows.info.size % cols == 0) {
+    rows.rows = rows.info.size / cols;
+    rows.row_stride = rows.info.strides[0] * cols;
+    rows.col_stride = rows.info.strides[0];
+  } else {
+    throw py::value_error(std::string(what) + " must be a N x " + std::to_string(cols) + " buffer");
+  }
+  if (rows.rows > INT_MAX)
+    throw py::value_error(std::string(what) + ": too many rows");
+  return rows;
+}
+
+// one value per row, from a 1-d buffer of N numbers or a single number used for every row
+struct BufferColumn
+{
+  py::buffer_info info;
+  ImGuiDataType type = ImGuiDataType_COUNT;
+  double value = 0;
+
+  double at(ssize_t i) const
+  {
+    return type == ImGuiDataType_COUNT ? value : number_at(static_cast<char const*>(info.ptr) + i * info.strides[0], type);
+  }
+};
+
+static BufferColumn request_column(py::handle obj, ssize_t rows, char const* what)
+{
+  BufferColumn column;
+  if (!PyObject_CheckBuffer(obj.ptr())) {
+    column.value = py::cast<double>(obj);
+    return column;
+  }
+  column.info = py::reinterpret_borrow<py::buffer>(obj).request();
+  column.type = buffer_data_type(column.info);
+  if (column.type == ImGuiDataType_COUNT)
+    throw py::type_error(std::string(what) + ": unsupported buffer format '" + column.info.format + "'");
+  if (column.info.ndim != 1 || column.info.size != rows)
+    throw py::value_error(std::string(what) + " must be a number or a 1-d buffer with one entry per row");
+  return column;
+}
+
+} // namespace
+
+// ImGuiID of a StateStore key: an int, or a str hashed like a widget label on the current ID stack
+static ImGuiID state_key(py::handle key)
+{
+  if (PyLong_Check(key.ptr()))
+    return key.cast<ImGuiID>();
+  return ImGui::GetID(key.cast<std::string>().c_str());
+}
+
+// sample i of a float64 (or negatively strided float32) buffer, the values_getter of PlotLines/PlotHistogram
+template <class T>
+static float plot_value(void* data, int i)
+{
+  auto& info = *static_cast<py::buffer_info*>(data);
+  return float(*reinterpret_cast<T const*>(static_cast<char const*>(info.ptr) + i * info.strides[0]));
+}
+
+// draws the samples of a 1-d float32/float64 buffer in place with ImGui::PlotLines or ImGui::PlotHistogram
+template <class Plot, class PlotGetter>
+static void plot_buffer(Plot plot, PlotGetter plot_getter, char const* label, py::buffer& values, int offset,
+                        char const* overlay, float scale_min, float scale_max, ImVec2 size)
+{
+  py::buffer_info info = values.request();
+  ImGuiDataType type = buffer_data_type(info);
+  if (type != ImGuiDataType_Float && type != ImGuiDataType_Double)
+    throw py::type_error("values must be a buffer of float32 or float64");
+  if (info.ndim != 1)
+    throw py::value_error("values must be a 1-d buffer");
+  if (info.size > INT_MAX)
+    throw py::value_error("too many values");
+  int count = int(info.size);
+  if (type == ImGuiDataType_Float && info.strides[0] >= 0 && info.strides[0] <= INT_MAX)
+    plot(label, static_cast<float const*>(info.ptr), count, offset, overlay, scale_min, scale_max, size, int(info.strides[0]));
+  else if (type == ImGuiDataType_Float)
+    plot_getter(label, &plot_value<float>, &info, count, offset, overlay, scale_min, scale_max, size);
+  else
+    plot_getter(label, &plot_value<double>, &info, count, offset, overlay, scale_min, scale_max, size);
+}
+
+// draws lines [0, count) with TextUnformatted, only visiting the unclipped ones
+template <class GetLine>
+static void clipped_text_lines(ssize_t count, py::object const& colors, GetLine&& get_line)
+{
+  if (count > INT_MAX)
+    throw py::value_error("too many lines, ImGuiListClipper counts them in an int");
+  py::buffer_info colinfo;
+  ImGuiDataType coltype = ImGuiDataType_COUNT;
+  if (!colors.is_none()) {
+    colinfo = request_int_buffer(colors, coltype, "colors");
+    if (colinfo.size != count)
+      throw py::value_error("colors must have one entry per line");
+  }
+  ImGuiListClipper clipper;
+  clipper.Begin(int(count));
+  while (clipper.Step()) {
+    for (int i = clipper.DisplayStart; i < clipper.DisplayEnd; ++i) {
+      std::string_view line = get_line(i);
+      if (coltype != ImGuiDataType_COUNT)
+        ImGui::PushStyleColor(ImGuiCol_Text, ImU32(int_buffer_at(colinfo, coltype, i)));
+      ImGui::TextUnformatted(line.data(), line.data() + line.size());
+      if (coltype != ImGuiDataType_COUNT)
+        ImGui::PopStyleColor();
+    }
+  }
+  clipper.End();
+}
+
+namespace {
+
+// column of TableColumns: a 1-d numeric buffer drawn with a printf format, or a sequence of str
+struct TableColumn
+{
+  py::buffer_info info;
+  ImGuiDataType type = ImGuiDataType_COUNT; // ImGuiDataType_COUNT for str columns
+  std::string format;
+  std::vector<py::object> items; // str columns: the items, kept alive for `strings`
+  std::vector<std::string_view> strings; // UTF-8 of `items`
+
+  bool is_signed() const
+  {
+    return type == ImGuiDataType_S8 || type == ImGuiDataType_S16 || type == ImGuiDataType_S32 || type == ImGuiDataType_S64;
+  }
+
+  // text of cell `row`, formatted in `buf` for numeric columns
+  std::string_view text(int row, char (&buf)[128]) const
+  {
+    int size;
+    if (type == ImGuiDataType_Float || type == ImGuiDataType_Double)
+      size = snprintf(buf, sizeof(buf), format.c_str(), number_at(static_cast<char const*>(info.ptr) + row * info.strides[0], type));
+    else if (type == ImGuiDataType_COUNT)
+      return strings[row];
+    else if (is_signed())
+      size = snprintf(buf, sizeof(buf), format.c_str(), (long long)int64_t(int_buffer_at(info, type, row)));
+    else
+      size = snprintf(buf, sizeof(buf), format.c_str(), (unsigned long long)int_buffer_at(info, type, row));
+    return std::string_view(buf, size_t(std::clamp(size, 0, int(sizeof(buf)) - 1)));
+  }
+
+  // <0, 0, >0 as row a sorts before, with or after row b; NaNs sort last
+  int compare(int a, int b) const
+  {
+    if (type == ImGuiDataType_COUNT)
+      return strings[a].compare(strings[b]);
+    if (type == ImGuiDataType_Float || type == ImGuiDataType_Double) {
+      double x = number_at(static_cast<char const*>(info.ptr) + a * info.strides[0], type);
+      double y = number_at(static_cast<char const*>(info.ptr) + b * info.strides[0], type);
+      if (std::isnan(x) || std::isnan(y))
+        return int(std::isnan(x)) - int(std::isnan(y));
+      return (x > y) - (x < y);
+    }
+    uint64_t x = int_buffer_at(info, type, a), y = int_buffer_at(info, type, b);
+    if (is_signed())
+      return (int64_t(x) > int64_t(y)) - (int64_t(x) < int64_t(y));
+    return (x > y) - (x < y);
+  }
+};
+
+// `format` checked to hold one conversion of a double (float columns) or of a long long
+// (integer columns, its length modifier is replaced by ll), so that it is safe to pass to snprintf
+static std::string column_format(std::string const& format, ImGuiDataType type)
+{
+  bool integer = type != ImGuiDataType_Float && type != ImGuiDataType_Double;
+  std::string checked;
+  int conversions = 0;
+  for (size_t i = 0; i < format.size();) {
+    if (format[i] != '%' || (i+1 < format.size() && format[i+1] == '%')) {
+      size_t n = format[i] == '%' ? 2 : 1;
+      checked += format.substr(i, n);
+      i += n;
+      continue;
+    }
+    size_t spec = i + 1;
+    while (spec < format.size() && std::strchr("-+ #0123456789.", format[spec]) && format[spec])
+      ++spec;
+    size_t conv = spec;
+    while (conv < format.size() && std::strchr("hlLjzt", format[conv]) && format[conv])
+      ++conv;
+    char c = conv < format.size() ? format[conv] : 0;
+    if (!c || !std::strchr(integer ? "diouxX" : "eEfFgGaA", c))
+      throw py::value_error("format '" + format + "' has no conversion for " + (integer ? "an integer" : "a float") + " column");
+    checked += format.substr(i, spec - i) + (integer ? "ll" : "") + c;
+    ++conversions;
+    i = conv + 1;
+  }
+  if (conversions != 1)
+    throw py::value_error("format '" + format + "' must have exactly one conversion");
+  return checked;
+}
+
+} // namespace
+'''
+
+# file scope types of the manual implementations below
+manual_impl_types = f'''
+// kind of value of each ImGuiStyleVar: 'f' float, 'v' ImVec2, ' ' unknown
+static char const style_var_kinds[] = "{style_var_kinds}";
+''' + r'''
+// text edited in place by InputText/InputTextMultiline, grown through ImGuiInputTextFlags_CallbackResize
+struct TextBuffer
+{
+  std::string text;
+  uint64_t    version = 0; // bumped on every modification
+};
+
+// ImGuiCol/ImGuiStyleVar overrides pushed and popped together by PushStylePreset/PopStylePreset
+struct StylePreset
+{
+  struct Var { ImGuiStyleVar idx; ImVec2 val; bool is_vec2; };
+  std::vector<std::pair<ImGuiCol, ImVec4>> colors;
+  std::vector<Var> vars;
+  std::vector<std::pair<int, int>> pushed; // colors and vars of each push not popped yet
+
+  void set_color(ImGuiCol idx, ImVec4 const& col)
+  {
+    if (idx < 0 || idx >= ImGuiCol_COUNT)
+      throw py::index_error("color index out of range");
+    for (auto& c : colors)
+      if (c.first == idx) {
+        c.second = col;
+        return;
+      }
+    colors.emplace_back(idx, col);
+  }
+  void set_var(ImGuiStyleVar idx, ImVec2 const& val, bool is_vec2)
+  {
+    if (idx < 0 || idx >= ImGuiStyleVar_COUNT)
+      throw py::index_error("style var index out of range");
+    // PushStyleVar() asserts on the wrong kind of value, check it before it is pushed
+    char kind = idx < int(sizeof(style_var_kinds)) - 1 ? style_var_kinds[idx] : ' ';
+    if (kind == (is_vec2 ? 'f' : 'v'))
+      throw py::type_error(std::string("style var ") + std::to_string(idx) + (is_vec2 ? " takes a float, not an ImVec2" : " takes an ImVec2, not a float"));
+    for (auto& v : vars)
+      if (v.idx == idx) {
+        v = {idx, val, is_vec2};
+        return;
+      }
+    vars.push_back({idx, val, is_vec2});
+  }
+};
+
+static void push_style_preset(StylePreset& preset)
+{
+  for (auto const& c : preset.colors)
+    ImGui::PushStyleColor(c.first, c.second);
+  for (auto const& v : preset.vars) {
+    if (v.is_vec2)
+      ImGui::PushStyleVar(v.idx, v.val);
+    else
+      ImGui::PushStyleVar(v.idx, v.val.x);
+  }
+  preset.pushed.emplace_back(int(preset.colors.size()), int(preset.vars.size()));
+}
+
+// pops what the matching push pushed, even if the preset was changed in between
+static void pop_style_preset(StylePreset& preset)
+{
+  if (preset.pushed.empty())
+    throw std::runtime_error("PopStylePreset() without a matching PushStylePreset()");
+  ImGui::PopStyleColor(preset.pushed.back().first);
+  ImGui::PopStyleVar(preset.pushed.back().second);
+  preset.pushed.pop_back();
+}
+
+// decides once per frame, after NewFrame(), whether the UI must be submitted again from Python
+// or the previous submission (e.g. a recorded CommandBuffer) can be replayed as is
+struct FrameWatch
+{
+  int         settle_frames;  // frames still rebuilt after a change, for UI state updated by that change
+  int         settle = 0;
+  int         frame = -1;     // frame of the last decision
+  bool        changed = true;
+  bool        invalid = true;
+  char const* reason = "";
+  std::vector<uint64_t> versions;
+  ImVec2      mouse_pos, display_size, framebuffer_scale;
+  bool        app_focus_lost = false;
+  int         render_metrics[3] = {-1, -1, -1};
+  uint64_t    rebuilt = 0, skipped = 0;
+
+  explicit FrameWatch(int settle_frames) : settle_frames(settle_frames) {}
+
+  // what changed since the previous decision, nullptr if nothing
+  char const* change(py::handle new_versions)
+  {
+    ImGuiIO const& io = ImGui::GetIO();
+    char const* what = nullptr;
+    if (invalid)
+      what = "invalidated";
+    else if (io.MousePos.x != mouse_pos.x || io.MousePos.y != mouse_pos.y || io.MouseWheel != 0.0f || io.MouseWheelH != 0.0f || io.InputQueueCharacters.Size > 0)
+      what = "input";
+    else if (io.AppFocusLost != app_focus_lost)
+      what = "focus";
+    else if (io.DisplaySize.x != display_size.x || io.DisplaySize.y != display_size.y ||
+             io.DisplayFramebufferScale.x != framebuffer_scale.x || io.DisplayFramebufferScale.y != framebuffer_scale.y)
+      what = "display";
+    else {
+      // a key or button down, or released in this frame (mouse buttons are keys as well)
+      for (int key = ImGuiKey_NamedKey_BEGIN; key < ImGuiKey_NamedKey_END && !what; ++key) {
+        ImGuiKeyData const& data = io.KeysData[key - ImGuiKey_KeysData_OFFSET];
+        if (data.Down || data.DownDurationPrev >= 0.0f)
+          what = "input";
+      }
+    }
+    // windows only move or resize through input, the display or the UI code itself, while layout
+    // settling (auto-fit, appearing windows...) shows as different render counts between frames
+    int metrics[3] = {io.MetricsRenderVertices, io.MetricsRenderIndices, io.MetricsRenderWindows};
+    if (!what && !std::equal(metrics, metrics + 3, render_metrics))
+      what = "layout";
+    std::copy(metrics, metrics + 3, render_metrics);
+
+    size_t n = 0;
+    bool new_version = false;
+    auto watch = [&](py::handle v) {
+      uint64_t version = PyLong_AsUnsignedLongLongMask(v.ptr());
+      if (version == uint64_t(-1) && PyErr_Occurred())
+        throw py::error_already_set();
+      if (n == versions.size())
+        versions.push_back(~version);
+      new_version |= versions[n] != version;
+      versions[n++] = version;
+    };
+    if (PyLong_Check(new_versions.ptr()))
+      watch(new_versions);
+    else if (!new_versions.is_none())
+      for (py::handle v : py::iter(new_versions))
+        watch(v);
+    new_version |= n != versions.size();
+    versions.resize(n);
+    if (!what && new_version)
+      what = "version";
+
+    mouse_pos = io.MousePos;
+    app_focus_lost = io.AppFocusLost;
+    display_size = io.DisplaySize;
+    framebuffer_scale = io.DisplayFramebufferScale;
+    invalid = false;
+    return what;
+  }
+};
+
+// key and mouse state of one frame, filled in place by GetInputSnapshot(). Key arrays are
+// indexed by ImGuiKey, only the named keys (ImGuiKey_NamedKey_BEGIN...) are set
+struct InputSnapshot
+{
+  bool  keys_down[ImGuiKey_NamedKey_END] = {};
+  bool  keys_pressed[ImGuiKey_NamedKey_END] = {};
+  bool  keys_released[ImGuiKey_NamedKey_END] = {};
+  bool  mouse_down[ImGuiMouseButton_COUNT] = {};
+  bool  mouse_clicked[ImGuiMouseButton_COUNT] = {};
+  bool  mouse_released[ImGuiMouseButton_COUNT] = {};
+  bool  mouse_double_clicked[ImGuiMouseButton_COUNT] = {};
+  float drag_delta[ImGuiMouseButton_COUNT][2] = {};
+  float mouse_pos[2] = {};
+  float mouse_delta[2] = {};
+  float mouse_wheel[2] = {}; // vertical, horizontal
+  int   key_mods = 0;
+  int   frame = -1;
+};
+
+// the whole input state is read in one pass so Python pays a single call per frame
+static void take_input_snapshot(InputSnapshot& s)
+{
+  ImGuiIO const& io = ImGui::GetIO();
+  for (int key = ImGuiKey_NamedKey_BEGIN; key < ImGuiKey_NamedKey_END; ++key) {
+    // the key data rules out most keys, only those which may have changed go through the full checks
+    ImGuiKeyData const& data = io.KeysData[key - ImGuiKey_KeysData_OFFSET];
+    s.keys_down[key] = data.Down && ImGui::IsKeyDown(ImGuiKey(key));
+    s.keys_pressed[key] = data.Down && ImGui::IsKeyPressed(ImGuiKey(key));
+    s.keys_released[key] = !data.Down && data.DownDurationPrev >= 0.0f && ImGui::IsKeyReleased(ImGuiKey(key));
+  }
+  for (int b = 0; b < ImGuiMouseButton_COUNT; ++b) {
+    s.mouse_down[b] = ImGui::IsMouseDown(b);
+    s.mouse_clicked[b] = ImGui::IsMouseClicked(b);
+    s.mouse_released[b] = ImGui::IsMouseReleased(b);
+    s.mouse_double_clicked[b] = ImGui::IsMouseDoubleClicked(b);
+    ImVec2 drag = ImGui::GetMouseDragDelta(b);
+    s.drag_delta[b][0] = drag.x;
+    s.drag_delta[b][1] = drag.y;
+  }
+  s.mouse_pos[0] = io.MousePos.x;
+  s.mouse_pos[1] = io.MousePos.y;
+  s.mouse_delta[0] = io.MouseDelta.x;
+  s.mouse_delta[1] = io.MouseDelta.y;
+  s.mouse_wheel[0] = io.MouseWheel;
+  s.mouse_wheel[1] = io.MouseWheelH;
+  s.key_mods = io.KeyMods;
+  s.frame = ImGui::GetFrameCount();
+}
+
+namespace {
+
+// generator or coroutine advanced by a Scheduler, one step (up to its next yield/await) at a time
+struct SchedulerTask
+{
+  py::object  task;
+  std::string name;
+  bool        done = false, cancelled = false;
+  bool        running = false;  // in step(), where it cannot be closed
+  py::object  result;           // value of the return statement once done
+  uint64_t    steps = 0, overruns = 0;
+  double      time_us = 0.0, last_run_us = 0.0, last_step_us = 0.0, max_step_us = 0.0;
+
+  // runs one step, returns false once the task has finished
+  bool step()
+  {
+    running = true;
+    py::object yielded;
+#if PY_VERSION_HEX >= 0x030A0000
+    PyObject* value = nullptr;
+    PySendResult r = PyIter_Send(task.ptr(), Py_None, &value);
+    running = false;
+    if (r == PYGEN_ERROR)
+      throw py::error_already_set();
+    if (r == PYGEN_RETURN) {
+      result = py::reinterpret_steal<py::object>(value);
+      return false;
+    }
+    yielded = py::reinterpret_steal<py::object>(value);
+#else
+    try {
+      yielded = task.attr("send")(py::none());
+      running = false;
+    } catch (py::error_already_set& e) {
+      running = false;
+      if (!e.matches(PyExc_StopIteration))
+        throw;
+      result = e.value().attr("value");
+      return false;
+    }
+#endif
+    // a coroutine awaiting an asyncio future would never be woken up
+    if (PyCoro_CheckExact(task.ptr()) && !yielded.is_none()) {
+      task.attr("close")();
+      throw std::runtime_error("task " + name + " awaited " + std::string(py::str(py::type::of(yielded).attr("__name__"))) +
+                               ": Scheduler coroutines can only await asyncio.sleep(0), they are not run by an event loop");
+    }
+    return true;
+  }
+
+  void cancel()
+  {
+    if (done || cancelled)
+      return;
+    cancelled = true;
+    if (!running) // a running task is closed by Run() once its step returns
+      task.attr("close")();
+  }
+};
+
+using SchedulerClock = std::chrono::steady_clock;
+
+inline double elapsed_us(SchedulerClock::time_point since)
+{
+  return std::chrono::duration<double, std::micro>(SchedulerClock::now() - since).count();
+}
+
+// round-robin over its tasks for a time budget per Run(), resuming where the previous Run() stopped.
+// The duration of the previous step of a task is taken as the estimate of its next one
+struct Scheduler
+{
+  std::vector<std::shared_ptr<SchedulerTask>> tasks;
+  size_t   next = 0;
+  double   budget_us;
+  uint64_t runs = 0, overruns = 0;
+  double   overrun_us = 0.0, last_run_us = 0.0;
+  bool     running = false;
+
+  explicit Scheduler(double budget_us) : budget_us(budget_us) {}
+
+  void run(double budget)
+  {
+    if (running)
+      throw std::runtime_error("Scheduler.Run() called from one of its own tasks");
+    running = true;
+    struct Done { bool& running; ~Done() { running = false; } } done{running};
+    for (auto& t : tasks)
+      t->last_run_us = 0.0;
+    auto start = SchedulerClock::now();
+    double elapsed = 0.0;
+    while (!tasks.empty() && elapsed < budget) {
+      next %= tasks.size();
+      auto t = tasks[next];
+      if (t->cancelled) {
+        t->done = true;
+        tasks.erase(tasks.begin() + next);
+        continue;
+      }
+      // a step expected to run past the budget waits for the next Run(), where it goes first
+      if (elapsed > 0.0 && t->last_step_us > budget - elapsed)
+        break;
+      auto step_start = SchedulerClock::now();
+      bool more;
+      try {
+        more = t->step();
+      } catch (...) {
+        t->done = true;
+        tasks.erase(tasks.begin() + next);
+        throw;
+      }
+      double step_us = elapsed_us(step_start);
+      elapsed = elapsed_us(start);
+      ++t->steps;
+      t->time_us += step_us;
+      t->last_run_us += step_us;
+      t->last_step_us = step_us;
+      t->max_step_us = std::max(t->max_step_us, step_us);
+      if (elapsed > budget && step_us > 0.0)
+        ++t->overruns; // this step ran past the end of the budget
+      if (more && t->cancelled) {
+        t->task.attr("close")(); // cancelled by itself during the step
+        more = false;
+      }
+      if (more)
+        ++next;
+      else {
+        t->done = true;
+        tasks.erase(tasks.begin() + next);
+      }
+    }
+    ++runs;
+    last_run_us = elapsed;
+    if (elapsed > budget) {
+      ++overruns;
+      overrun_us += elapsed - budget;
+    }
+  }
+};
+
+} // namespace
+'''
+
+# --instrument: every m.def goes through BindingModule, which wraps the bound callable
+# with a per-name counter and timer. Stats are kept per frame in a ring of the last
+# BINDING_STATS_FRAMES frames, a slot is cleared when a new frame reuses it
+instrument_impl_helpers = r'''
+#include <chrono>
+
+#ifndef BINDING_STATS_FRAMES
+#define BINDING_STATS_FRAMES 120
+#endif
+
+// inline rather than in the anonymous namespace, so that --shards files share them
+struct BindingStat
+{
+  uint64_t calls = 0;
+  uint64_t ns = 0;
+};
+
+inline std::vector<char const*> binding_names; // indexed by binding id, overloads share an id
+inline std::vector<BindingStat> binding_stats[BINDING_STATS_FRAMES];
+inline int binding_stats_frame[BINDING_STATS_FRAMES]; // frame each slot holds
+inline bool binding_timing = false;
+
+inline int current_frame()
+{
+  return ImGui::GetCurrentContext() ? ImGui::GetFrameCount() : 0;
+}
+
+inline BindingStat& binding_stat(int id)
+{
+  int frame = current_frame();
+  int slot = frame % BINDING_STATS_FRAMES;
+  auto& stats = binding_stats[slot];
+  if (binding_stats_frame[slot] != frame) {
+    stats.assign(binding_names.size(), BindingStat{});
+    binding_stats_frame[slot] = frame;
+  } else if (stats.size() < binding_names.size()) {
+    stats.resize(binding_names.size()); // bound since the frame started, e.g. by --lazy
+  }
+  return stats[id];
+}
+
+namespace {
+
+// counts the call on construction, adds the elapsed time on destruction if timing is on
+struct BindingScope
+{
+  int id;
+  std::chrono::steady_clock::time_point start;
+
+  explicit BindingScope(int id) : id(id)
+  {
+    ++binding_stat(id).calls;
+    if (binding_timing)
+      start = std::chrono::steady_clock::now();
+  }
+  ~BindingScope()
+  {
+    if (binding_timing)
+      binding_stat(id).ns += std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now() - start).count();
+  }
+};
+
+template <class R, class... A>
+auto instrument(int id, R (*f)(A...))
+{
+  return [id, f](A... a) -> R { BindingScope scope(id); return f(std::forward<A>(a)...); };
+}
+
+template <class F, class R, class... A>
+auto instrument_callable(int id, F f, R (F::*)(A...) const)
+{
+  return [id, f](A... a) -> R { BindingScope scope(id); return f(std::forward<A>(a)...); };
+}
+
+template <class F>
+auto instrument(int id, F f)
+{
+  return instrument_callable(id, f, &F::operator());
+}
+
+// stands in for the module in m.def, registering a binding id per function name
+struct BindingModule
+{
+  py::module& m;
+
+  int id(char const* name)
+  {
+    int id = 0;
+    while (id < int(binding_names.size()) && std::strcmp(binding_names[id], name) != 0)
+      ++id;
+    if (id == int(binding_names.size()))
+      binding_names.push_back(name);
+    return id;
+  }
+
+  template <class F, class... Extra>
+  void def(char const* name, F&& f, Extra const&... extra)
+  {
+    m.def(name, instrument(id(name), std::forward<F>(f)), extra...);
+  }
+};
+
+} // namespace
+'''
+
+instrument_impl_pre = r'''
+  BindingModule im{m};
+
+'''
+
+instrument_impl_post = r'''
+  m.def("GetBindingStats", [](int frames) {
+    if (frames < 1 || frames > BINDING_STATS_FRAMES)
+      throw py::value_error("frames not in range [1,BINDING_STATS_FRAMES]");
+    int frame = current_frame();
+    std::vector<BindingStat> total(binding_names.size());
+    for (int slot = 0; slot < BINDING_STATS_FRAMES; ++slot) {
+      if (frame - binding_stats_frame[slot] >= frames)
+        continue;
+      for (size_t i = 0; i < binding_stats[slot].size(); ++i) {
+        total[i].calls += binding_stats[slot][i].calls;
+        total[i].ns += binding_stats[slot][i].ns;
+      }
+    }
+    py::dict stats;
+    for (size_t i = 0; i < total.size(); ++i)
+      if (total[i].calls)
+        stats[binding_names[i]] = py::make_tuple(total[i].calls, total[i].ns);
+    return stats;
+  }, py::arg("frames") = BINDING_STATS_FRAMES, "{name: (calls, ns)} of every binding called in the last `frames` frames, the current one included. ns stays 0 unless SetBindingTiming(True)");
+  m.def("ResetBindingStats", []{
+    for (auto& stats : binding_stats)
+      stats.clear();
+  }, "forget the counts and times of every frame");
+  m.def("SetBindingTiming", [](bool enabled) { binding_timing = enabled; }, py::arg("enabled"), "also measure the time spent in each binding, off by default");
+  m.attr("BINDING_STATS_FRAMES") = BINDING_STATS_FRAMES;
+'''
+
+# --fastcall: functions taking and returning only bools, integers, floats and strings are
+# bound as plain METH_FASTCALL functions, parsing their arguments without pybind11
+fastcall_impl_helpers = r'''
+#include <limits>
+#include <type_traits>
+
+// sorts the positional and keyword arguments of a METH_FASTCALL | METH_KEYWORDS call into `out`,
+// a borrowed reference per parameter or nullptr for the omitted ones, which must have defaults
+inline bool fast_parse(char const* func, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames,
+                       char const* const* names, int count, int required, PyObject** out)
+{
+  if (nargs > count) {
+    PyErr_Format(PyExc_TypeError, "%s() takes at most %d arguments (%zd given)", func, count, nargs);
+    return false;
+  }
+  for (int i = 0; i < count; ++i)
+    out[i] = i < nargs ? args[i] : nullptr;
+  Py_ssize_t nkw = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+  for (Py_ssize_t k = 0; k < nkw; ++k) {
+    char const* kw = PyUnicode_AsUTF8(PyTuple_GET_ITEM(kwnames, k));
+    if (!kw)
+      return false;
+    int i = 0;
+    while (i < count && std::strcmp(names[i], kw) != 0)
+      ++i;
+    if (i == count) {
+      PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%s'", func, kw);
+      return false;
+    }
+    if (out[i]) {
+      PyErr_Format(PyExc_TypeError, "%s() got multiple values for argument '%s'", func, kw);
+      return false;
+    }
+    out[i] = args[nargs + k];
+  }
+  for (int i = 0; i < required; ++i) {
+    if (!out[i]) {
+      PyErr_Format(PyExc_TypeError, "%s() missing required argument '%s'", func, names[i]);
+      return false;
+    }
+  }
+  return true;
+}
+
+// argument conversions, accepting what the pybind11 casters accept (fastcall functions are not
+// overloaded, so pybind11 would convert as well)
+inline bool fast_arg(PyObject* o, bool& out)
+{
+  if (o == Py_True || o == Py_False || o == Py_None) {
+    out = o == Py_True;
+    return true;
+  }
+  // like pybind11: only types implementing __bool__ (numpy.bool_...), not any object
+  PyNumberMethods* number = Py_TYPE(o)->tp_as_number;
+  if (number && number->nb_bool) {
+    int truth = number->nb_bool(o);
+    if (truth >= 0) {
+      out = truth > 0;
+      return true;
+    }
+    PyErr_Clear();
+  }
+  PyErr_Format(PyExc_TypeError, "expected bool, got %s", Py_TYPE(o)->tp_name);
+  return false;
+}
+
+template <class T>
+inline std::enable_if_t<std::is_integral_v<T>, bool> fast_arg(PyObject* o, T& out)
+{
+  if (PyFloat_Check(o)) {
+    PyErr_SetString(PyExc_TypeError, "expected an integer, got float");
+    return false;
+  }
+  long long v = PyLong_AsLongLong(o);
+  if (v == -1 && PyErr_Occurred())
+    return false;
+  if (v < (long long)std::numeric_limits<T>::min() || v > (long long)std::numeric_limits<T>::max()) {
+    PyErr_SetString(PyExc_OverflowError, "integer out of range");
+    return false;
+  }
+  out = T(v);
+  return true;
+}
+
+template <class T>
+inline std::enable_if_t<std::is_floating_point_v<T>, bool> fast_arg(PyObject* o, T& out)
+{
+  double v = PyFloat_AsDouble(o);
+  if (v == -1.0 && PyErr_Occurred())
+    return false;
+  out = T(v);
+  return true;
+}
+
+inline bool fast_arg(PyObject* o, char const*& out)
+{
+  if (o == Py_None)
+    out = nullptr;
+  else if (PyBytes_Check(o))
+    out = PyBytes_AS_STRING(o);
+  else if (!(out = PyUnicode_AsUTF8(o)))
+    return false;
+  return true;
+}
+
+inline PyObject* fast_result(bool v) { return PyBool_FromLong(v); }
+inline PyObject* fast_result(float v) { return PyFloat_FromDouble(v); }
+inline PyObject* fast_result(double v) { return PyFloat_FromDouble(v); }
+inline PyObject* fast_result(int v) { return PyLong_FromLong(v); }
+inline PyObject* fast_result(unsigned int v) { return PyLong_FromUnsignedLong(v); }
+inline PyObject* fast_result(char const* v)
+{
+  if (!v)
+    Py_RETURN_NONE;
+  return PyUnicode_FromString(v);
+}
+
+// runs `call` translating C++ exceptions (e.g. from a throwing IM_ASSERT) like pybind11 does
+template <class F>
+inline PyObject* fast_call(F&& call)
+{
+  try {
+    if constexpr (std::is_void_v<decltype(call())>) {
+      call();
+      Py_RETURN_NONE;
+    } else {
+      return fast_result(call());
+    }
+  } catch (py::error_already_set& e) {
+    e.restore();
+  } catch (std::exception& e) {
+    PyErr_SetString(PyExc_RuntimeError, e.what());
+  }
+  return nullptr;
+}
+
+inline void add_fast_function(py::module& m, PyMethodDef& def)
+{
+  py::object name = m.attr("__name__");
+  PyObject* func = PyCFunction_NewEx(&def, nullptr, name.ptr());
+  if (!func)
+    throw py::error_already_set();
+  m.attr(def.ml_name) = py::reinterpret_steal<py::object>(func);
+}
+'''
+
+# --lazy: attributes bound on first access. Inline so that every --shards file shares the table
+lazy_impl_helpers = r'''
+#include <algorithm>
+
+// module attributes not bound yet, and the function binding each
+inline std::vector<std::pair<char const*, void (*)(py::module&)>> lazy_attrs;
+
+inline void lazy_attr(char const* name, void (*bind)(py::module&))
+{
+  lazy_attrs.emplace_back(name, bind);
+}
+'''
+
+lazy_impl_post = r'''
+  m.def("__getattr__", [m](std::string const& name) mutable -> py::object {
+    for (auto& [attr, bind] : lazy_attrs) {
+      if (name == attr) {
+        // forget every attribute `bind` defines before running it, it only runs once
+        auto run = bind;
+        lazy_attrs.erase(std::remove_if(lazy_attrs.begin(), lazy_attrs.end(),
+                                        [run](auto const& a) { return a.second == run; }),
+                         lazy_attrs.end());
+        run(m);
+        return m.attr(name.c_str());
+      }
+    }
+    throw py::attribute_error("module '" + py::str(m.attr("__name__")).cast<std::string>() + "' has no attribute '" + name + "'");
+  }, py::arg("name"));
+  m.def("__dir__", [m]() {
+    py::list names = m.attr("__dict__").attr("keys")();
+    for (auto& [attr, bind] : lazy_attrs)
+      names.append(attr);
+    return names;
+  });
+
+  // for `from module import *`, which only sees __dict__ otherwise
+  py::list all;
+  for (auto name : m.attr("__dict__").attr("keys")())
+    if (name.cast<std::string>()[0] != '_')
+      all.append(name);
+  for (auto& [attr, bind] : lazy_attrs)
+    all.append(attr);
+  m.attr("__all__") = all;
+'''
+
+# --labels: str arguments are read in place (python keeps the UTF-8 of a str), Label arguments
+# also spare the hashing of PushID/GetID while the ID stack they are pushed on is the same
+labels_impl_helpers = r'''
+// from imgui_internal.h, which is not included: its overloads of public functions would make &ImGui::X ambiguous
+namespace ImGui { IMGUI_API void PushOverrideID(ImGuiID id); }
+
+// top of the ID stack of the current window, defined with imgui_internal.h in the _labels.cpp file
+ImGuiID imgui_id_stack_top();
+
+// text of a widget label or ID encoded once, with the ID it last hashed to
+struct Label
+{
+  std::string text;
+  bool hashed = false;
+  ImGuiID seed = 0, id = 0; // `id` of `text` on an ID stack topped by `seed`
+
+  ImGuiID GetID()
+  {
+    ImGuiID top = imgui_id_stack_top();
+    if (!hashed || top != seed) {
+      seed = top;
+      id = ImGui::GetID(text.c_str());
+      hashed = true;
+    }
+    return id;
+  }
+};
+
+// a str, bytes or Label argument, converted to char const* without copy
+struct LabelArg
+{
+  char const* text = nullptr;
+  Label* label = nullptr; // set when passed a Label
+
+  operator char const*() const { return text; }
+};
+
+inline PyTypeObject* label_type = nullptr; // the bound Label class
+
+namespace pybind11 { namespace detail {
+
+template <>
+struct type_caster<LabelArg>
+{
+  PYBIND11_TYPE_CASTER(LabelArg, const_name("str | Label"));
+
+  bool load(handle src, bool convert)
+  {
+    value = LabelArg{};
+    if (PyUnicode_Check(src.ptr())) {
+      value.text = PyUnicode_AsUTF8(src.ptr());
+      if (!value.text)
+        PyErr_Clear();
+      return value.text != nullptr;
+    }
+    if (label_type && PyObject_TypeCheck(src.ptr(), label_type)) {
+      auto inst = reinterpret_cast<instance*>(src.ptr());
+      value.label = static_cast<Label*>(inst->simple_layout ? inst->simple_value_holder[0] : values_and_holders(inst).begin()->value_ptr());
+      value.text = value.label->text.c_str();
+      return true;
+    }
+    if (PyBytes_Check(src.ptr())) {
+      value.text = PyBytes_AS_STRING(src.ptr());
+      return true;
+    }
+    return convert && src.is_none(); // for NULL defaults
+  }
+
+  static handle cast(LabelArg const& src, return_value_policy, handle)
+  {
+    if (!src.text)
+      return none().release();
+    return PyUnicode_FromString(src.text);
+  }
+};
+
+}} // namespace pybind11::detail
+'''
+
+# separate file of --labels, the only one including imgui_internal.h
+labels_impl_internal = r'''
+#include <imgui.h>
+#include <imgui_internal.h>
+
+ImGuiID imgui_id_stack_top()
+{
+  return GImGui->CurrentWindow->IDStack.back();
+}
+'''
+
+labels_impl_pre = r'''
+  label_type = reinterpret_cast<PyTypeObject*>(py::class_<Label>(m, "Label", "Label or ID string of a widget, to pass instead of a str: it is encoded to UTF-8 once, and PushID/GetID/BeginChild/OpenPopup "
+                                                                            "reuse the ID it hashed to while the ID stack is the same")
+    .def(py::init([](std::string text) { return Label{std::move(text)}; }), py::arg("text"))
+    .def_property_readonly("Text", [](Label const& label) { return py::str(label.text.data(), label.text.size()); })
+    .def("__str__", [](Label const& label) { return py::str(label.text.data(), label.text.size()); })
+    .def("__repr__", [](Label const& label) { return "Label(" + py::repr(py::str(label.text.data(), label.text.size())).cast<std::string>() + ")"; })
+    .ptr());
+
+'''
+
+labels_impl_id = r'''  m.def("PushID", [](LabelArg str_id) {
+    if (str_id.label)
+      ImGui::PushOverrideID(str_id.label->GetID());
+    else
+      ImGui::PushID(str_id);
+  }, py::arg("str_id"));
+  m.def("PushID", py::overload_cast<int>(&ImGui::PushID), py::arg("int_id"));
+  m.def("GetID", [](LabelArg str_id) {
+    return str_id.label ? str_id.label->GetID() : ImGui::GetID(str_id);
+  }, py::arg("str_id"));
+  m.def("PushOverrideID", &ImGui::PushOverrideID, py::arg("id"), "push an ID computed before, e.g. by GetID(), as is on the ID stack, without hashing it again");
+'''
+
+# ImVec2/ImVec4 constructors, for each --vec mode
+manual_impl_vec = {
+  'class': r'''
   py::class_<ImVec2>(m, "ImVec2")
     .def(py::init<>())
     .def(py::init<float, float>())
@@ -263,7 +1564,28 @@ manual_impl_pre = r'''
     .def_readwrite("y", &ImVec4::y)
     .def_readwrite("z", &ImVec4::z)
     .def_readwrite("w", &ImVec4::w);
+''',
+  'tuple': r'''
+  m.def("ImVec2", [](float x, float y) { return ImVec2(x, y); }, py::arg("x") = 0.f, py::arg("y") = 0.f);
+  m.def("ImVec4", [](float x, float y, float z, float w) { return ImVec4(x, y, z, w); }, py::arg("x") = 0.f, py::arg("y") = 0.f, py::arg("z") = 0.f, py::arg("w") = 0.f);
+''',
+  'structseq': r'''
+  static PyStructSequence_Field vec2_fields[] = {{"x", nullptr}, {"y", nullptr}, {nullptr, nullptr}};
+  static PyStructSequence_Field vec4_fields[] = {{"x", nullptr}, {"y", nullptr}, {"z", nullptr}, {"w", nullptr}, {nullptr, nullptr}};
+  static PyStructSequence_Desc vec2_desc = {"ImVec2", nullptr, vec2_fields, 2};
+  static PyStructSequence_Desc vec4_desc = {"ImVec4", nullptr, vec4_fields, 4};
+  if (!imgui_vec_types[0]) {
+    imgui_vec_types[0] = PyStructSequence_NewType(&vec2_desc);
+    imgui_vec_types[1] = PyStructSequence_NewType(&vec4_desc);
+    if (!imgui_vec_types[0] || !imgui_vec_types[1])
+      throw py::error_already_set();
+  }
+  m.def("ImVec2", [](float x, float y) { return ImVec2(x, y); }, py::arg("x") = 0.f, py::arg("y") = 0.f);
+  m.def("ImVec4", [](float x, float y, float z, float w) { return ImVec4(x, y, z, w); }, py::arg("x") = 0.f, py::arg("y") = 0.f, py::arg("z") = 0.f, py::arg("w") = 0.f);
+''',
+}
 
+manual_impl_pre = r'''
   py::class_<ImGuiListClipper>(m, "ListClipper")
     .def(py::init<>())
     .def_readonly("DisplayStart", &ImGuiListClipper::DisplayStart, "First item to display, updated by each call to Step()")
@@ -279,6 +1601,274 @@ manual_impl_pre = r'''
     .def_readonly("WorkPos", &ImGuiViewport::WorkPos)
     .def_readonly("WorkSize", &ImGuiViewport::WorkSize);
 
+  py::class_<ImDrawList>(m, "DrawList", "Draw list of a window or a viewport, see GetWindowDrawList(). The batched Add* methods take buffers (NumPy arrays...) and draw a whole layer in one call")
+    .def("AddLine", &ImDrawList::AddLine, py::arg("p1"), py::arg("p2"), py::arg("col"), py::arg("thickness") = 1.0f)
+    .def("AddRect", &ImDrawList::AddRect, py::arg("p_min"), py::arg("p_max"), py::arg("col"), py::arg("rounding") = 0.0f, py::arg("flags") = 0, py::arg("thickness") = 1.0f)
+    .def("AddRectFilled", &ImDrawList::AddRectFilled, py::arg("p_min"), py::arg("p_max"), py::arg("col"), py::arg("rounding") = 0.0f, py::arg("flags") = 0)
+    .def("AddCircle", &ImDrawList::AddCircle, py::arg("center"), py::arg("radius"), py::arg("col"), py::arg("num_segments") = 0, py::arg("thickness") = 1.0f)
+    .def("AddCircleFilled", &ImDrawList::AddCircleFilled, py::arg("center"), py::arg("radius"), py::arg("col"), py::arg("num_segments") = 0)
+    .def("AddText", [](ImDrawList& dl, ImVec2 const& pos, ImU32 col, std::string_view text) {
+      dl.AddText(pos, col, text.data(), text.data() + text.size());
+    }, py::arg("pos"), py::arg("col"), py::arg("text"))
+    .def("PushClipRect", &ImDrawList::PushClipRect, py::arg("clip_rect_min"), py::arg("clip_rect_max"), py::arg("intersect_with_current_clip_rect") = false)
+    .def("PopClipRect", &ImDrawList::PopClipRect)
+    .def("AddPolyline", [](ImDrawList& dl, py::buffer points, ImU32 col, ImDrawFlags flags, float thickness) {
+      BufferRows rows = request_rows(points, 2, "points");
+      if (rows.type == ImGuiDataType_Float && rows.row_stride == sizeof(ImVec2) && rows.col_stride == sizeof(float)) {
+        dl.AddPolyline(static_cast<ImVec2 const*>(rows.info.ptr), int(rows.rows), col, flags, thickness);
+        return;
+      }
+      std::vector<ImVec2> copy(size_t(rows.rows));
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        copy[i] = ImVec2(rows.at(i, 0), rows.at(i, 1));
+      dl.AddPolyline(copy.data(), int(rows.rows), col, flags, thickness);
+    }, py::arg("points"), py::arg("col"), py::arg("flags") = 0, py::arg("thickness") = 1.0f,
+    "one polyline through the N x 2 `points`, passed without copy if they are contiguous float32")
+    .def("AddLines", [](ImDrawList& dl, py::buffer segments, py::object colors, float thickness) {
+      BufferRows rows = request_rows(segments, 4, "segments");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddLine(ImVec2(rows.at(i, 0), rows.at(i, 1)), ImVec2(rows.at(i, 2), rows.at(i, 3)), ImU32(cols.at(i)), thickness);
+    }, py::arg("segments"), py::arg("colors"), py::arg("thickness") = 1.0f,
+    "a line per row (x1, y1, x2, y2) of `segments`. colors: a ImU32 for all of them or one per line")
+    .def("AddRects", [](ImDrawList& dl, py::buffer rects, py::object colors, float rounding, float thickness) {
+      BufferRows rows = request_rows(rects, 4, "rects");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddRect(ImVec2(rows.at(i, 0), rows.at(i, 1)), ImVec2(rows.at(i, 2), rows.at(i, 3)), ImU32(cols.at(i)), rounding, 0, thickness);
+    }, py::arg("rects"), py::arg("colors"), py::arg("rounding") = 0.0f, py::arg("thickness") = 1.0f,
+    "a rectangle outline per row (x_min, y_min, x_max, y_max) of `rects`. colors: a ImU32 for all of them or one per rectangle")
+    .def("AddRectsFilled", [](ImDrawList& dl, py::buffer rects, py::object colors, float rounding) {
+      BufferRows rows = request_rows(rects, 4, "rects");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddRectFilled(ImVec2(rows.at(i, 0), rows.at(i, 1)), ImVec2(rows.at(i, 2), rows.at(i, 3)), ImU32(cols.at(i)), rounding);
+    }, py::arg("rects"), py::arg("colors"), py::arg("rounding") = 0.0f,
+    "a filled rectangle per row (x_min, y_min, x_max, y_max) of `rects`. colors: a ImU32 for all of them or one per rectangle")
+    .def("AddCircles", [](ImDrawList& dl, py::buffer centers, py::object radii, py::object colors, int num_segments, float thickness) {
+      BufferRows rows = request_rows(centers, 2, "centers");
+      BufferColumn rads = request_column(radii, rows.rows, "radii");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddCircle(ImVec2(rows.at(i, 0), rows.at(i, 1)), float(rads.at(i)), ImU32(cols.at(i)), num_segments, thickness);
+    }, py::arg("centers"), py::arg("radii"), py::arg("colors"), py::arg("num_segments") = 0, py::arg("thickness") = 1.0f,
+    "a circle per row (x, y) of `centers`. radii, colors: a number for all of them or one per circle")
+    .def("AddCirclesFilled", [](ImDrawList& dl, py::buffer centers, py::object radii, py::object colors, int num_segments) {
+      BufferRows rows = request_rows(centers, 2, "centers");
+      BufferColumn rads = request_column(radii, rows.rows, "radii");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddCircleFilled(ImVec2(rows.at(i, 0), rows.at(i, 1)), float(rads.at(i)), ImU32(cols.at(i)), num_segments);
+    }, py::arg("centers"), py::arg("radii"), py::arg("colors"), py::arg("num_segments") = 0,
+    "a filled circle per row (x, y) of `centers`, e.g. for points. radii, colors: a number for all of them or one per circle");
+
+  py::class_<ImGuiTableSortSpecs>(m, "TableSortSpecs", "Sort specs of the current table, see TableGetSortSpecs(). Only valid until the next BeginTable()")
+    .def_property_readonly("Specs", [](ImGuiTableSortSpecs const& specs) {
+      py::list list;
+      for (int i = 0; i < specs.SpecsCount; ++i) {
+        ImGuiTableColumnSortSpecs const& s = specs.Specs[i];
+        list.append(py::make_tuple(int(s.ColumnIndex), s.ColumnUserID, int(s.SortOrder), int(s.SortDirection)));
+      }
+      return list;
+    }, "(column_index, column_user_id, sort_order, sort_direction) of each sorted column, most significant first")
+    .def_readonly("SpecsCount", &ImGuiTableSortSpecs::SpecsCount)
+    .def_readwrite("SpecsDirty", &ImGuiTableSortSpecs::SpecsDirty, "true when the specs changed since last time: sort again, then set it to False");
+
+  py::class_<ImGuiStorage>(m, "StateStore",
+    "Widget values kept natively (an ImGuiStorage), for the overloads of Checkbox, Selectable, DragFloat, Begin... taking a store instead of a value: "
+    "they read and write the value in place, keyed by their own ID, and only return whether it was modified. Keys are ImGuiIDs (int) or labels (str) hashed on the current ID stack. "
+    "Export() copies its (key, value bits) pairs to a N x 2 uint32 array to save it, Import() restores them")
+    .def(py::init<>())
+    .def("GetBool", [](ImGuiStorage const& st, py::handle key, bool default_val) { return st.GetBool(state_key(key), default_val); }, py::arg("key"), py::arg("default_val") = false)
+    .def("SetBool", [](ImGuiStorage& st, py::handle key, bool val) { st.SetBool(state_key(key), val); }, py::arg("key"), py::arg("val"))
+    .def("GetInt", [](ImGuiStorage const& st, py::handle key, int default_val) { return st.GetInt(state_key(key), default_val); }, py::arg("key"), py::arg("default_val") = 0)
+    .def("SetInt", [](ImGuiStorage& st, py::handle key, int val) { st.SetInt(state_key(key), val); }, py::arg("key"), py::arg("val"))
+    .def("GetFloat", [](ImGuiStorage const& st, py::handle key, float default_val) { return st.GetFloat(state_key(key), default_val); }, py::arg("key"), py::arg("default_val") = 0.0f)
+    .def("SetFloat", [](ImGuiStorage& st, py::handle key, float val) { st.SetFloat(state_key(key), val); }, py::arg("key"), py::arg("val"))
+    .def("Clear", &ImGuiStorage::Clear)
+    .def("Import", [](ImGuiStorage& st, py::buffer pairs) {
+      BufferRows rows = request_rows(pairs, 2, "pairs");
+      if (rows.type == ImGuiDataType_Float || rows.type == ImGuiDataType_Double)
+        throw py::type_error("pairs must be a buffer of integers");
+      using Pair = ImGuiStorage::ImGuiStoragePair;
+      std::vector<Pair> pairs_in;
+      pairs_in.reserve(size_t(rows.rows));
+      for (ssize_t i = 0; i < rows.rows; ++i) {
+        uint32_t bits = uint32_t(int64_t(rows.value(i, 1)));
+        int val;
+        std::memcpy(&val, &bits, sizeof(val));
+        pairs_in.emplace_back(ImGuiID(int64_t(rows.value(i, 0))), val);
+      }
+      // one sort and one merge instead of a sorted insert per pair; of equal keys the last pair
+      // wins, and imported pairs replace the stored ones
+      auto by_key = [](Pair const& a, Pair const& b) { return a.key < b.key; };
+      std::stable_sort(pairs_in.begin(), pairs_in.end(), by_key);
+      std::vector<Pair> merged;
+      merged.reserve(pairs_in.size() + size_t(st.Data.Size));
+      Pair const* old = st.Data.begin();
+      for (size_t i = 0; i < pairs_in.size(); ++i) {
+        if (i + 1 < pairs_in.size() && pairs_in[i + 1].key == pairs_in[i].key)
+          continue;
+        for (; old != st.Data.end() && old->key <= pairs_in[i].key; ++old)
+          if (old->key != pairs_in[i].key)
+            merged.push_back(*old);
+        merged.push_back(pairs_in[i]);
+      }
+      merged.insert(merged.end(), old, static_cast<Pair const*>(st.Data.end()));
+      st.Data.resize(int(merged.size()));
+      std::copy(merged.begin(), merged.end(), st.Data.begin());
+    }, py::arg("pairs"), "set the (key, value bits) pairs of a N x 2 integer buffer, as returned by Export()")
+    .def("Export", [](ImGuiStorage const& st) {
+      // a copy: a view of st.Data would dangle once a Set* call reallocates it
+      py::array_t<uint32_t> pairs({ssize_t(st.Data.Size), ssize_t(2)});
+      auto out = pairs.mutable_unchecked<2>();
+      for (int i = 0; i < st.Data.Size; ++i) {
+        out(i, 0) = st.Data[i].key;
+        std::memcpy(&out(i, 1), &st.Data[i].val_i, sizeof(uint32_t));
+      }
+      return pairs;
+    }, "copy of the (key, value bits) pairs, a N x 2 uint32 NumPy array sorted by key")
+    .def("__len__", [](ImGuiStorage const& st) { return st.Data.Size; });
+
+  {
+    // read-only view of an InputSnapshot array, kept up to date by GetInputSnapshot()
+    auto view = [](auto& array) {
+      return py::memoryview::from_buffer(&array[0], {ssize_t(std::size(array))}, {ssize_t(sizeof(array[0]))}, true);
+    };
+    py::class_<InputSnapshot>(m, "InputSnapshot", "Key and mouse state of a frame, filled in place by GetInputSnapshot(). The arrays are read-only memoryviews "
+                                                  "(wrap them once with numpy.asarray), indexed by Key for the keys and by MouseButton for the buttons")
+      .def(py::init<>())
+      .def_property_readonly("KeysDown", [view](InputSnapshot& s) { return view(s.keys_down); }, py::keep_alive<0, 1>(), "IsKeyDown() of every key")
+      .def_property_readonly("KeysPressed", [view](InputSnapshot& s) { return view(s.keys_pressed); }, py::keep_alive<0, 1>(), "IsKeyPressed() of every key, with repeats")
+      .def_property_readonly("KeysReleased", [view](InputSnapshot& s) { return view(s.keys_released); }, py::keep_alive<0, 1>(), "IsKeyReleased() of every key")
+      .def_property_readonly("MouseDown", [view](InputSnapshot& s) { return view(s.mouse_down); }, py::keep_alive<0, 1>(), "IsMouseDown() of every button")
+      .def_property_readonly("MouseClicked", [view](InputSnapshot& s) { return view(s.mouse_clicked); }, py::keep_alive<0, 1>(), "IsMouseClicked() of every button")
+      .def_property_readonly("MouseReleased", [view](InputSnapshot& s) { return view(s.mouse_released); }, py::keep_alive<0, 1>(), "IsMouseReleased() of every button")
+      .def_property_readonly("MouseDoubleClicked", [view](InputSnapshot& s) { return view(s.mouse_double_clicked); }, py::keep_alive<0, 1>(), "IsMouseDoubleClicked() of every button")
+      .def_property_readonly("DragDelta", [](InputSnapshot& s) {
+        return py::memoryview::from_buffer(&s.drag_delta[0][0], {ssize_t(ImGuiMouseButton_COUNT), ssize_t(2)}, {ssize_t(sizeof(s.drag_delta[0])), ssize_t(sizeof(float))}, true);
+      }, py::keep_alive<0, 1>(), "GetMouseDragDelta() of every button, a MouseButton x 2 array")
+      .def_property_readonly("MousePos", [view](InputSnapshot& s) { return view(s.mouse_pos); }, py::keep_alive<0, 1>(), "GetMousePos() as x, y")
+      .def_property_readonly("MouseDelta", [view](InputSnapshot& s) { return view(s.mouse_delta); }, py::keep_alive<0, 1>(), "mouse move since the previous frame as x, y")
+      .def_property_readonly("MouseWheel", [view](InputSnapshot& s) { return view(s.mouse_wheel); }, py::keep_alive<0, 1>(), "vertical, horizontal wheel")
+      .def_readonly("KeyMods", &InputSnapshot::key_mods, "ImGuiMod_ flags of the modifier keys down")
+      .def_readonly("Frame", &InputSnapshot::frame, "GetFrameCount() when the snapshot was taken, -1 before");
+  }
+
+  py::class_<StylePreset>(m, "StylePreset", "A set of style color and style var overrides, captured once and pushed with a single PushStylePreset() call "
+                                            "(or a `with preset:` block) instead of one PushStyleColor/PushStyleVar call each")
+    .def(py::init<>())
+    .def("SetColor", [](StylePreset& p, ImGuiCol idx, ImU32 col) -> StylePreset& {
+      p.set_color(idx, ImGui::ColorConvertU32ToFloat4(col));
+      return p;
+    }, py::arg("idx"), py::arg("col"), py::return_value_policy::reference_internal)
+    .def("SetColor", [](StylePreset& p, ImGuiCol idx, ImVec4 const& col) -> StylePreset& {
+      p.set_color(idx, col);
+      return p;
+    }, py::arg("idx"), py::arg("col"), py::return_value_policy::reference_internal, "override color `idx`, replacing a previous override of it. Returns the preset for chaining")
+    .def("SetVar", [](StylePreset& p, ImGuiStyleVar idx, float val) -> StylePreset& {
+      p.set_var(idx, ImVec2(val, 0.0f), false);
+      return p;
+    }, py::arg("idx"), py::arg("val"), py::return_value_policy::reference_internal)
+    .def("SetVar", [](StylePreset& p, ImGuiStyleVar idx, ImVec2 const& val) -> StylePreset& {
+      p.set_var(idx, val, true);
+      return p;
+    }, py::arg("idx"), py::arg("val"), py::return_value_policy::reference_internal,
+    "override style var `idx` with a float or an ImVec2, whichever PushStyleVar takes for it. Returns the preset for chaining")
+    .def("Clear", [](StylePreset& p) {
+      p.colors.clear();
+      p.vars.clear();
+    })
+    .def("__len__", [](StylePreset const& p) { return p.colors.size() + p.vars.size(); })
+    .def("__enter__", [](StylePreset& p) -> StylePreset& {
+      push_style_preset(p);
+      return p;
+    }, py::return_value_policy::reference_internal)
+    .def("__exit__", [](StylePreset& p, py::args) { pop_style_preset(p); });
+
+  py::class_<FrameWatch>(m, "FrameWatch", "Idle frame detection: Changed() tells, once per frame after NewFrame(), whether input arrived, the display or the layout changed "
+                                          "or a watched data version differs since the previous frame. When it did not, replay the previous submission "
+                                          "(e.g. a recorded CommandBuffer) instead of running the Python UI code again")
+    .def(py::init<int>(), py::arg("settle_frames") = 1)
+    .def("Changed", [](FrameWatch& w, py::handle versions) {
+      int frame = ImGui::GetFrameCount();
+      if (frame == w.frame)
+        return w.changed;
+      char const* what = w.change(versions);
+      w.frame = frame;
+      if (what)
+        w.settle = w.settle_frames;
+      else if (w.settle > 0) {
+        --w.settle;
+        what = "settle";
+      }
+      w.changed = what != nullptr;
+      w.reason = what ? what : "";
+      ++(w.changed ? w.rebuilt : w.skipped);
+      return w.changed;
+    }, py::arg("versions") = py::none(),
+    "true if the UI must be rebuilt this frame. `versions`: an int or a sequence of ints (TextBuffer.Version, a data counter...), a change of any of them counts. "
+    "Calling it again in the same frame returns the same answer without counting the frame twice")
+    .def("Invalidate", [](FrameWatch& w) { w.invalid = true; }, "make the next Changed() return true")
+    .def_property_readonly("Reason", [](FrameWatch const& w) { return w.reason; },
+      "why the last Changed() returned true: invalidated, input, focus, display, layout, version or settle, empty when it returned false")
+    .def_readonly("Rebuilt", &FrameWatch::rebuilt, "frames for which Changed() returned true")
+    .def_readonly("Skipped", &FrameWatch::skipped, "frames for which Changed() returned false")
+    .def_readwrite("SettleFrames", &FrameWatch::settle_frames, "frames still rebuilt after a change")
+    .def("ResetCounters", [](FrameWatch& w) { w.rebuilt = w.skipped = 0; });
+
+  py::class_<SchedulerTask, std::shared_ptr<SchedulerTask>>(m, "SchedulerTask", "A generator or coroutine run by a Scheduler, with its timing")
+    .def_readonly("Name", &SchedulerTask::name)
+    .def_readonly("Done", &SchedulerTask::done, "true once it returned, raised or was cancelled and removed")
+    .def_readonly("Result", &SchedulerTask::result, "value it returned, None until then")
+    .def_readonly("Steps", &SchedulerTask::steps, "number of times it was resumed")
+    .def_readonly("TimeUs", &SchedulerTask::time_us, "total time spent in it, in microseconds")
+    .def_readonly("LastRunUs", &SchedulerTask::last_run_us, "time spent in it during the last Run() it took part in, in microseconds")
+    .def_readonly("MaxStepUs", &SchedulerTask::max_step_us, "longest single step, in microseconds: a task with long steps should yield more often")
+    .def_readonly("Overruns", &SchedulerTask::overruns, "steps that ran past the end of the budget")
+    .def("Cancel", &SchedulerTask::cancel, "close the generator or coroutine, it is removed on the next Run(). A task can cancel itself, it is then closed once its step returns");
+
+  py::class_<Scheduler>(m, "Scheduler", "Runs generator tasks and coroutines on the thread owning the ImGui context, a few steps per frame within a time budget. "
+                                        "A task gives control back with `yield` (or `await asyncio.sleep(0)` in a coroutine); call Run() once per frame, e.g. after Render(). "
+                                        "Coroutines are not run by an asyncio event loop: they cannot await anything else, asyncio.sleep(0.01) fails with "
+                                        "'no running event loop' and awaiting a future raises RuntimeError")
+    .def(py::init<double>(), py::arg("budget_us") = 2000.0)
+    .def("Add", [](Scheduler& s, py::object task, std::string name) {
+      if (!PyGen_Check(task.ptr()) && !PyCoro_CheckExact(task.ptr()))
+        throw py::type_error("task must be a generator or a coroutine");
+      if (name.empty())
+        name = py::str(task.attr("__qualname__"));
+      auto t = std::make_shared<SchedulerTask>();
+      t->task = std::move(task);
+      t->name = std::move(name);
+      s.tasks.push_back(t);
+      return t;
+    }, py::arg("task"), py::arg("name") = "", "schedule a generator or coroutine object, named after its function by default")
+    .def("Run", [](Scheduler& s, std::optional<double> budget_us) { s.run(budget_us.value_or(s.budget_us)); },
+    py::arg("budget_us") = py::none(),
+    "resume the tasks in turn until the budget (BudgetUs by default) is used up or no task is left. "
+    "An exception raised by a task removes it and propagates")
+    .def_readwrite("BudgetUs", &Scheduler::budget_us, "time given to the tasks by each Run(), in microseconds")
+    .def_property_readonly("Tasks", [](Scheduler const& s) { return s.tasks; }, "tasks not finished yet")
+    .def_readonly("Runs", &Scheduler::runs)
+    .def_readonly("LastRunUs", &Scheduler::last_run_us, "time taken by the last Run(), in microseconds")
+    .def_readonly("Overruns", &Scheduler::overruns, "Run() calls that took longer than their budget")
+    .def_readonly("OverrunUs", &Scheduler::overrun_us, "total time spent past the budget, in microseconds")
+    .def("__len__", [](Scheduler const& s) { return s.tasks.size(); });
+
+  py::class_<TextBuffer>(m, "TextBuffer", "Native text storage for InputText/InputTextMultiline, edited in place without converting the text every frame")
+    .def(py::init<>())
+    .def(py::init([](std::string text) { return TextBuffer{std::move(text)}; }), py::arg("text"))
+    .def_property("Text",
+      [](TextBuffer const& buf) { return py::str(buf.text.data(), buf.text.size()); },
+      [](TextBuffer& buf, std::string text) { buf.text = std::move(text); ++buf.version; },
+      "the text as python str, converted on each access")
+    .def_readonly("Version", &TextBuffer::version, "modification counter, compare with a saved value to skip work when the text is unchanged")
+    .def("Clear", [](TextBuffer& buf) { buf.text.clear(); ++buf.version; })
+    .def("Reserve", [](TextBuffer& buf, size_t capacity) { buf.text.reserve(capacity); }, py::arg("capacity"))
+    .def("__len__", [](TextBuffer const& buf) { return buf.text.size(); }, "size in bytes (UTF-8)")
+    .def("__str__", [](TextBuffer const& buf) { return py::str(buf.text.data(), buf.text.size()); });
+
 '''
 
 manual_impl_post = r'''
@@ -301,6 +1891,209 @@ manual_impl_post = r'''
   m.def("Text", [](std::string_view str){
     ImGui::TextUnformatted(&*str.begin(), &*str.end());
   }, py::arg("text"));
+  m.def("TextLines", [](py::buffer data, py::buffer offsets, py::object colors) {
+    py::buffer_info datainfo = data.request();
+    if (datainfo.ndim != 1 || datainfo.itemsize != 1 || (datainfo.size > 1 && datainfo.strides[0] != 1))
+      throw py::value_error("data must be a contiguous buffer of bytes");
+    ImGuiDataType offtype;
+    py::buffer_info offinfo = request_int_buffer(offsets, offtype, "offsets");
+    char const* text = static_cast<char const*>(datainfo.ptr);
+    uint64_t textsize = uint64_t(datainfo.size);
+    ssize_t count = offinfo.size;
+    clipped_text_lines(count, colors, [&](int i) {
+      uint64_t begin = std::min(int_buffer_at(offinfo, offtype, i), textsize);
+      uint64_t end = i+1 < count ? std::min(int_buffer_at(offinfo, offtype, i+1), textsize) : textsize;
+      if (end > begin && text[end-1] == '\n')
+        --end;
+      return std::string_view(text + begin, size_t(std::max(begin, end) - begin));
+    });
+  }, py::arg("data"), py::arg("offsets"), py::arg("colors") = py::none(),
+  "draw the visible lines of UTF-8 `data`, line i starts at offsets[i] and ends before the next line start. colors: optional ImU32 text color per line");
+  m.def("TextLines", [](py::sequence lines, py::object colors) {
+    py::object line; // keeps the current item, and its UTF-8 representation, alive while it is drawn
+    clipped_text_lines(ssize_t(lines.size()), colors, [&](int i) {
+      line = lines[i];
+      Py_ssize_t size;
+      char const* str = PyUnicode_AsUTF8AndSize(line.ptr(), &size);
+      if (!str)
+        throw py::error_already_set();
+      return std::string_view(str, size_t(size));
+    });
+  }, py::arg("lines"), py::arg("colors") = py::none(),
+  "draw the visible strings of `lines`. colors: optional ImU32 text color per line");
+  m.def("TableColumns", [](char const* str_id, py::sequence columns, py::object headers, py::object formats,
+                           ImGuiTableFlags flags, ImVec2 outer_size, uint64_t version) {
+    // row order of each table, sorted again when its sort specs or `version` change
+    struct Order
+    {
+      std::vector<int> rows;
+      uint64_t version = 0;
+      ImGuiContext* context = nullptr;
+      int frame = 0; // last frame the table was drawn in
+    };
+    static std::unordered_map<ImGuiID, Order> orders;
+    static int swept_frame = -1;
+
+    int count = int(columns.size());
+    if (count < 1 || count > 512)
+      throw py::value_error("TableColumns takes 1 to 512 columns");
+    if (!headers.is_none() && py::len(headers) != size_t(count))
+      throw py::value_error("headers must have one entry per column");
+    if (!formats.is_none() && py::len(formats) != size_t(count))
+      throw py::value_error("formats must have one entry per column");
+    std::vector<TableColumn> cols(count);
+    ssize_t rows = -1;
+    for (int c = 0; c < count; ++c) {
+      py::object column = columns[c];
+      ssize_t size;
+      if (PyObject_CheckBuffer(column.ptr())) {
+        cols[c].info = py::reinterpret_borrow<py::buffer>(column).request();
+        cols[c].type = buffer_data_type(cols[c].info);
+        if (cols[c].type == ImGuiDataType_COUNT)
+          throw py::type_error("column " + std::to_string(c) + ": unsupported buffer format '" + cols[c].info.format + "'");
+        if (cols[c].info.ndim != 1)
+          throw py::value_error("column " + std::to_string(c) + " must be a 1-d buffer");
+        py::object format = formats.is_none() ? py::object(py::none()) : py::object(formats[py::int_(c)]);
+        bool real = cols[c].type == ImGuiDataType_Float || cols[c].type == ImGuiDataType_Double;
+        cols[c].format = column_format(format.is_none() ? (real ? "%g" : "%d") : format.cast<std::string>(), cols[c].type);
+        size = cols[c].info.size;
+      } else {
+        // converted now: an error once BeginTable() ran would leave the table open
+        py::sequence seq = py::reinterpret_borrow<py::sequence>(column);
+        size = ssize_t(seq.size());
+        cols[c].items.reserve(size_t(size));
+        cols[c].strings.reserve(size_t(size));
+        for (ssize_t i = 0; i < size; ++i) {
+          py::object item = seq[i];
+          if (!PyUnicode_Check(item.ptr()))
+            throw py::type_error("column " + std::to_string(c) + ": item " + std::to_string(i) + " is not a str");
+          Py_ssize_t len;
+          char const* str = PyUnicode_AsUTF8AndSize(item.ptr(), &len);
+          if (!str)
+            throw py::error_already_set();
+          cols[c].strings.emplace_back(str, size_t(len));
+          cols[c].items.push_back(std::move(item));
+        }
+      }
+      if (rows >= 0 && size != rows)
+        throw py::value_error("columns must all have the same length");
+      rows = size;
+    }
+    if (rows > INT_MAX)
+      throw py::value_error("too many rows, ImGuiListClipper counts them in an int");
+    std::vector<std::string> header_names(headers.is_none() ? 0 : size_t(count));
+    for (size_t c = 0; c < header_names.size(); ++c) {
+      py::object header = headers[py::int_(c)];
+      if (!PyUnicode_Check(header.ptr()))
+        throw py::type_error("header " + std::to_string(c) + " is not a str");
+      header_names[c] = header.cast<std::string>();
+    }
+
+    // once per frame, forget the tables not drawn in the previous frame or drawn by another context
+    ImGuiContext* context = ImGui::GetCurrentContext();
+    int frame = ImGui::GetFrameCount();
+    if (frame != swept_frame) {
+      for (auto it = orders.begin(); it != orders.end();) {
+        if (it->second.context != context || it->second.frame < frame - 1 || it->second.frame > frame)
+          it = orders.erase(it);
+        else
+          ++it;
+      }
+      swept_frame = frame;
+    }
+
+    ImGuiID id = ImGui::GetID(str_id);
+    if (auto it = orders.find(id); it != orders.end())
+      it->second.frame = frame; // kept while the table is submitted, even when clipped
+    if (!ImGui::BeginTable(str_id, count, flags, outer_size))
+      return false;
+    struct End { ~End() { ImGui::EndTable(); } } end;
+    ImGui::TableSetupScrollFreeze(0, header_names.empty() ? 0 : 1);
+    for (int c = 0; c < count; ++c)
+      ImGui::TableSetupColumn(header_names.empty() ? "" : header_names[c].c_str());
+    if (!header_names.empty())
+      ImGui::TableHeadersRow();
+
+    Order& order = orders[id];
+    order.context = context;
+    order.frame = frame;
+    ImGuiTableSortSpecs* specs = ImGui::TableGetSortSpecs();
+    if (!specs || specs->SpecsCount == 0) {
+      order.rows.clear();
+    } else if (specs->SpecsDirty || order.version != version || order.rows.size() != size_t(rows)) {
+      order.rows.resize(size_t(rows));
+      for (int i = 0; i < int(rows); ++i)
+        order.rows[i] = i;
+      std::stable_sort(order.rows.begin(), order.rows.end(), [&](int a, int b) {
+        for (int s = 0; s < specs->SpecsCount; ++s) {
+          int r = cols[specs->Specs[s].ColumnIndex].compare(a, b);
+          if (r != 0)
+            return specs->Specs[s].SortDirection == ImGuiSortDirection_Descending ? r > 0 : r < 0;
+        }
+        return false;
+      });
+      order.version = version;
+      specs->SpecsDirty = false;
+    }
+
+    char buf[128];
+    ImGuiListClipper clipper;
+    clipper.Begin(int(rows));
+    while (clipper.Step()) {
+      for (int i = clipper.DisplayStart; i < clipper.DisplayEnd; ++i) {
+        int row = order.rows.empty() ? i : order.rows[i];
+        ImGui::TableNextRow();
+        for (int c = 0; c < count; ++c) {
+          if (!ImGui::TableSetColumnIndex(c))
+            continue;
+          std::string_view text = cols[c].text(row, buf);
+          ImGui::TextUnformatted(text.data(), text.data() + text.size());
+        }
+      }
+    }
+    clipper.End();
+    return true;
+  }, py::arg("str_id"), py::arg("columns"), py::arg("headers") = py::none(), py::arg("formats") = py::none(),
+  py::arg("flags") = ImGuiTableFlags_Sortable | ImGuiTableFlags_ScrollY | ImGuiTableFlags_RowBg | ImGuiTableFlags_BordersOuter | ImGuiTableFlags_BordersV | ImGuiTableFlags_Resizable,
+  py::arg("outer_size") = ImVec2(0, 0), py::arg("version") = 0,
+  "draw a table of `columns`, each a 1-d numeric buffer or a sequence of str, only visiting the visible rows. headers: optional column names. formats: optional printf format per numeric column (None for the default). "
+  "Rows are sorted natively when the sort specs change or `version` differs from the previous call, bump it when the data changes. Returns False when the table is not visible");
+  m.def("PushStylePreset", &push_style_preset, py::arg("preset"), "push all the overrides of `preset` in one call");
+  m.def("PopStylePreset", &pop_style_preset, py::arg("preset"), "pop the overrides pushed by the last PushStylePreset(preset)");
+  m.def("GetInputSnapshot", [](InputSnapshot& s) -> InputSnapshot& {
+    take_input_snapshot(s);
+    return s;
+  }, py::arg("snapshot"), py::return_value_policy::reference,
+  "fill `snapshot` with the key and mouse state of the current frame in one call and return it, its arrays are updated in place");
+  m.def("GetInputSnapshot", []() {
+    InputSnapshot s;
+    take_input_snapshot(s);
+    return s;
+  }, "a new InputSnapshot of the current frame, pass one back to GetInputSnapshot(snapshot) to reuse it");
+  m.def("PlotLines", [](char const* label, py::buffer values, int values_offset, char const* overlay_text, float scale_min, float scale_max, ImVec2 graph_size) {
+    plot_buffer(py::overload_cast<char const*, float const*, int, int, char const*, float, float, ImVec2, int>(&ImGui::PlotLines),
+                py::overload_cast<char const*, float (*)(void*, int), void*, int, int, char const*, float, float, ImVec2>(&ImGui::PlotLines),
+                label, values, values_offset, overlay_text, scale_min, scale_max, graph_size);
+  }, py::arg("label"), py::arg("values"), py::arg("values_offset") = 0, py::arg("overlay_text") = nullptr,
+  py::arg("scale_min") = FLT_MAX, py::arg("scale_max") = FLT_MAX, py::arg("graph_size") = ImVec2(0, 0),
+  "plot a 1-d float32 or float64 buffer (NumPy array, array.array, memoryview), read in place. values_offset: index of the oldest sample of a ring buffer");
+  m.def("PlotHistogram", [](char const* label, py::buffer values, int values_offset, char const* overlay_text, float scale_min, float scale_max, ImVec2 graph_size) {
+    plot_buffer(py::overload_cast<char const*, float const*, int, int, char const*, float, float, ImVec2, int>(&ImGui::PlotHistogram),
+                py::overload_cast<char const*, float (*)(void*, int), void*, int, int, char const*, float, float, ImVec2>(&ImGui::PlotHistogram),
+                label, values, values_offset, overlay_text, scale_min, scale_max, graph_size);
+  }, py::arg("label"), py::arg("values"), py::arg("values_offset") = 0, py::arg("overlay_text") = nullptr,
+  py::arg("scale_min") = FLT_MAX, py::arg("scale_max") = FLT_MAX, py::arg("graph_size") = ImVec2(0, 0),
+  "histogram of a 1-d float32 or float64 buffer (NumPy array, array.array, memoryview), read in place. values_offset: index of the oldest sample of a ring buffer");
+  m.def("InputText", [](char const* label, TextBuffer& buf, ImGuiInputTextFlags flags) {
+    bool mod = ImGui::InputText(label, &buf.text, flags);
+    buf.version += mod;
+    return mod;
+  }, py::arg("label"), py::arg("text"), py::arg("flags") = 0);
+  m.def("InputTextMultiline", [](char const* label, TextBuffer& buf, ImVec2 const& size, ImGuiInputTextFlags flags) {
+    bool mod = ImGui::InputTextMultiline(label, &buf.text, size, flags);
+    buf.version += mod;
+    return mod;
+  }, py::arg("label"), py::arg("text"), py::arg("size") = ImVec2(0,0), py::arg("flags") = 0);
   m.def("InputText", [](char const* label, std::string str, ImGuiInputTextFlags flags) {
     bool mod = ImGui::InputText(label, &str, flags);
     return py::make_tuple(mod, str);
@@ -313,6 +2106,34 @@ manual_impl_post = r'''
     bool mod = ImGui::Checkbox(label, &checked);
     return py::make_tuple(mod, checked);
   }, py::arg("label"), py::arg("checked"));
+  // StateStore overloads: the value lives in `store` under the ID of the widget (`key` for RadioButton)
+  m.def("Begin", [](char const* name, ImGuiStorage& store, ImGuiWindowFlags flags) {
+    return ImGui::Begin(name, store.GetBoolRef(ImGui::GetID(name), true), flags);
+  }, py::arg("name"), py::arg("store"), py::arg("flags") = 0, "the open state is stored, True at first");
+  m.def("Checkbox", [](char const* label, ImGuiStorage& store) {
+    return ImGui::Checkbox(label, store.GetBoolRef(ImGui::GetID(label)));
+  }, py::arg("label"), py::arg("store"));
+  m.def("RadioButton", [](char const* label, ImGuiStorage& store, py::handle key, int v_button) {
+    return ImGui::RadioButton(label, store.GetIntRef(state_key(key)), v_button);
+  }, py::arg("label"), py::arg("store"), py::arg("key"), py::arg("v_button"), "the int value shared by the buttons of a group is stored under `key`");
+  m.def("Selectable", [](char const* label, ImGuiStorage& store, ImGuiSelectableFlags flags, ImVec2 const& size) {
+    return ImGui::Selectable(label, store.GetBoolRef(ImGui::GetID(label)), flags, size);
+  }, py::arg("label"), py::arg("store"), py::arg("flags") = 0, py::arg("size") = ImVec2(0, 0));
+  m.def("MenuItem", [](char const* label, char const* shortcut, ImGuiStorage& store, bool enabled) {
+    return ImGui::MenuItem(label, shortcut, store.GetBoolRef(ImGui::GetID(label)), enabled);
+  }, py::arg("label"), py::arg("shortcut"), py::arg("store"), py::arg("enabled") = true);
+  m.def("DragFloat", [](char const* label, ImGuiStorage& store, float v_speed, float v_min, float v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::DragFloat(label, store.GetFloatRef(ImGui::GetID(label)), v_speed, v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0.0f, py::arg("v_max") = 0.0f, py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("DragInt", [](char const* label, ImGuiStorage& store, float v_speed, int v_min, int v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::DragInt(label, store.GetIntRef(ImGui::GetID(label)), v_speed, v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0, py::arg("v_max") = 0, py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("SliderFloat", [](char const* label, ImGuiStorage& store, float v_min, float v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::SliderFloat(label, store.GetFloatRef(ImGui::GetID(label)), v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("SliderInt", [](char const* label, ImGuiStorage& store, int v_min, int v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::SliderInt(label, store.GetIntRef(ImGui::GetID(label)), v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%d", py::arg("flags") = 0);
   m.def("BeginTabItem", [](char const* label, bool open, ImGuiTabItemFlags flags){
     bool shown = ImGui::BeginTabItem(label, &open, flags);
     return py::make_tuple(shown, open);
@@ -324,6 +2145,51 @@ manual_impl_post = r'''
     ImGui::SetItemTooltip("%s", tip);
   }, py::arg("tooltip"));
   
+  // buffer protocol overloads edit the buffer in place, and return only the modified flag
+  m.def("DragScalar", [](char const* label, py::buffer value, float speed, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    uint64_t minmax[2];
+    void *pmin = nullptr, *pmax = nullptr;
+    if (!vmin.is_none()) { cast_data_type(vmin, type, minmax); pmin = minmax; }
+    if (!vmax.is_none()) { cast_data_type(vmax, type, minmax+1); pmax = minmax+1; }
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::DragScalarN(label, type, info.ptr, int(info.size), speed, pmin, pmax, format, flags);
+  }, py::arg("label"), py::arg("value"), py::arg("speed")=1.f, py::arg("min")=py::none(), py::arg("max")=py::none(), py::arg("format")="", py::arg("flags")=0);
+
+  m.def("SliderScalar", [](char const* label, py::buffer value, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    uint64_t minmax[2];
+    cast_data_type(vmin, type, minmax);
+    cast_data_type(vmax, type, minmax+1);
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::SliderScalarN(label, type, info.ptr, int(info.size), minmax, minmax+1, format, flags);
+  }, py::arg("label"), py::arg("value"), py::arg("min")=0, py::arg("max")=10, py::arg("format")="", py::arg("flags")=0);
+
+  m.def("VSliderScalar", [](char const* label, ImVec2 const& size, py::buffer value, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    if (info.size != 1)
+      throw py::value_error("VSliderScalar takes a single component buffer");
+    uint64_t minmax[2];
+    cast_data_type(vmin, type, minmax);
+    cast_data_type(vmax, type, minmax+1);
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::VSliderScalar(label, size, type, info.ptr, minmax, minmax+1, format, flags);
+  }, py::arg("label"), py::arg("size"), py::arg("value"), py::arg("min")=0, py::arg("max")=10, py::arg("format")="", py::arg("flags")=0);
+
+  m.def("InputScalar", [](char const* label, py::buffer value, py::object step, py::object step_fast, char const* format, ImGuiInputTextFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    uint64_t steps[2];
+    void *pstep = nullptr, *pstep_fast = nullptr;
+    if (!step.is_none()) { cast_data_type(step, type, steps); pstep = steps; }
+    if (!step_fast.is_none()) { cast_data_type(step_fast, type, steps+1); pstep_fast = steps+1; }
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::InputScalarN(label, type, info.ptr, int(info.size), pstep, pstep_fast, format, flags);
+  }, py::arg("label"), py::arg("value"), py::arg("step")=py::none(), py::arg("step_fast")=py::none(), py::arg("format")="", py::arg("flags")=0);
+
   m.def("DragScalar", [](char const* label, ImGuiDataType type, py::object value, float speed, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
     int8_t   i8[4]  = {0}, i8minmax[2];
     uint8_t  u8[4]  = {0}, u8minmax[2];
@@ -342,8 +2208,8 @@ manual_impl_post = r'''
 #define TYPE_CASE(X, Y, T) \
         case ImGuiDataType_##X:\
           pdata = Y; Y[comp] = py::cast<T>(val);\
-          if (!pmin && vmin) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
-          if (!pmax && vmax) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
+          if (!pmin && !vmin.is_none()) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
+          if (!pmax && !vmax.is_none()) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
           break
     auto assign = [&](int comp, py::handle val) {
       switch(type) {
@@ -427,8 +2293,8 @@ manual_impl_post = r'''
 #define TYPE_CASE(X, Y, T) \
         case ImGuiDataType_##X:\
           pdata = Y; Y[comp] = py::cast<T>(val);\
-          if (!pmin && vmin) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
-          if (!pmax && vmax) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
+          if (!pmin && !vmin.is_none()) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
+          if (!pmax && !vmax.is_none()) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
           break
     auto assign = [&](int comp, py::handle val) {
       switch(type) {
@@ -492,62 +2358,685 @@ manual_impl_post = r'''
     else
       return py::make_tuple(mod, retval[0]);
   }, py::arg("label"), py::arg("type"), py::arg("value"), py::arg("min")=0, py::arg("max")=10, py::arg("format")="%.3f", py::arg("flags")=0);
+'''
+
+if args.labels:
+    manual_impl_post = manual_impl_post.replace('''  m.def("PushID", py::overload_cast<char const*>(&ImGui::PushID), py::arg("str_id"));
+  m.def("PushID", py::overload_cast<int>(&ImGui::PushID), py::arg("int_id"));
+  m.def("GetID",  py::overload_cast<char const*>(&ImGui::GetID), py::arg("str_id"));
+''', labels_impl_id)
+    manual_impl_post = re.sub(r'\[\]\((?:char const|const char)\* (label|name|str_id)\b', r'[](LabelArg \1', manual_impl_post)
+    fastcall_impl_helpers = fastcall_impl_helpers.replace('''  else if (PyBytes_Check(o))
+    out = PyBytes_AS_STRING(o);
+''', '''  else if (PyBytes_Check(o))
+    out = PyBytes_AS_STRING(o);
+  else if (py::isinstance<Label>(o))
+    out = py::handle(o).cast<Label const&>().text.c_str();
+''')
+
+# Recorded command buffer: every generated API gets a recorder method on
+# CommandBuffer with the same name and signature, and Replay() runs the whole
+# recorded stream in a single native loop.
+# Calls are encoded as [uint16 opcode][int32 result slot, if any][args...],
+# strings as [uint32 length][bytes][\0] so replay can point into the stream.
+cmdbuf_impl_pre = r'''
+namespace {
 
-  // TODO: VSliderScalar, InputScalarN, ColorEdit3, ColorEdit4, ColorPicker3, ColorPicker3, ColorButton
+struct CommandBuffer
+{
+  std::vector<char>   data;
+  std::vector<size_t> openIfs; // offsets of If() jump targets waiting for EndIf()
+  int numCommands = 0;
+  int numResults = 0;
+
+  template <class T>
+  void put(T const& v) {
+    size_t n = data.size();
+    data.resize(n + sizeof(T));
+    memcpy(data.data() + n, &v, sizeof(T));
+  }
+  void put(char const* s) {
+    uint32_t len = s ? uint32_t(strlen(s)) : UINT32_MAX;
+    put(len);
+    if (s)
+      data.insert(data.end(), s, s + len + 1);
+  }
+  void put(std::string_view s) {
+    put(uint32_t(s.size()));
+    data.insert(data.end(), s.begin(), s.end());
+    data.push_back(0);
+  }
+  void op(uint16_t code) {
+    put(code);
+    ++numCommands;
+  }
+  int result() {
+    int slot = numResults++;
+    put(slot);
+    return slot;
+  }
+  void clear() {
+    data.clear();
+    openIfs.clear();
+    numCommands = numResults = 0;
+  }
+};
+
+struct CommandReader
+{
+  char const* p;
+
+  template <class T>
+  T get() {
+    T v;
+    memcpy(&v, p, sizeof(T));
+    p += sizeof(T);
+    return v;
+  }
+};
+
+template <>
+char const* CommandReader::get<char const*>() {
+  uint32_t len = get<uint32_t>();
+  if (len == UINT32_MAX)
+    return nullptr;
+  char const* s = p;
+  p += len + 1;
+  return s;
+}
+
+template <>
+std::string_view CommandReader::get<std::string_view>() {
+  uint32_t len = get<uint32_t>();
+  std::string_view s(p, len);
+  p += len + 1;
+  return s;
+}
+
+'''
+
+manual_cmdbuf_ops = r'''
+  CommandOp_If,
+  CommandOp_EndIf,
+  CommandOp_Begin,
+  CommandOp_BeginPopupModal,
+  CommandOp_BeginTabItem,
+  CommandOp_PushID_Str,
+  CommandOp_PushID_Int,
+  CommandOp_GetID,
+  CommandOp_Text,
+  CommandOp_Checkbox,
+  CommandOp_SetTooltip,
+  CommandOp_SetItemTooltip,
+'''
+
+manual_cmdbuf_replay = r'''
+    case CommandOp_If: {
+      auto slot = r.get<int>();
+      auto target = r.get<uint32_t>();
+      if (!truth[slot])
+        r.p = cb.data.data() + target;
+    } break;
+    case CommandOp_EndIf:
+      break;
+    case CommandOp_Begin: {
+      auto slot = r.get<int>();
+      auto name = r.get<char const*>();
+      auto open = r.get<bool>();
+      auto flags = r.get<ImGuiWindowFlags>();
+      bool shown = ImGui::Begin(name, &open, flags);
+      result(slot, shown, py::make_tuple(shown, open));
+    } break;
+    case CommandOp_BeginPopupModal: {
+      auto slot = r.get<int>();
+      auto name = r.get<char const*>();
+      auto open = r.get<bool>();
+      auto flags = r.get<ImGuiWindowFlags>();
+      bool shown = ImGui::BeginPopupModal(name, &open, flags);
+      result(slot, shown, py::make_tuple(shown, open));
+    } break;
+    case CommandOp_BeginTabItem: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto open = r.get<bool>();
+      auto flags = r.get<ImGuiTabItemFlags>();
+      bool shown = ImGui::BeginTabItem(label, &open, flags);
+      result(slot, shown, py::make_tuple(shown, open));
+    } break;
+    case CommandOp_PushID_Str:
+      ImGui::PushID(r.get<char const*>());
+      break;
+    case CommandOp_PushID_Int:
+      ImGui::PushID(r.get<int>());
+      break;
+    case CommandOp_GetID: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      result(slot, true, py::cast(ImGui::GetID(str_id)));
+    } break;
+    case CommandOp_Text: {
+      auto str = r.get<std::string_view>();
+      ImGui::TextUnformatted(str.data(), str.data() + str.size());
+    } break;
+    case CommandOp_Checkbox: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto checked = r.get<bool>();
+      bool mod = ImGui::Checkbox(label, &checked);
+      result(slot, mod, py::make_tuple(mod, checked));
+    } break;
+    case CommandOp_SetTooltip:
+      ImGui::SetTooltip("%s", r.get<char const*>());
+      break;
+    case CommandOp_SetItemTooltip:
+      ImGui::SetItemTooltip("%s", r.get<char const*>());
+      break;
 '''
 
+manual_cmdbuf_record = r'''
+  cmdbuf
+    .def(py::init<>())
+    .def("__len__", [](CommandBuffer const& cb) { return cb.numCommands; })
+    .def_readonly("NumResults", &CommandBuffer::numResults, "number of result slots Replay() will return")
+    .def_property_readonly("NumBytes", [](CommandBuffer const& cb) { return cb.data.size(); })
+    .def("Clear", &CommandBuffer::clear, "drop all recorded commands, so the buffer can be recorded again")
+    .def("If", [](CommandBuffer& cb, int slot) {
+      if (slot < 0 || slot >= cb.numResults)
+        throw std::out_of_range("result slot out of range");
+      cb.op(CommandOp_If);
+      cb.put(slot);
+      cb.openIfs.push_back(cb.data.size());
+      cb.put(uint32_t(0));
+    }, py::arg("slot"), "replay the following commands up to the matching EndIf() only if result `slot` is true (for tuple results: its first element)")
+    .def("EndIf", [](CommandBuffer& cb) {
+      if (cb.openIfs.empty())
+        throw std::runtime_error("EndIf() without matching If()");
+      cb.op(CommandOp_EndIf);
+      uint32_t target = uint32_t(cb.data.size());
+      memcpy(cb.data.data() + cb.openIfs.back(), &target, sizeof(target));
+      cb.openIfs.pop_back();
+    })
+    .def("Begin", [](CommandBuffer& cb, char const* name, bool open, ImGuiWindowFlags flags) {
+      cb.op(CommandOp_Begin);
+      int slot = cb.result();
+      cb.put(name); cb.put(open); cb.put(flags);
+      return slot;
+    }, py::arg("name"), py::arg("open") = true, py::arg("flags") = 0)
+    .def("BeginPopupModal", [](CommandBuffer& cb, char const* name, bool open, ImGuiWindowFlags flags) {
+      cb.op(CommandOp_BeginPopupModal);
+      int slot = cb.result();
+      cb.put(name); cb.put(open); cb.put(flags);
+      return slot;
+    }, py::arg("name"), py::arg("open") = true, py::arg("flags") = 0)
+    .def("BeginTabItem", [](CommandBuffer& cb, char const* label, bool open, ImGuiTabItemFlags flags) {
+      cb.op(CommandOp_BeginTabItem);
+      int slot = cb.result();
+      cb.put(label); cb.put(open); cb.put(flags);
+      return slot;
+    }, py::arg("name"), py::arg("open") = true, py::arg("flags") = 0)
+    .def("PushID", [](CommandBuffer& cb, char const* str_id) {
+      cb.op(CommandOp_PushID_Str);
+      cb.put(str_id);
+    }, py::arg("str_id"))
+    .def("PushID", [](CommandBuffer& cb, int int_id) {
+      cb.op(CommandOp_PushID_Int);
+      cb.put(int_id);
+    }, py::arg("int_id"))
+    .def("GetID", [](CommandBuffer& cb, char const* str_id) {
+      cb.op(CommandOp_GetID);
+      int slot = cb.result();
+      cb.put(str_id);
+      return slot;
+    }, py::arg("str_id"))
+    .def("Text", [](CommandBuffer& cb, std::string_view str) {
+      cb.op(CommandOp_Text);
+      cb.put(str);
+    }, py::arg("text"))
+    .def("Checkbox", [](CommandBuffer& cb, char const* label, bool checked) {
+      cb.op(CommandOp_Checkbox);
+      int slot = cb.result();
+      cb.put(label); cb.put(checked);
+      return slot;
+    }, py::arg("label"), py::arg("checked"))
+    .def("SetTooltip", [](CommandBuffer& cb, char const* tip) {
+      cb.op(CommandOp_SetTooltip);
+      cb.put(tip);
+    }, py::arg("tooltip"))
+    .def("SetItemTooltip", [](CommandBuffer& cb, char const* tip) {
+      cb.op(CommandOp_SetItemTooltip);
+      cb.put(tip);
+    }, py::arg("tooltip"))
+'''
+
+# type used to store an argument of C++ type `t` in the command stream
+def storage_type(t):
+    if 'char' in t:
+        return 'char const*'
+    return t.replace('const ', '').replace('&', '').strip()
+
+# identifier-safe spelling of `t`, to tell overloads apart
+def mangled_type(t):
+    t = storage_type(t)
+    if t == 'char const*':
+        return 'Str'
+    t = re.sub(r'\W', '', t).replace('ImGui', '')
+    return t[0].upper() + t[1:]
+
+# python type of `t` if --fastcall converts it natively, None if pybind11 has to
+def fast_pytype(t):
+    t = t.strip()
+    if t in ('const char*', 'char const*'):
+        return 'str'
+    if t in ('bool', 'float'):
+        return t
+    if t == 'double':
+        return 'float'
+    if t in ('int', 'unsigned int') or t in imgui_int_typedefs:
+        return 'int'
+    return None
+
+# python spelling of the C++ default argument `d`, for docstrings
+def fast_pydefault(d):
+    d = d.strip()
+    if d in ('NULL', 'nullptr'):
+        return 'None'
+    if d in ('true', 'false'):
+        return d.capitalize()
+    m = re.fullmatch(r'([-+]?[\d.]+(e[-+]?\d+)?)[fF]?', d)
+    if m:
+        return m.group(1)
+    if re.fullmatch(r'"[^"\\]*"', d):
+        return repr(d[1:-1])
+    return d
+
+# --labels: lambda binding `v`, taking its string arguments as LabelArg, None if it takes no string
+def label_function(v):
+    if not any('char' in t for t in v.argtypes):
+        return None
+    params = ', '.join(f'{"LabelArg" if "char" in t else t} {n}' for t, n in zip(v.argtypes, v.argnames))
+    call = f'ImGui::{v.name}({", ".join(v.argnames)})'
+    # a Label passed as `str_id` of a function with an ImGuiID overload gives its cached ID to that overload
+    if v.argnames[:1] == ['str_id'] and any(w.argtypes == ['ImGuiID'] + v.argtypes[1:] for w in imgui_api_map[v.name]):
+        id_call = f'ImGui::{v.name}({", ".join(["str_id.label->GetID()"] + v.argnames[1:])})'
+        return f'[]({params}) {{ return str_id.label ? {id_call} : {call}; }}'
+    return f'[]({params}) {{ return {call}; }}'
+
+# lambda binding `v`, whose one `T* v` or `T v[N]` argument is taken by value and returned
+# after the modified flag, as `Checkbox` does; pointer arguments with a default keep it.
+# None if `v` has no such argument
+def value_function(v):
+    values = [i for i, (t, d) in enumerate(zip(v.argtypes, v.argdefaults))
+              if d is None and (v.argdims[i] or ('*' in t and 'char' not in t))]
+    if len(values) != 1:
+        return None
+    params, call = [], []
+    for i, (t, n, d) in enumerate(zip(v.argtypes, v.argnames, v.argdefaults)):
+        if i == values[0]:
+            elem = t.replace('*', '').strip()
+            count = int(v.argdims[i].strip('[]') or 1) if v.argdims[i] else 1
+            params.append(f'{elem} {n}' if count == 1 else f'std::array<{elem}, {count}> {n}')
+            call.append(f'&{n}' if count == 1 else f'{n}.data()')
+            result = n if count == 1 else f'py::make_tuple({", ".join(f"{n}[{k}]" for k in range(count))})'
+        elif v.argdims[i] or ('*' in t and 'char' not in t):
+            call.append(d)
+        else:
+            params.append(f'{"LabelArg" if args.labels and "char" in t else t} {n}')
+            call.append(n)
+    body = f'bool mod = ImGui::{v.name}({", ".join(call)}); return py::make_tuple(mod, {result});'
+    pyargs = ''.join(f', py::arg("{n}")' + ('' if d is None else f' = {pyarg_default(d)}')
+                     for i, (n, d) in enumerate(zip(v.argnames, v.argdefaults))
+                     if i == values[0] or not (v.argdims[i] or ('*' in v.argtypes[i] and 'char' not in v.argtypes[i])))
+    return f'[]({", ".join(params)}) {{ {body} }}{pyargs}{v.docarg()}'
+
+# (file scope code, registration) of the METH_FASTCALL binding of `v`, None if it has types
+# only pybind11 converts
+def fast_function(v):
+    if v.rettype != 'void' and not fast_pytype(v.rettype):
+        return None
+    if not all(map(fast_pytype, v.argtypes)):
+        return None
+    func = f'fast_{v.name}'
+    decl = f'static int {func}_id;\n\n' if args.instrument else ''
+    call = f'  return fast_call([&] {{ return ImGui::{v.name}({", ".join(v.argnames)}); }});\n'
+    if args.instrument:
+        call = f'  BindingScope scope({func}_id);\n' + call
+    if not v.argtypes:
+        decl += f'static PyObject* {func}(PyObject*, PyObject*)\n{{\n{call}}}\n\n'
+        flags = 'METH_NOARGS'
+    else:
+        count = len(v.argtypes)
+        required = sum(d is None for d in v.argdefaults)
+        decl += f'static PyObject* {func}(PyObject*, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)\n{{\n'
+        kwlist = ', '.join(f'"{n}"' for n in v.argnames)
+        decl += f'  static char const* const kwlist[] = {{{kwlist}}};\n'
+        decl += f'  PyObject* argv[{count}];\n'
+        decl += f'  if (!fast_parse("{v.name}", args, nargs, kwnames, kwlist, {count}, {required}, argv))\n    return nullptr;\n'
+        for t, n, d in zip(v.argtypes, v.argnames, v.argdefaults):
+            decl += f'  {storage_type(t)} {n} = {"{}" if d is None else d};\n'
+        conversions = ' || '.join(f'(argv[{i}] && !fast_arg(argv[{i}], {n}))' for i, n in enumerate(v.argnames))
+        decl += f'  if ({conversions})\n    return nullptr;\n'
+        decl += call + '}\n\n'
+        flags = 'METH_FASTCALL | METH_KEYWORDS'
+    params = ', '.join(f'{n}: {fast_pytype(t)}' + ('' if d is None else f' = {fast_pydefault(d)}')
+                       for t, n, d in zip(v.argtypes, v.argnames, v.argdefaults))
+    doc = f'{v.name}({params}) -> {fast_pytype(v.rettype) or "None"}'
+    if v.doc:
+        doc += '\\n\\n' + v.doc
+    doc = doc.replace('"', '\\"')
+    decl += f'static PyMethodDef {func}_def = {{"{v.name}", (PyCFunction)(void(*)(void)){func}, {flags}, "{doc}"}};\n\n'
+    reg = f'  add_fast_function(m, {func}_def);\n'
+    if args.instrument:
+        reg = f'  {func}_id = im.id("{v.name}");\n' + reg
+    return decl, reg
+
 #-----------------------------------------
 
-cpp_src = f'''
+includes_src = f'''
 #include "{outname}.h"
 #include <imgui.h>
 #include <imgui_stdlib.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+#include <cstring>
+#include <string_view>
+#include <vector>
 
 namespace py = pybind11;
+'''
+
+intflag_src = '''  py::object int_flag = py::module_::import("enum").attr("IntFlag");
+  py::object int_enum = py::module_::import("enum").attr("IntEnum");
 
-void bind_imgui_to_py(py::module& m)
-{{
 '''
 
-cpp_src += manual_impl_pre
+# pieces of the binding function in registration order, with the file scope code they
+# need ('helpers', 'types', 'cmdbuf', 'fastcall', 'lazy'), 'intflag' for the enum classes
+# above and 'uncounted' for functions --instrument does not count, plus their own file
+# scope code `decl`. --shards assigns them to a part by their `key` (the first name of
+# their export_api_list line, enum or manual section), the same for every run.
+# With --lazy, units defining the module attributes `lazy` are moved into a function of
+# their own, registered to run when one of these attributes is first looked up
+units = []
+def add_unit(src, *needs, decl='', lazy=(), key=None):
+    needs = set(needs)
+    key = key or lazy[0]
+    if args.lazy and lazy:
+        func = f'bind_lazy_{lazy[0]}'
+        if 'intflag' in needs:
+            src = intflag_src + src
+            needs.remove('intflag')
+        if args.instrument:
+            src = re.sub(r'^  m\.def\(', '  im.def(', src, flags=re.M)
+            if re.search(r'\bim\.', src):
+                src = instrument_impl_pre + src
+        decl += f'static void {func}(py::module& m)\n{{\n{src}}}\n\n'
+        src = ''.join(f'  lazy_attr("{name}", &{func});\n' for name in lazy)
+        needs.add('lazy')
+    units.append((needs, src, decl, key))
+
+add_unit(manual_impl_vec[args.vec] + manual_impl_pre, 'helpers', 'types', key='manual_pre')
+if args.labels:
+    add_unit(labels_impl_pre, key='labels')
 
 for e in imgui_enums:
-    cpp_src += f'  py::enum_<{e.cppname}>(m, "{e.pyname}", py::arithmetic())\n'
+    if args.enums == 'int':
+        # plain ints: bound functions take them without any conversion
+        doc = '\\n'.join(f'{f[0]}: {f[2]}'.replace('\\', '\\\\').replace('"', '\\"') for f in e.fields if f[2])
+        enum_src = f'  {{\n    py::module_ e = m.def_submodule("{e.pyname}", "{doc}");\n'
+        for f in e.fields:
+            enum_src += f'    e.attr("{f[0]}") = int({f[1]});\n'
+        add_unit(enum_src + '  }\n\n', lazy=(e.pyname,))
+        continue
+    if args.enums == 'intflag':
+        cls = 'int_flag' if e.pyname.endswith('Flags') else 'int_enum'
+        enum_src = f'  m.attr("{e.pyname}") = {cls}("{e.pyname}", py::make_tuple(\n'
+        enum_src += ',\n'.join(f'    py::make_tuple("{f[0]}", int({f[1]}))' for f in e.fields)
+        add_unit(enum_src + '), py::arg("module") = m.attr("__name__"));\n\n', 'intflag', lazy=(e.pyname,))
+        continue
+    enum_src = f'  py::enum_<{e.cppname}>(m, "{e.pyname}", py::arithmetic())\n'
     for f in e.fields:
         doc = f[2]
         if doc:
-            docstr = ', "'+doc.replace('"', '\\"')+'"'
+            docstr = ', "'+doc.replace('\\', '\\\\').replace('"', '\\"')+'"'
         else:
             docstr = ''
-        cpp_src += f'    .value("{f[0]}", {f[1]}{docstr})\n'
-    cpp_src += '  ;\n\n'
-
-for name in filter(lambda x: x!='', itertools.chain.from_iterable(map(lambda x:x.split(), export_api_list.split('\n')))):
-    if name[0] == '[': # manual-implement mark
+        enum_src += f'    .value("{f[0]}", {f[1]}{docstr})\n'
+    enum_src += '  ;\n'
+    if e.cppname == 'ImGuiKey':
+        # a typed enum, unlike the flags: functions only take it once it is registered, and
+        # also take a plain int as before
+        add_unit(enum_src + '  py::implicitly_convertible<int, ImGuiKey>();\n\n', key=e.pyname)
         continue
-    if name in imgui_api_map:
-        variants = imgui_api_map[name]
-        if len(variants) == 1:
-            v = [i for i in variants][0]
-            if not v.supported:
-                print(f'API {name} is not supported')
-                continue
-            cpp_src += f'  m.def("{name}", &ImGui::{name}{v.pyarg()}{v.docarg()});\n'
+    add_unit(enum_src + '\n', lazy=(e.pyname,))
+
+recorded_api_list = [] # (opcode, api) of every generated binding, for CommandBuffer
+
+# functions also overloaded by hand, which must be bound before the manual overloads
+manual_names = set(re.findall(r'^  m\.def\("(\w+)"', manual_impl_post, re.M))
+
+# each line of export_api_list is a group of related functions, bound together on first
+# access with --lazy
+for line in export_api_list.split('\n'):
+    group = [] # (name, src, needs, decl) of every binding of the line
+    for name in line.split():
+        if name[0] == '[': # manual-implement mark
+            continue
+        if name in imgui_api_map:
+            variants = imgui_api_map[name]
+            if len(variants) == 1:
+                v = variants[0]
+                value = value_function(v)
+                if value:
+                    group.append((name, f'  m.def("{name}", {value});\n', (), ''))
+                    continue
+                if not v.supported:
+                    print(f'API {name} is not supported')
+                    continue
+                fast = args.fastcall and fast_function(v)
+                label = args.labels and label_function(v)
+                if fast:
+                    group.append((name, fast[1], ('fastcall',), fast[0]))
+                elif label:
+                    group.append((name, f'  m.def("{name}", {label}{v.policyarg()}{v.pyarg()}{v.docarg()});\n', (), ''))
+                else:
+                    group.append((name, f'  m.def("{name}", &ImGui::{name}{v.policyarg()}{v.pyarg()}{v.docarg()});\n', (), ''))
+                recorded_api_list.append((f'CommandOp_{name}', v))
+            else:
+                hasSupportedVariant = False
+                for v in variants:
+                    if v.supported:
+                        hasSupportedVariant = True
+                        label = args.labels and label_function(v)
+                        if label:
+                            group.append((name, f'  m.def("{name}", {label}{v.policyarg()}{v.pyarg()}{v.docarg()});\n', (), ''))
+                        else:
+                            group.append((name, f'  m.def("{name}", py::overload_cast<{", ".join(v.argtypes)}>(&ImGui::{name}){v.policyarg()}{v.pyarg()}{v.docarg()});\n', (), ''))
+                        recorded_api_list.append((f'CommandOp_{name}_{"".join(map(mangled_type, v.argtypes)) or "Void"}', v))
+                if not hasSupportedVariant:
+                    print(f'API {name} is not supported')
         else:
-            hasSupportedVariant = False
-            for v in variants:
-                if v.supported:
-                    hasSupportedVariant = True
-                    cpp_src += f'  m.def("{name}", py::overload_cast<{", ".join(v.argtypes)}>(&ImGui::{name}){v.pyarg()}{v.docarg()});\n'
-            if not hasSupportedVariant:
-                print(f'API {name} is not supported')
+            print(f'declare of function "{name}" cannot be found')
+    names = list(dict.fromkeys(name for name, src, needs, decl in group))
+    if args.lazy and group and not manual_names.intersection(names):
+        add_unit(''.join(src for name, src, needs, decl in group),
+                 *set().union(*(needs for name, src, needs, decl in group)),
+                 decl=''.join(decl for name, src, needs, decl in group), lazy=tuple(names))
     else:
-        print(f'declare of function "{name}" cannot be found')
+        for name, src, needs, decl in group:
+            add_unit(src, *needs, decl=decl, key=names[0])
 
-cpp_src += manual_impl_post
-cpp_src += '\n}\n'
+add_unit(manual_impl_post, 'helpers', 'types', key='manual_post')
 
+cmdbuf_src = cmdbuf_impl_pre
+cmdbuf_src += 'enum CommandOp : uint16_t\n{\n'
+cmdbuf_src += ''.join(f'  {op},\n' for op, v in recorded_api_list)
+cmdbuf_src += manual_cmdbuf_ops.lstrip('\n')
+cmdbuf_src += '};\n\n'
 
-with open(outname+'.cpp', 'w') as cpp:
-    cpp.write(cpp_src)
+cmdbuf_src += '''py::list ReplayCommandBuffer(CommandBuffer const& cb)
+{
+  if (!cb.openIfs.empty())
+    throw std::runtime_error("CommandBuffer has If() without matching EndIf()");
+  py::list results;
+  for (int i = 0; i < cb.numResults; ++i)
+    results.append(py::none());
+  std::vector<char> truth(cb.numResults, 0); // consulted by If()
+  auto result = [&](int slot, bool t, py::object value) {
+    truth[slot] = t;
+    results[slot] = std::move(value);
+  };
+  CommandReader r{cb.data.data()};
+  char const* end = cb.data.data() + cb.data.size();
+  while (r.p < end) {
+    switch (r.get<uint16_t>()) {
+'''
+for op, v in recorded_api_list:
+    cmdbuf_src += f'    case {op}: {{\n'
+    if v.rettype != 'void':
+        cmdbuf_src += '      auto slot = r.get<int>();\n'
+    for t, n in zip(v.argtypes, v.argnames):
+        cmdbuf_src += f'      auto {n} = r.get<{storage_type(t)}>();\n'
+    call = f'ImGui::{v.name}({", ".join(v.argnames)})'
+    if v.rettype == 'void':
+        cmdbuf_src += f'      {call};\n'
+    elif v.rettype == 'bool':
+        cmdbuf_src += f'      bool ret = {call};\n'
+        cmdbuf_src += '      result(slot, ret, py::bool_(ret));\n'
+    elif '*' in v.rettype and 'char' not in v.rettype:
+        cmdbuf_src += f'      result(slot, true, py::cast({call}, py::return_value_policy::reference));\n'
+    else:
+        cmdbuf_src += f'      result(slot, true, py::cast({call}));\n'
+    cmdbuf_src += '    } break;\n'
+cmdbuf_src += manual_cmdbuf_replay.lstrip('\n')
+cmdbuf_src += '''    default:
+      throw std::runtime_error("corrupted CommandBuffer");
+    }
+  }
+  return results;
+}
+
+} // namespace
+
+'''
+
+cmdbuf_bind_src = '''
+  py::class_<CommandBuffer> cmdbuf(m, "CommandBuffer", "Records calls into a compact binary stream for Replay(). Methods mirror the module API; those with a return value return the index of their result slot.");
+'''
+cmdbuf_bind_src += manual_cmdbuf_record
+for op, v in recorded_api_list:
+    params = ''.join(f', {t} {n}' for t, n in zip(v.argtypes, v.argnames))
+    cmdbuf_bind_src += f'    .def("{v.name}", [](CommandBuffer& cb{params}) {{ cb.op({op});'
+    if v.rettype != 'void':
+        cmdbuf_bind_src += ' int slot = cb.result();'
+    cmdbuf_bind_src += ''.join(f' cb.put({n});' for n in v.argnames)
+    if v.rettype != 'void':
+        cmdbuf_bind_src += ' return slot;'
+    cmdbuf_bind_src += f' }}{v.pyarg()}{v.docarg()})\n'
+cmdbuf_bind_src += '''  ;
+
+  m.def("Replay", &ReplayCommandBuffer, py::arg("buffer"), "run every command recorded in `buffer`, returns the list of results indexed by slot (None for calls skipped by If())");
+'''
+
+add_unit(cmdbuf_bind_src, 'cmdbuf', lazy=('CommandBuffer', 'Replay'))
+if args.instrument:
+    add_unit(instrument_impl_post, 'uncounted', key='instrument')
+if args.lazy:
+    add_unit(lazy_impl_post, 'lazy', 'uncounted', key='lazy')
+
+# one .cpp file defining `func` with `shard_units`, preceded by the file scope code they need
+# source of a binding function calling `units` in order
+def function_src(func, units):
+    body = ''
+    has_intflag = False
+    for unit_needs, unit_src, decl, key in units:
+        if 'intflag' in unit_needs and not has_intflag:
+            body += intflag_src
+            has_intflag = True
+        if args.instrument and 'uncounted' not in unit_needs:
+            unit_src = re.sub(r'^  m\.def\(', '  im.def(', unit_src, flags=re.M)
+        body += unit_src
+    src = f'\nvoid {func}(py::module& m)\n{{\n'
+    if args.instrument and re.search(r'\bim\.', body):
+        src += instrument_impl_pre
+    return src + body + '\n}\n'
 
+# source file of the binding functions `funcs`, (name, units) each
+def shard_src(funcs):
+    shard_units = [unit for func, func_units in funcs for unit in func_units]
+    needs = set().union(*(unit_needs for unit_needs, unit_src, decl, key in shard_units))
+    src = includes_src
+    if 'helpers' in needs:
+        src += manual_impl_helpers
+    if 'types' in needs:
+        src += manual_impl_types
+    if args.labels:
+        src += labels_impl_helpers
+    if args.instrument:
+        src += instrument_impl_helpers
+    if 'cmdbuf' in needs:
+        src += cmdbuf_src
+    if 'fastcall' in needs:
+        src += fastcall_impl_helpers
+    if 'lazy' in needs:
+        src += lazy_impl_helpers
+    src += ''.join(decl for unit_needs, unit_src, decl, key in shard_units)
+    return src + ''.join(function_src(func, func_units) for func, func_units in funcs)
+
+out_files = [(outname+'.h', h_src)]
+if args.labels:
+    out_files.append((outname+'_labels.cpp', labels_impl_internal))
+if args.shards <= 1:
+    out_files.append((outname+'.cpp', shard_src([('bind_imgui_to_py', units)])))
+else:
+    # each run of units of the same key is a function of the part its key hashes to, so that
+    # adding or removing a binding only changes its own part (and the short main file, which
+    # calls the functions in registration order). The manual sections and the CommandBuffer,
+    # the slowest to compile, are spread over the first parts instead, so parts are only
+    # about the same size
+    runs = [list(run) for key, run in itertools.groupby(units, key=lambda unit: unit[3])]
+    heavy = [run[0][3] for run in runs if {'types', 'cmdbuf'} & run[0][0]]
+    parts = [[] for k in range(args.shards)]
+    calls = []
+    for run in runs:
+        key = run[0][3]
+        if key in heavy:
+            k = heavy.index(key) % args.shards
+        else:
+            k = int(hashlib.sha256(key.encode()).hexdigest(), 16) % args.shards
+        func = f'bind_imgui_part{k}_{len(parts[k])}'
+        parts[k].append((func, run))
+        calls.append(func)
+    main_src = f'\n#include "{outname}.h"\n\nnamespace py = pybind11;\n\n'
+    main_src += ''.join(f'void {func}(py::module& m);\n' for func in calls)
+    main_src += '\nvoid bind_imgui_to_py(py::module& m)\n{\n'
+    main_src += ''.join(f'  {func}(m);\n' for func in calls)
+    main_src += '}\n'
+    out_files.append((outname+'.cpp', main_src))
+    for k, funcs in enumerate(parts):
+        out_files.append((f'{outname}_part{k}.cpp', shard_src(funcs)))
+
+# only touch files whose content changed, so that their mtime does not trigger a rebuild
+out_of_date = []
+for path, src in out_files:
+    if os.path.exists(path):
+        with open(path) as f:
+            if f.read() == src:
+                continue
+    out_of_date.append(path)
+    if args.check:
+        print(f'{path} is out of date')
+    else:
+        with open(path, 'w') as f:
+            f.write(src)
+# files of a previous run with more --shards or with --labels, which a build globbing
+# the output files would still compile
+stale = {path for path in glob.glob(glob.escape(outname) + '_*.cpp')
+         if re.fullmatch(r'_part\d+\.cpp|_labels\.cpp', path[len(outname):])}
+for path in sorted(stale - {path for path, src in out_files}):
+    out_of_date.append(path)
+    if args.check:
+        print(f'{path} is stale')
+    else:
+        os.remove(path)
+if args.check and out_of_date:
+    sys.exit(1)
@@ -2,9 +2,1968 @@
 #include "pybind11_imgui.h"
 #include <imgui.h>
 #include <imgui_stdlib.h>
+#include <pybind11/numpy.h>
+#include <pybind11/stl.h>
+#include <cstring>
+#include <string_view>
+#include <vector>
 
 namespace py = pybind11;
 
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <memory>
+#include <unordered_map>
+
+// ImGuiDataType of the elements in a buffer, ImGuiDataType_COUNT if there is none
+static ImGuiDataType buffer_data_type(py::buffer_info const& info)
+{
+  char code = info.format.empty() ? 0 : info.format.back();
+  if (info.format.size() > 1 && info.format[0] != '@' && info.format[0] != '=' && info.format[0] != '<')
+    return ImGuiDataType_COUNT; // non-native byte order
+  switch (code) {
+    case 'f': return info.itemsize == 4 ? ImGuiDataType_Float : ImGuiDataType_COUNT;
+    case 'd': return info.itemsize == 8 ? ImGuiDataType_Double : ImGuiDataType_COUNT;
+    case 'b': case 'h': case 'i': case 'l': case 'q':
+      switch (info.itemsize) {
+        case 1: return ImGuiDataType_S8;
+        case 2: return ImGuiDataType_S16;
+        case 4: return ImGuiDataType_S32;
+        case 8: return ImGuiDataType_S64;
+      }
+      break;
+    case 'B': case 'H': case 'I': case 'L': case 'Q':
+      switch (info.itemsize) {
+        case 1: return ImGuiDataType_U8;
+        case 2: return ImGuiDataType_U16;
+        case 4: return ImGuiDataType_U32;
+        case 8: return ImGuiDataType_U64;
+      }
+      break;
+  }
+  return ImGuiDataType_COUNT;
+}
+
+// writable, contiguous 1 to 4 component buffer for the *ScalarN widgets
+static py::buffer_info request_scalar_buffer(py::buffer& value, ImGuiDataType& type)
+{
+  py::buffer_info info = value.request(true);
+  type = buffer_data_type(info);
+  if (type == ImGuiDataType_COUNT)
+    throw py::type_error("unsupported buffer format '" + info.format + "'");
+  if (info.ndim > 1 || (info.ndim == 1 && info.size > 1 && info.strides[0] != info.itemsize))
+    throw py::value_error("expected a contiguous 1-d buffer");
+  if (info.size < 1 || info.size > 4)
+    throw std::range_error("number of component not in range [1,4]");
+  return info;
+}
+
+// convert `src` to `type` and store it in `dst`, which must be large enough for any ImGuiDataType
+static void cast_data_type(py::handle src, ImGuiDataType type, void* dst)
+{
+#define TYPE_CASE(X, T) \
+    case ImGuiDataType_##X: *static_cast<T*>(dst) = py::cast<T>(src); break
+  switch(type) {
+    TYPE_CASE(S8, int8_t);
+    TYPE_CASE(U8, uint8_t);
+    TYPE_CASE(S16, int16_t);
+    TYPE_CASE(U16, uint16_t);
+    TYPE_CASE(S32, int32_t);
+    TYPE_CASE(U32, uint32_t);
+    TYPE_CASE(S64, int64_t);
+    TYPE_CASE(U64, uint64_t);
+    TYPE_CASE(Float, float);
+    TYPE_CASE(Double, double);
+    default:
+      throw std::runtime_error("unsupported data type");
+  }
+#undef TYPE_CASE
+}
+
+// 1-d buffer of integers of any width, for offsets, indices and colors
+static py::buffer_info request_int_buffer(py::handle obj, ImGuiDataType& type, char const* what)
+{
+  py::buffer_info info = py::reinterpret_borrow<py::buffer>(obj).request();
+  type = buffer_data_type(info);
+  if (type == ImGuiDataType_Float || type == ImGuiDataType_Double || type == ImGuiDataType_COUNT)
+    throw py::type_error(std::string(what) + " must be a buffer of integers");
+  if (info.ndim != 1)
+    throw py::value_error(std::string(what) + " must be a 1-d buffer");
+  return info;
+}
+
+static uint64_t int_buffer_at(py::buffer_info const& info, ImGuiDataType type, ssize_t i)
+{
+  char const* p = static_cast<char const*>(info.ptr) + i * info.strides[0];
+  switch (type) {
+    case ImGuiDataType_S8:  return *reinterpret_cast<int8_t const*>(p);
+    case ImGuiDataType_U8:  return *reinterpret_cast<uint8_t const*>(p);
+    case ImGuiDataType_S16: return *reinterpret_cast<int16_t const*>(p);
+    case ImGuiDataType_U16: return *reinterpret_cast<uint16_t const*>(p);
+    case ImGuiDataType_S32: return *reinterpret_cast<int32_t const*>(p);
+    case ImGuiDataType_U32: return *reinterpret_cast<uint32_t const*>(p);
+    case ImGuiDataType_S64: return *reinterpret_cast<int64_t const*>(p);
+    default:                return *reinterpret_cast<uint64_t const*>(p);
+  }
+}
+
+// element at `p` of a buffer of `type`, converted to double
+static double number_at(char const* p, ImGuiDataType type)
+{
+  switch (type) {
+    case ImGuiDataType_Float:  return *reinterpret_cast<float const*>(p);
+    case ImGuiDataType_Double: return *reinterpret_cast<double const*>(p);
+    case ImGuiDataType_S8:     return *reinterpret_cast<int8_t const*>(p);
+    case ImGuiDataType_U8:     return *reinterpret_cast<uint8_t const*>(p);
+    case ImGuiDataType_S16:    return *reinterpret_cast<int16_t const*>(p);
+    case ImGuiDataType_U16:    return *reinterpret_cast<uint16_t const*>(p);
+    case ImGuiDataType_S32:    return *reinterpret_cast<int32_t const*>(p);
+    case ImGuiDataType_U32:    return *reinterpret_cast<uint32_t const*>(p);
+    case ImGuiDataType_S64:    return double(*reinterpret_cast<int64_t const*>(p));
+    default:                   return double(*reinterpret_cast<uint64_t const*>(p));
+  }
+}
+
+namespace {
+
+// N rows of `cols` numbers for the batched ImDrawList primitives: a N x cols buffer, or a flat one of N*cols numbers
+struct BufferRows
+{
+  py::buffer_info info;
+  ImGuiDataType type;
+  ssize_t rows, row_stride, col_stride;
+
+  double value(ssize_t r, ssize_t c) const
+  {
+    return number_at(static_cast<char const*>(info.ptr) + r * row_stride + c * col_stride, type);
+  }
+
+  float at(ssize_t r, ssize_t c) const { return float(value(r, c)); }
+};
+
+static BufferRows request_rows(py::handle obj, ssize_t cols, char const* what)
+{
+  BufferRows rows{py::reinterpret_borrow<py::buffer>(obj).request(), ImGuiDataType_COUNT, 0, 0, 0};
+  rows.type = buffer_data_type(rows.info);
+  if (rows.type == ImGuiDataType_COUNT)
+    throw py::type_error(std::string(what) + ": unsupported buffer format '" + rows.info.format + "'");
+  if (rows.info.ndim == 2 && rows.info.shape[1] == cols) {
+    rows.rows = rows.info.shape[0];
+    rows.row_stride = rows.info.strides[0];
+    rows.col_stride = rows.info.strides[1];
+  } else if (rows.info.ndim == 1 && rows.info.size % cols == 0) {
+    rows.rows = rows.info.size / cols;
+    rows.row_stride = rows.info.strides[0] * cols;
+    rows.col_stride = rows.info.strides[0];
+  } else {
+    throw py::value_error(std::string(what) + " must be a N x " + std::to_string(cols) + " buffer");
+  }
+  if (rows.rows > INT_MAX)
+    throw py::value_error(std::string(what) + ": too many rows");
+  return rows;
+}
+
+// one value per row, from a 1-d buffer of N numbers or a single number used for every row
+struct BufferColumn
+{
+  py::buffer_info info;
+  ImGuiDataType type = ImGuiDataType_COUNT;
+  double value = 0;
+
+  double at(ssize_t i) const
+  {
+    return type == ImGuiDataType_COUNT ? value : number_at(static_cast<char const*>(info.ptr) + i * info.strides[0], type);
+  }
+};
+
+static BufferColumn request_column(py::handle obj, ssize_t rows, char const* what)
+{
+  BufferColumn column;
+  if (!PyObject_CheckBuffer(obj.ptr())) {
+    column.value = py::cast<double>(obj);
+    return column;
+  }
+  column.info = py::reinterpret_borrow<py::buffer>(obj).request();
+  column.type = buffer_data_type(column.info);
+  if (column.type == ImGuiDataType_COUNT)
+    throw py::type_error(std::string(what) + ": unsupported buffer format '" + column.info.format + "'");
+  if (column.info.ndim != 1 || column.info.size != rows)
+    throw py::value_error(std::string(what) + " must be a number or a 1-d buffer with one entry per row");
+  return column;
+}
+
+} // namespace
+
+// ImGuiID of a StateStore key: an int, or a str hashed like a widget label on the current ID stack
+static ImGuiID state_key(py::handle key)
+{
+  if (PyLong_Check(key.ptr()))
+    return key.cast<ImGuiID>();
+  return ImGui::GetID(key.cast<std::string>().c_str());
+}
+
+// sample i of a float64 (or negatively strided float32) buffer, the values_getter of PlotLines/PlotHistogram
+template <class T>
+static float plot_value(void* data, int i)
+{
+  auto& info = *static_cast<py::buffer_info*>(data);
+  return float(*reinterpret_cast<T const*>(static_cast<char const*>(info.ptr) + i * info.strides[0]));
+}
+
+// draws the samples of a 1-d float32/float64 buffer in place with ImGui::PlotLines or ImGui::PlotHistogram
+template <class Plot, class PlotGetter>
+static void plot_buffer(Plot plot, PlotGetter plot_getter, char const* label, py::buffer& values, int offset,
+                        char const* overlay, float scale_min, float scale_max, ImVec2 size)
+{
+  py::buffer_info info = values.request();
+  ImGuiDataType type = buffer_data_type(info);
+  if (type != ImGuiDataType_Float && type != ImGuiDataType_Double)
+    throw py::type_error("values must be a buffer of float32 or float64");
+  if (info.ndim != 1)
+    throw py::value_error("values must be a 1-d buffer");
+  if (info.size > INT_MAX)
+    throw py::value_error("too many values");
+  int count = int(info.size);
+  if (type == ImGuiDataType_Float && info.strides[0] >= 0 && info.strides[0] <= INT_MAX)
+    plot(label, static_cast<float const*>(info.ptr), count, offset, overlay, scale_min, scale_max, size, int(info.strides[0]));
+  else if (type == ImGuiDataType_Float)
+    plot_getter(label, &plot_value<float>, &info, count, offset, overlay, scale_min, scale_max, size);
+  else
+    plot_getter(label, &plot_value<double>, &info, count, offset, overlay, scale_min, scale_max, size);
+}
+
+// draws lines [0, count) with TextUnformatted, only visiting the unclipped ones
+template <class GetLine>
+static void clipped_text_lines(ssize_t count, py::object const& colors, GetLine&& get_line)
+{
+  if (count > INT_MAX)
+    throw py::value_error("too many lines, ImGuiListClipper counts them in an int");
+  py::buffer_info colinfo;
+  ImGuiDataType coltype = ImGuiDataType_COUNT;
+  if (!colors.is_none()) {
+    colinfo = request_int_buffer(colors, coltype, "colors");
+    if (colinfo.size != count)
+      throw py::value_error("colors must have one entry per line");
+  }
+  ImGuiListClipper clipper;
+  clipper.Begin(int(count));
+  while (clipper.Step()) {
+    for (int i = clipper.DisplayStart; i < clipper.DisplayEnd; ++i) {
+      std::string_view line = get_line(i);
+      if (coltype != ImGuiDataType_COUNT)
+        ImGui::PushStyleColor(ImGuiCol_Text, ImU32(int_buffer_at(colinfo, coltype, i)));
+      ImGui::TextUnformatted(line.data(), line.data() + line.size());
+      if (coltype != ImGuiDataType_COUNT)
+        ImGui::PopStyleColor();
+    }
+  }
+  clipper.End();
+}
+
+namespace {
+
+// column of TableColumns: a 1-d numeric buffer drawn with a printf format, or a sequence of str
+struct TableColumn
+{
+  py::buffer_info info;
+  ImGuiDataType type = ImGuiDataType_COUNT; // ImGuiDataType_COUNT for str columns
+  std::string format;
+  std::vector<py::object> items; // str columns: the items, kept alive for `strings`
+  std::vector<std::string_view> strings; // UTF-8 of `items`
+
+  bool is_signed() const
+  {
+    return type == ImGuiDataType_S8 || type == ImGuiDataType_S16 || type == ImGuiDataType_S32 || type == ImGuiDataType_S64;
+  }
+
+  // text of cell `row`, formatted in `buf` for numeric columns
+  std::string_view text(int row, char (&buf)[128]) const
+  {
+    int size;
+    if (type == ImGuiDataType_Float || type == ImGuiDataType_Double)
+      size = snprintf(buf, sizeof(buf), format.c_str(), number_at(static_cast<char const*>(info.ptr) + row * info.strides[0], type));
+    else if (type == ImGuiDataType_COUNT)
+      return strings[row];
+    else if (is_signed())
+      size = snprintf(buf, sizeof(buf), format.c_str(), (long long)int64_t(int_buffer_at(info, type, row)));
+    else
+      size = snprintf(buf, sizeof(buf), format.c_str(), (unsigned long long)int_buffer_at(info, type, row));
+    return std::string_view(buf, size_t(std::clamp(size, 0, int(sizeof(buf)) - 1)));
+  }
+
+  // <0, 0, >0 as row a sorts before, with or after row b; NaNs sort last
+  int compare(int a, int b) const
+  {
+    if (type == ImGuiDataType_COUNT)
+      return strings[a].compare(strings[b]);
+    if (type == ImGuiDataType_Float || type == ImGuiDataType_Double) {
+      double x = number_at(static_cast<char const*>(info.ptr) + a * info.strides[0], type);
+      double y = number_at(static_cast<char const*>(info.ptr) + b * info.strides[0], type);
+      if (std::isnan(x) || std::isnan(y))
+        return int(std::isnan(x)) - int(std::isnan(y));
+      return (x > y) - (x < y);
+    }
+    uint64_t x = int_buffer_at(info, type, a), y = int_buffer_at(info, type, b);
+    if (is_signed())
+      return (int64_t(x) > int64_t(y)) - (int64_t(x) < int64_t(y));
+    return (x > y) - (x < y);
+  }
+};
+
+// `format` checked to hold one conversion of a double (float columns) or of a long long
+// (integer columns, its length modifier is replaced by ll), so that it is safe to pass to snprintf
+static std::string column_format(std::string const& format, ImGuiDataType type)
+{
+  bool integer = type != ImGuiDataType_Float && type != ImGuiDataType_Double;
+  std::string checked;
+  int conversions = 0;
+  for (size_t i = 0; i < format.size();) {
+    if (format[i] != '%' || (i+1 < format.size() && format[i+1] == '%')) {
+      size_t n = format[i] == '%' ? 2 : 1;
+      checked += format.substr(i, n);
+      i += n;
+      continue;
+    }
+    size_t spec = i + 1;
+    while (spec < format.size() && std::strchr("-+ #0123456789.", format[spec]) && format[spec])
+      ++spec;
+    size_t conv = spec;
+    while (conv < format.size() && std::strchr("hlLjzt", format[conv]) && format[conv])
+      ++conv;
+    char c = conv < format.size() ? format[conv] : 0;
+    if (!c || !std::strchr(integer ? "diouxX" : "eEfFgGaA", c))
+      throw py::value_error("format '" + format + "' has no conversion for " + (integer ? "an integer" : "a float") + " column");
+    checked += format.substr(i, spec - i) + (integer ? "ll" : "") + c;
+    ++conversions;
+    i = conv + 1;
+  }
+  if (conversions != 1)
+    throw py::value_error("format '" + format + "' must have exactly one conversion");
+  return checked;
+}
+
+} // namespace
+
+// kind of value of each ImGuiStyleVar: 'f' float, 'v' ImVec2, ' ' unknown
+static char const style_var_kinds[] = "ffvffvvffffvffvvfvffffffvvfvvf";
+
+// text edited in place by InputText/InputTextMultiline, grown through ImGuiInputTextFlags_CallbackResize
+struct TextBuffer
+{
+  std::string text;
+  uint64_t    version = 0; // bumped on every modification
+};
+
+// ImGuiCol/ImGuiStyleVar overrides pushed and popped together by PushStylePreset/PopStylePreset
+struct StylePreset
+{
+  struct Var { ImGuiStyleVar idx; ImVec2 val; bool is_vec2; };
+  std::vector<std::pair<ImGuiCol, ImVec4>> colors;
+  std::vector<Var> vars;
+  std::vector<std::pair<int, int>> pushed; // colors and vars of each push not popped yet
+
+  void set_color(ImGuiCol idx, ImVec4 const& col)
+  {
+    if (idx < 0 || idx >= ImGuiCol_COUNT)
+      throw py::index_error("color index out of range");
+    for (auto& c : colors)
+      if (c.first == idx) {
+        c.second = col;
+        return;
+      }
+    colors.emplace_back(idx, col);
+  }
+  void set_var(ImGuiStyleVar idx, ImVec2 const& val, bool is_vec2)
+  {
+    if (idx < 0 || idx >= ImGuiStyleVar_COUNT)
+      throw py::index_error("style var index out of range");
+    // PushStyleVar() asserts on the wrong kind of value, check it before it is pushed
+    char kind = idx < int(sizeof(style_var_kinds)) - 1 ? style_var_kinds[idx] : ' ';
+    if (kind == (is_vec2 ? 'f' : 'v'))
+      throw py::type_error(std::string("style var ") + std::to_string(idx) + (is_vec2 ? " takes a float, not an ImVec2" : " takes an ImVec2, not a float"));
+    for (auto& v : vars)
+      if (v.idx == idx) {
+        v = {idx, val, is_vec2};
+        return;
+      }
+    vars.push_back({idx, val, is_vec2});
+  }
+};
+
+static void push_style_preset(StylePreset& preset)
+{
+  for (auto const& c : preset.colors)
+    ImGui::PushStyleColor(c.first, c.second);
+  for (auto const& v : preset.vars) {
+    if (v.is_vec2)
+      ImGui::PushStyleVar(v.idx, v.val);
+    else
+      ImGui::PushStyleVar(v.idx, v.val.x);
+  }
+  preset.pushed.emplace_back(int(preset.colors.size()), int(preset.vars.size()));
+}
+
+// pops what the matching push pushed, even if the preset was changed in between
+static void pop_style_preset(StylePreset& preset)
+{
+  if (preset.pushed.empty())
+    throw std::runtime_error("PopStylePreset() without a matching PushStylePreset()");
+  ImGui::PopStyleColor(preset.pushed.back().first);
+  ImGui::PopStyleVar(preset.pushed.back().second);
+  preset.pushed.pop_back();
+}
+
+// decides once per frame, after NewFrame(), whether the UI must be submitted again from Python
+// or the previous submission (e.g. a recorded CommandBuffer) can be replayed as is
+struct FrameWatch
+{
+  int         settle_frames;  // frames still rebuilt after a change, for UI state updated by that change
+  int         settle = 0;
+  int         frame = -1;     // frame of the last decision
+  bool        changed = true;
+  bool        invalid = true;
+  char const* reason = "";
+  std::vector<uint64_t> versions;
+  ImVec2      mouse_pos, display_size, framebuffer_scale;
+  bool        app_focus_lost = false;
+  int         render_metrics[3] = {-1, -1, -1};
+  uint64_t    rebuilt = 0, skipped = 0;
+
+  explicit FrameWatch(int settle_frames) : settle_frames(settle_frames) {}
+
+  // what changed since the previous decision, nullptr if nothing
+  char const* change(py::handle new_versions)
+  {
+    ImGuiIO const& io = ImGui::GetIO();
+    char const* what = nullptr;
+    if (invalid)
+      what = "invalidated";
+    else if (io.MousePos.x != mouse_pos.x || io.MousePos.y != mouse_pos.y || io.MouseWheel != 0.0f || io.MouseWheelH != 0.0f || io.InputQueueCharacters.Size > 0)
+      what = "input";
+    else if (io.AppFocusLost != app_focus_lost)
+      what = "focus";
+    else if (io.DisplaySize.x != display_size.x || io.DisplaySize.y != display_size.y ||
+             io.DisplayFramebufferScale.x != framebuffer_scale.x || io.DisplayFramebufferScale.y != framebuffer_scale.y)
+      what = "display";
+    else {
+      // a key or button down, or released in this frame (mouse buttons are keys as well)
+      for (int key = ImGuiKey_NamedKey_BEGIN; key < ImGuiKey_NamedKey_END && !what; ++key) {
+        ImGuiKeyData const& data = io.KeysData[key - ImGuiKey_KeysData_OFFSET];
+        if (data.Down || data.DownDurationPrev >= 0.0f)
+          what = "input";
+      }
+    }
+    // windows only move or resize through input, the display or the UI code itself, while layout
+    // settling (auto-fit, appearing windows...) shows as different render counts between frames
+    int metrics[3] = {io.MetricsRenderVertices, io.MetricsRenderIndices, io.MetricsRenderWindows};
+    if (!what && !std::equal(metrics, metrics + 3, render_metrics))
+      what = "layout";
+    std::copy(metrics, metrics + 3, render_metrics);
+
+    size_t n = 0;
+    bool new_version = false;
+    auto watch = [&](py::handle v) {
+      uint64_t version = PyLong_AsUnsignedLongLongMask(v.ptr());
+      if (version == uint64_t(-1) && PyErr_Occurred())
+        throw py::error_already_set();
+      if (n == versions.size())
+        versions.push_back(~version);
+      new_version |= versions[n] != version;
+      versions[n++] = version;
+    };
+    if (PyLong_Check(new_versions.ptr()))
+      watch(new_versions);
+    else if (!new_versions.is_none())
+      for (py::handle v : py::iter(new_versions))
+        watch(v);
+    new_version |= n != versions.size();
+    versions.resize(n);
+    if (!what && new_version)
+      what = "version";
+
+    mouse_pos = io.MousePos;
+    app_focus_lost = io.AppFocusLost;
+    display_size = io.DisplaySize;
+    framebuffer_scale = io.DisplayFramebufferScale;
+    invalid = false;
+    return what;
+  }
+};
+
+// key and mouse state of one frame, filled in place by GetInputSnapshot(). Key arrays are
+// indexed by ImGuiKey, only the named keys (ImGuiKey_NamedKey_BEGIN...) are set
+struct InputSnapshot
+{
+  bool  keys_down[ImGuiKey_NamedKey_END] = {};
+  bool  keys_pressed[ImGuiKey_NamedKey_END] = {};
+  bool  keys_released[ImGuiKey_NamedKey_END] = {};
+  bool  mouse_down[ImGuiMouseButton_COUNT] = {};
+  bool  mouse_clicked[ImGuiMouseButton_COUNT] = {};
+  bool  mouse_released[ImGuiMouseButton_COUNT] = {};
+  bool  mouse_double_clicked[ImGuiMouseButton_COUNT] = {};
+  float drag_delta[ImGuiMouseButton_COUNT][2] = {};
+  float mouse_pos[2] = {};
+  float mouse_delta[2] = {};
+  float mouse_wheel[2] = {}; // vertical, horizontal
+  int   key_mods = 0;
+  int   frame = -1;
+};
+
+// the whole input state is read in one pass so Python pays a single call per frame
+static void take_input_snapshot(InputSnapshot& s)
+{
+  ImGuiIO const& io = ImGui::GetIO();
+  for (int key = ImGuiKey_NamedKey_BEGIN; key < ImGuiKey_NamedKey_END; ++key) {
+    // the key data rules out most keys, only those which may have changed go through the full checks
+    ImGuiKeyData const& data = io.KeysData[key - ImGuiKey_KeysData_OFFSET];
+    s.keys_down[key] = data.Down && ImGui::IsKeyDown(ImGuiKey(key));
+    s.keys_pressed[key] = data.Down && ImGui::IsKeyPressed(ImGuiKey(key));
+    s.keys_released[key] = !data.Down && data.DownDurationPrev >= 0.0f && ImGui::IsKeyReleased(ImGuiKey(key));
+  }
+  for (int b = 0; b < ImGuiMouseButton_COUNT; ++b) {
+    s.mouse_down[b] = ImGui::IsMouseDown(b);
+    s.mouse_clicked[b] = ImGui::IsMouseClicked(b);
+    s.mouse_released[b] = ImGui::IsMouseReleased(b);
+    s.mouse_double_clicked[b] = ImGui::IsMouseDoubleClicked(b);
+    ImVec2 drag = ImGui::GetMouseDragDelta(b);
+    s.drag_delta[b][0] = drag.x;
+    s.drag_delta[b][1] = drag.y;
+  }
+  s.mouse_pos[0] = io.MousePos.x;
+  s.mouse_pos[1] = io.MousePos.y;
+  s.mouse_delta[0] = io.MouseDelta.x;
+  s.mouse_delta[1] = io.MouseDelta.y;
+  s.mouse_wheel[0] = io.MouseWheel;
+  s.mouse_wheel[1] = io.MouseWheelH;
+  s.key_mods = io.KeyMods;
+  s.frame = ImGui::GetFrameCount();
+}
+
+namespace {
+
+// generator or coroutine advanced by a Scheduler, one step (up to its next yield/await) at a time
+struct SchedulerTask
+{
+  py::object  task;
+  std::string name;
+  bool        done = false, cancelled = false;
+  bool        running = false;  // in step(), where it cannot be closed
+  py::object  result;           // value of the return statement once done
+  uint64_t    steps = 0, overruns = 0;
+  double      time_us = 0.0, last_run_us = 0.0, last_step_us = 0.0, max_step_us = 0.0;
+
+  // runs one step, returns false once the task has finished
+  bool step()
+  {
+    running = true;
+    py::object yielded;
+#if PY_VERSION_HEX >= 0x030A0000
+    PyObject* value = nullptr;
+    PySendResult r = PyIter_Send(task.ptr(), Py_None, &value);
+    running = false;
+    if (r == PYGEN_ERROR)
+      throw py::error_already_set();
+    if (r == PYGEN_RETURN) {
+      result = py::reinterpret_steal<py::object>(value);
+      return false;
+    }
+    yielded = py::reinterpret_steal<py::object>(value);
+#else
+    try {
+      yielded = task.attr("send")(py::none());
+      running = false;
+    } catch (py::error_already_set& e) {
+      running = false;
+      if (!e.matches(PyExc_StopIteration))
+        throw;
+      result = e.value().attr("value");
+      return false;
+    }
+#endif
+    // a coroutine awaiting an asyncio future would never be woken up
+    if (PyCoro_CheckExact(task.ptr()) && !yielded.is_none()) {
+      task.attr("close")();
+      throw std::runtime_error("task " + name + " awaited " + std::string(py::str(py::type::of(yielded).attr("__name__"))) +
+                               ": Scheduler coroutines can only await asyncio.sleep(0), they are not run by an event loop");
+    }
+    return true;
+  }
+
+  void cancel()
+  {
+    if (done || cancelled)
+      return;
+    cancelled = true;
+    if (!running) // a running task is closed by Run() once its step returns
+      task.attr("close")();
+  }
+};
+
+using SchedulerClock = std::chrono::steady_clock;
+
+inline double elapsed_us(SchedulerClock::time_point since)
+{
+  return std::chrono::duration<double, std::micro>(SchedulerClock::now() - since).count();
+}
+
+// round-robin over its tasks for a time budget per Run(), resuming where the previous Run() stopped.
+// The duration of the previous step of a task is taken as the estimate of its next one
+struct Scheduler
+{
+  std::vector<std::shared_ptr<SchedulerTask>> tasks;
+  size_t   next = 0;
+  double   budget_us;
+  uint64_t runs = 0, overruns = 0;
+  double   overrun_us = 0.0, last_run_us = 0.0;
+  bool     running = false;
+
+  explicit Scheduler(double budget_us) : budget_us(budget_us) {}
+
+  void run(double budget)
+  {
+    if (running)
+      throw std::runtime_error("Scheduler.Run() called from one of its own tasks");
+    running = true;
+    struct Done { bool& running; ~Done() { running = false; } } done{running};
+    for (auto& t : tasks)
+      t->last_run_us = 0.0;
+    auto start = SchedulerClock::now();
+    double elapsed = 0.0;
+    while (!tasks.empty() && elapsed < budget) {
+      next %= tasks.size();
+      auto t = tasks[next];
+      if (t->cancelled) {
+        t->done = true;
+        tasks.erase(tasks.begin() + next);
+        continue;
+      }
+      // a step expected to run past the budget waits for the next Run(), where it goes first
+      if (elapsed > 0.0 && t->last_step_us > budget - elapsed)
+        break;
+      auto step_start = SchedulerClock::now();
+      bool more;
+      try {
+        more = t->step();
+      } catch (...) {
+        t->done = true;
+        tasks.erase(tasks.begin() + next);
+        throw;
+      }
+      double step_us = elapsed_us(step_start);
+      elapsed = elapsed_us(start);
+      ++t->steps;
+      t->time_us += step_us;
+      t->last_run_us += step_us;
+      t->last_step_us = step_us;
+      t->max_step_us = std::max(t->max_step_us, step_us);
+      if (elapsed > budget && step_us > 0.0)
+        ++t->overruns; // this step ran past the end of the budget
+      if (more && t->cancelled) {
+        t->task.attr("close")(); // cancelled by itself during the step
+        more = false;
+      }
+      if (more)
+        ++next;
+      else {
+        t->done = true;
+        tasks.erase(tasks.begin() + next);
+      }
+    }
+    ++runs;
+    last_run_us = elapsed;
+    if (elapsed > budget) {
+      ++overruns;
+      overrun_us += elapsed - budget;
+    }
+  }
+};
+
+} // namespace
+
+namespace {
+
+struct CommandBuffer
+{
+  std::vector<char>   data;
+  std::vector<size_t> openIfs; // offsets of If() jump targets waiting for EndIf()
+  int numCommands = 0;
+  int numResults = 0;
+
+  template <class T>
+  void put(T const& v) {
+    size_t n = data.size();
+    data.resize(n + sizeof(T));
+    memcpy(data.data() + n, &v, sizeof(T));
+  }
+  void put(char const* s) {
+    uint32_t len = s ? uint32_t(strlen(s)) : UINT32_MAX;
+    put(len);
+    if (s)
+      data.insert(data.end(), s, s + len + 1);
+  }
+  void put(std::string_view s) {
+    put(uint32_t(s.size()));
+    data.insert(data.end(), s.begin(), s.end());
+    data.push_back(0);
+  }
+  void op(uint16_t code) {
+    put(code);
+    ++numCommands;
+  }
+  int result() {
+    int slot = numResults++;
+    put(slot);
+    return slot;
+  }
+  void clear() {
+    data.clear();
+    openIfs.clear();
+    numCommands = numResults = 0;
+  }
+};
+
+struct CommandReader
+{
+  char const* p;
+
+  template <class T>
+  T get() {
+    T v;
+    memcpy(&v, p, sizeof(T));
+    p += sizeof(T);
+    return v;
+  }
+};
+
+template <>
+char const* CommandReader::get<char const*>() {
+  uint32_t len = get<uint32_t>();
+  if (len == UINT32_MAX)
+    return nullptr;
+  char const* s = p;
+  p += len + 1;
+  return s;
+}
+
+template <>
+std::string_view CommandReader::get<std::string_view>() {
+  uint32_t len = get<uint32_t>();
+  std::string_view s(p, len);
+  p += len + 1;
+  return s;
+}
+
+enum CommandOp : uint16_t
+{
+  CommandOp_End,
+  CommandOp_BeginChild_StrImVec2BoolWindowFlags,
+  CommandOp_BeginChild_IDImVec2BoolWindowFlags,
+  CommandOp_EndChild,
+  CommandOp_IsWindowAppearing,
+  CommandOp_IsWindowCollapsed,
+  CommandOp_IsWindowFocused,
+  CommandOp_IsWindowHovered,
+  CommandOp_GetWindowPos,
+  CommandOp_GetWindowSize,
+  CommandOp_GetWindowWidth,
+  CommandOp_GetWindowHeight,
+  CommandOp_SetNextWindowPos,
+  CommandOp_SetNextWindowSize,
+  CommandOp_SetNextWindowContentSize,
+  CommandOp_SetNextWindowCollapsed,
+  CommandOp_SetNextWindowFocus,
+  CommandOp_SetNextWindowBgAlpha,
+  CommandOp_SetWindowPos_ImVec2Cond,
+  CommandOp_SetWindowPos_StrImVec2Cond,
+  CommandOp_SetWindowSize_ImVec2Cond,
+  CommandOp_SetWindowSize_StrImVec2Cond,
+  CommandOp_SetWindowCollapsed_BoolCond,
+  CommandOp_SetWindowCollapsed_StrBoolCond,
+  CommandOp_SetWindowFocus_Void,
+  CommandOp_SetWindowFocus_Str,
+  CommandOp_SetWindowFontScale,
+  CommandOp_GetContentRegionAvail,
+  CommandOp_GetContentRegionMax,
+  CommandOp_GetWindowContentRegionMin,
+  CommandOp_GetWindowContentRegionMax,
+  CommandOp_GetScrollX,
+  CommandOp_GetScrollY,
+  CommandOp_SetScrollX,
+  CommandOp_SetScrollY,
+  CommandOp_GetScrollMaxX,
+  CommandOp_GetScrollMaxY,
+  CommandOp_SetScrollHereX,
+  CommandOp_SetScrollHereY,
+  CommandOp_SetScrollFromPosX,
+  CommandOp_SetScrollFromPosY,
+  CommandOp_PushStyleColor_ColImU32,
+  CommandOp_PushStyleColor_ColImVec4,
+  CommandOp_PopStyleColor,
+  CommandOp_PushStyleVar_StyleVarFloat,
+  CommandOp_PushStyleVar_StyleVarImVec2,
+  CommandOp_PopStyleVar,
+  CommandOp_PushTabStop,
+  CommandOp_PopTabStop,
+  CommandOp_PushButtonRepeat,
+  CommandOp_PopButtonRepeat,
+  CommandOp_PushItemWidth,
+  CommandOp_PopItemWidth,
+  CommandOp_SetNextItemWidth,
+  CommandOp_CalcItemWidth,
+  CommandOp_PushTextWrapPos,
+  CommandOp_PopTextWrapPos,
+  CommandOp_Separator,
+  CommandOp_SameLine,
+  CommandOp_NewLine,
+  CommandOp_Spacing,
+  CommandOp_Dummy,
+  CommandOp_Indent,
+  CommandOp_Unindent,
+  CommandOp_BeginGroup,
+  CommandOp_EndGroup,
+  CommandOp_GetCursorPos,
+  CommandOp_GetCursorPosX,
+  CommandOp_GetCursorPosY,
+  CommandOp_SetCursorPos,
+  CommandOp_SetCursorPosX,
+  CommandOp_SetCursorPosY,
+  CommandOp_GetCursorStartPos,
+  CommandOp_GetCursorScreenPos,
+  CommandOp_SetCursorScreenPos,
+  CommandOp_AlignTextToFramePadding,
+  CommandOp_GetTextLineHeight,
+  CommandOp_GetTextLineHeightWithSpacing,
+  CommandOp_GetFrameHeight,
+  CommandOp_GetFrameHeightWithSpacing,
+  CommandOp_PopID,
+  CommandOp_Button,
+  CommandOp_SmallButton,
+  CommandOp_InvisibleButton,
+  CommandOp_ArrowButton,
+  CommandOp_RadioButton_StrBool,
+  CommandOp_ProgressBar,
+  CommandOp_Bullet,
+  CommandOp_BeginCombo,
+  CommandOp_EndCombo,
+  CommandOp_BeginListBox,
+  CommandOp_EndListBox,
+  CommandOp_TreeNode_Str,
+  CommandOp_TreePush_Str,
+  CommandOp_TreePop,
+  CommandOp_GetTreeNodeToLabelSpacing,
+  CommandOp_CollapsingHeader_StrTreeNodeFlags,
+  CommandOp_SetNextItemOpen,
+  CommandOp_Selectable_StrBoolSelectableFlagsImVec2,
+  CommandOp_GetMainViewport,
+  CommandOp_GetWindowDrawList,
+  CommandOp_GetBackgroundDrawList_Void,
+  CommandOp_GetForegroundDrawList_Void,
+  CommandOp_BeginMenuBar,
+  CommandOp_EndMenuBar,
+  CommandOp_BeginMainMenuBar,
+  CommandOp_EndMainMenuBar,
+  CommandOp_BeginMenu,
+  CommandOp_EndMenu,
+  CommandOp_MenuItem_StrStrBoolBool,
+  CommandOp_BeginTooltip,
+  CommandOp_EndTooltip,
+  CommandOp_BeginItemTooltip,
+  CommandOp_BeginPopup,
+  CommandOp_EndPopup,
+  CommandOp_OpenPopup_StrPopupFlags,
+  CommandOp_OpenPopup_IDPopupFlags,
+  CommandOp_OpenPopupOnItemClick,
+  CommandOp_CloseCurrentPopup,
+  CommandOp_BeginPopupContextItem,
+  CommandOp_BeginPopupContextWindow,
+  CommandOp_BeginPopupContextVoid,
+  CommandOp_IsPopupOpen,
+  CommandOp_BeginTable,
+  CommandOp_EndTable,
+  CommandOp_TableNextRow,
+  CommandOp_TableNextColumn,
+  CommandOp_TableSetColumnIndex,
+  CommandOp_TableSetupColumn,
+  CommandOp_TableSetupScrollFreeze,
+  CommandOp_TableHeadersRow,
+  CommandOp_TableHeader,
+  CommandOp_TableGetColumnCount,
+  CommandOp_TableGetColumnIndex,
+  CommandOp_TableGetRowIndex,
+  CommandOp_TableGetColumnName,
+  CommandOp_TableGetColumnFlags,
+  CommandOp_TableSetColumnEnabled,
+  CommandOp_TableSetBgColor,
+  CommandOp_TableGetSortSpecs,
+  CommandOp_ColorButton,
+  CommandOp_BeginTabBar,
+  CommandOp_EndTabBar,
+  CommandOp_EndTabItem,
+  CommandOp_TabItemButton,
+  CommandOp_SetTabItemClosed,
+  CommandOp_BeginDisabled,
+  CommandOp_EndDisabled,
+  CommandOp_SetItemDefaultFocus,
+  CommandOp_SetKeyboardFocusHere,
+  CommandOp_SetNextItemAllowOverlap,
+  CommandOp_IsItemHovered,
+  CommandOp_IsItemActive,
+  CommandOp_IsItemFocused,
+  CommandOp_IsItemClicked,
+  CommandOp_IsItemVisible,
+  CommandOp_IsItemEdited,
+  CommandOp_IsItemActivated,
+  CommandOp_IsItemDeactivated,
+  CommandOp_IsItemDeactivatedAfterEdit,
+  CommandOp_IsItemToggledOpen,
+  CommandOp_IsAnyItemHovered,
+  CommandOp_IsAnyItemActive,
+  CommandOp_IsAnyItemFocused,
+  CommandOp_GetItemID,
+  CommandOp_GetItemRectMin,
+  CommandOp_GetItemRectMax,
+  CommandOp_GetItemRectSize,
+  CommandOp_IsRectVisible_ImVec2,
+  CommandOp_IsRectVisible_ImVec2ImVec2,
+  CommandOp_BeginChildFrame,
+  CommandOp_EndChildFrame,
+  CommandOp_IsKeyDown,
+  CommandOp_IsKeyPressed,
+  CommandOp_IsKeyReleased,
+  CommandOp_SetNextFrameWantCaptureKeyboard,
+  CommandOp_IsMouseDown,
+  CommandOp_IsMouseClicked,
+  CommandOp_IsMouseReleased,
+  CommandOp_IsMouseDoubleClicked,
+  CommandOp_IsMouseHoveringRect,
+  CommandOp_IsAnyMouseDown,
+  CommandOp_GetMousePos,
+  CommandOp_GetMousePosOnOpeningCurrentPopup,
+  CommandOp_IsMouseDragging,
+  CommandOp_GetMouseDragDelta,
+  CommandOp_ResetMouseDragDelta,
+  CommandOp_GetMouseCursor,
+  CommandOp_SetMouseCursor,
+  CommandOp_SetNextFrameWantCaptureMouse,
+  CommandOp_GetClipboardText,
+  CommandOp_SetClipboardText,
+  CommandOp_If,
+  CommandOp_EndIf,
+  CommandOp_Begin,
+  CommandOp_BeginPopupModal,
+  CommandOp_BeginTabItem,
+  CommandOp_PushID_Str,
+  CommandOp_PushID_Int,
+  CommandOp_GetID,
+  CommandOp_Text,
+  CommandOp_Checkbox,
+  CommandOp_SetTooltip,
+  CommandOp_SetItemTooltip,
+};
+
+py::list ReplayCommandBuffer(CommandBuffer const& cb)
+{
+  if (!cb.openIfs.empty())
+    throw std::runtime_error("CommandBuffer has If() without matching EndIf()");
+  py::list results;
+  for (int i = 0; i < cb.numResults; ++i)
+    results.append(py::none());
+  std::vector<char> truth(cb.numResults, 0); // consulted by If()
+  auto result = [&](int slot, bool t, py::object value) {
+    truth[slot] = t;
+    results[slot] = std::move(value);
+  };
+  CommandReader r{cb.data.data()};
+  char const* end = cb.data.data() + cb.data.size();
+  while (r.p < end) {
+    switch (r.get<uint16_t>()) {
+    case CommandOp_End: {
+      ImGui::End();
+    } break;
+    case CommandOp_BeginChild_StrImVec2BoolWindowFlags: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto size = r.get<ImVec2>();
+      auto border = r.get<bool>();
+      auto window_flags = r.get<ImGuiWindowFlags>();
+      bool ret = ImGui::BeginChild(str_id, size, border, window_flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginChild_IDImVec2BoolWindowFlags: {
+      auto slot = r.get<int>();
+      auto id = r.get<ImGuiID>();
+      auto size = r.get<ImVec2>();
+      auto border = r.get<bool>();
+      auto window_flags = r.get<ImGuiWindowFlags>();
+      bool ret = ImGui::BeginChild(id, size, border, window_flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndChild: {
+      ImGui::EndChild();
+    } break;
+    case CommandOp_IsWindowAppearing: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsWindowAppearing();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsWindowCollapsed: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsWindowCollapsed();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsWindowFocused: {
+      auto slot = r.get<int>();
+      auto flags = r.get<ImGuiFocusedFlags>();
+      bool ret = ImGui::IsWindowFocused(flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsWindowHovered: {
+      auto slot = r.get<int>();
+      auto flags = r.get<ImGuiHoveredFlags>();
+      bool ret = ImGui::IsWindowHovered(flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_GetWindowPos: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetWindowPos()));
+    } break;
+    case CommandOp_GetWindowSize: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetWindowSize()));
+    } break;
+    case CommandOp_GetWindowWidth: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetWindowWidth()));
+    } break;
+    case CommandOp_GetWindowHeight: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetWindowHeight()));
+    } break;
+    case CommandOp_SetNextWindowPos: {
+      auto pos = r.get<ImVec2>();
+      auto cond = r.get<ImGuiCond>();
+      auto pivot = r.get<ImVec2>();
+      ImGui::SetNextWindowPos(pos, cond, pivot);
+    } break;
+    case CommandOp_SetNextWindowSize: {
+      auto size = r.get<ImVec2>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetNextWindowSize(size, cond);
+    } break;
+    case CommandOp_SetNextWindowContentSize: {
+      auto size = r.get<ImVec2>();
+      ImGui::SetNextWindowContentSize(size);
+    } break;
+    case CommandOp_SetNextWindowCollapsed: {
+      auto collapsed = r.get<bool>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetNextWindowCollapsed(collapsed, cond);
+    } break;
+    case CommandOp_SetNextWindowFocus: {
+      ImGui::SetNextWindowFocus();
+    } break;
+    case CommandOp_SetNextWindowBgAlpha: {
+      auto alpha = r.get<float>();
+      ImGui::SetNextWindowBgAlpha(alpha);
+    } break;
+    case CommandOp_SetWindowPos_ImVec2Cond: {
+      auto pos = r.get<ImVec2>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetWindowPos(pos, cond);
+    } break;
+    case CommandOp_SetWindowPos_StrImVec2Cond: {
+      auto name = r.get<char const*>();
+      auto pos = r.get<ImVec2>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetWindowPos(name, pos, cond);
+    } break;
+    case CommandOp_SetWindowSize_ImVec2Cond: {
+      auto size = r.get<ImVec2>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetWindowSize(size, cond);
+    } break;
+    case CommandOp_SetWindowSize_StrImVec2Cond: {
+      auto name = r.get<char const*>();
+      auto size = r.get<ImVec2>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetWindowSize(name, size, cond);
+    } break;
+    case CommandOp_SetWindowCollapsed_BoolCond: {
+      auto collapsed = r.get<bool>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetWindowCollapsed(collapsed, cond);
+    } break;
+    case CommandOp_SetWindowCollapsed_StrBoolCond: {
+      auto name = r.get<char const*>();
+      auto collapsed = r.get<bool>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetWindowCollapsed(name, collapsed, cond);
+    } break;
+    case CommandOp_SetWindowFocus_Void: {
+      ImGui::SetWindowFocus();
+    } break;
+    case CommandOp_SetWindowFocus_Str: {
+      auto name = r.get<char const*>();
+      ImGui::SetWindowFocus(name);
+    } break;
+    case CommandOp_SetWindowFontScale: {
+      auto scale = r.get<float>();
+      ImGui::SetWindowFontScale(scale);
+    } break;
+    case CommandOp_GetContentRegionAvail: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetContentRegionAvail()));
+    } break;
+    case CommandOp_GetContentRegionMax: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetContentRegionMax()));
+    } break;
+    case CommandOp_GetWindowContentRegionMin: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetWindowContentRegionMin()));
+    } break;
+    case CommandOp_GetWindowContentRegionMax: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetWindowContentRegionMax()));
+    } break;
+    case CommandOp_GetScrollX: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetScrollX()));
+    } break;
+    case CommandOp_GetScrollY: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetScrollY()));
+    } break;
+    case CommandOp_SetScrollX: {
+      auto scroll_x = r.get<float>();
+      ImGui::SetScrollX(scroll_x);
+    } break;
+    case CommandOp_SetScrollY: {
+      auto scroll_y = r.get<float>();
+      ImGui::SetScrollY(scroll_y);
+    } break;
+    case CommandOp_GetScrollMaxX: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetScrollMaxX()));
+    } break;
+    case CommandOp_GetScrollMaxY: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetScrollMaxY()));
+    } break;
+    case CommandOp_SetScrollHereX: {
+      auto center_x_ratio = r.get<float>();
+      ImGui::SetScrollHereX(center_x_ratio);
+    } break;
+    case CommandOp_SetScrollHereY: {
+      auto center_y_ratio = r.get<float>();
+      ImGui::SetScrollHereY(center_y_ratio);
+    } break;
+    case CommandOp_SetScrollFromPosX: {
+      auto local_x = r.get<float>();
+      auto center_x_ratio = r.get<float>();
+      ImGui::SetScrollFromPosX(local_x, center_x_ratio);
+    } break;
+    case CommandOp_SetScrollFromPosY: {
+      auto local_y = r.get<float>();
+      auto center_y_ratio = r.get<float>();
+      ImGui::SetScrollFromPosY(local_y, center_y_ratio);
+    } break;
+    case CommandOp_PushStyleColor_ColImU32: {
+      auto idx = r.get<ImGuiCol>();
+      auto col = r.get<ImU32>();
+      ImGui::PushStyleColor(idx, col);
+    } break;
+    case CommandOp_PushStyleColor_ColImVec4: {
+      auto idx = r.get<ImGuiCol>();
+      auto col = r.get<ImVec4>();
+      ImGui::PushStyleColor(idx, col);
+    } break;
+    case CommandOp_PopStyleColor: {
+      auto count = r.get<int>();
+      ImGui::PopStyleColor(count);
+    } break;
+    case CommandOp_PushStyleVar_StyleVarFloat: {
+      auto idx = r.get<ImGuiStyleVar>();
+      auto val = r.get<float>();
+      ImGui::PushStyleVar(idx, val);
+    } break;
+    case CommandOp_PushStyleVar_StyleVarImVec2: {
+      auto idx = r.get<ImGuiStyleVar>();
+      auto val = r.get<ImVec2>();
+      ImGui::PushStyleVar(idx, val);
+    } break;
+    case CommandOp_PopStyleVar: {
+      auto count = r.get<int>();
+      ImGui::PopStyleVar(count);
+    } break;
+    case CommandOp_PushTabStop: {
+      auto tab_stop = r.get<bool>();
+      ImGui::PushTabStop(tab_stop);
+    } break;
+    case CommandOp_PopTabStop: {
+      ImGui::PopTabStop();
+    } break;
+    case CommandOp_PushButtonRepeat: {
+      auto repeat = r.get<bool>();
+      ImGui::PushButtonRepeat(repeat);
+    } break;
+    case CommandOp_PopButtonRepeat: {
+      ImGui::PopButtonRepeat();
+    } break;
+    case CommandOp_PushItemWidth: {
+      auto item_width = r.get<float>();
+      ImGui::PushItemWidth(item_width);
+    } break;
+    case CommandOp_PopItemWidth: {
+      ImGui::PopItemWidth();
+    } break;
+    case CommandOp_SetNextItemWidth: {
+      auto item_width = r.get<float>();
+      ImGui::SetNextItemWidth(item_width);
+    } break;
+    case CommandOp_CalcItemWidth: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::CalcItemWidth()));
+    } break;
+    case CommandOp_PushTextWrapPos: {
+      auto wrap_local_pos_x = r.get<float>();
+      ImGui::PushTextWrapPos(wrap_local_pos_x);
+    } break;
+    case CommandOp_PopTextWrapPos: {
+      ImGui::PopTextWrapPos();
+    } break;
+    case CommandOp_Separator: {
+      ImGui::Separator();
+    } break;
+    case CommandOp_SameLine: {
+      auto offset_from_start_x = r.get<float>();
+      auto spacing = r.get<float>();
+      ImGui::SameLine(offset_from_start_x, spacing);
+    } break;
+    case CommandOp_NewLine: {
+      ImGui::NewLine();
+    } break;
+    case CommandOp_Spacing: {
+      ImGui::Spacing();
+    } break;
+    case CommandOp_Dummy: {
+      auto size = r.get<ImVec2>();
+      ImGui::Dummy(size);
+    } break;
+    case CommandOp_Indent: {
+      auto indent_w = r.get<float>();
+      ImGui::Indent(indent_w);
+    } break;
+    case CommandOp_Unindent: {
+      auto indent_w = r.get<float>();
+      ImGui::Unindent(indent_w);
+    } break;
+    case CommandOp_BeginGroup: {
+      ImGui::BeginGroup();
+    } break;
+    case CommandOp_EndGroup: {
+      ImGui::EndGroup();
+    } break;
+    case CommandOp_GetCursorPos: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetCursorPos()));
+    } break;
+    case CommandOp_GetCursorPosX: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetCursorPosX()));
+    } break;
+    case CommandOp_GetCursorPosY: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetCursorPosY()));
+    } break;
+    case CommandOp_SetCursorPos: {
+      auto local_pos = r.get<ImVec2>();
+      ImGui::SetCursorPos(local_pos);
+    } break;
+    case CommandOp_SetCursorPosX: {
+      auto local_x = r.get<float>();
+      ImGui::SetCursorPosX(local_x);
+    } break;
+    case CommandOp_SetCursorPosY: {
+      auto local_y = r.get<float>();
+      ImGui::SetCursorPosY(local_y);
+    } break;
+    case CommandOp_GetCursorStartPos: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetCursorStartPos()));
+    } break;
+    case CommandOp_GetCursorScreenPos: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetCursorScreenPos()));
+    } break;
+    case CommandOp_SetCursorScreenPos: {
+      auto pos = r.get<ImVec2>();
+      ImGui::SetCursorScreenPos(pos);
+    } break;
+    case CommandOp_AlignTextToFramePadding: {
+      ImGui::AlignTextToFramePadding();
+    } break;
+    case CommandOp_GetTextLineHeight: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetTextLineHeight()));
+    } break;
+    case CommandOp_GetTextLineHeightWithSpacing: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetTextLineHeightWithSpacing()));
+    } break;
+    case CommandOp_GetFrameHeight: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetFrameHeight()));
+    } break;
+    case CommandOp_GetFrameHeightWithSpacing: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetFrameHeightWithSpacing()));
+    } break;
+    case CommandOp_PopID: {
+      ImGui::PopID();
+    } break;
+    case CommandOp_Button: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto size = r.get<ImVec2>();
+      bool ret = ImGui::Button(label, size);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_SmallButton: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      bool ret = ImGui::SmallButton(label);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_InvisibleButton: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto size = r.get<ImVec2>();
+      auto flags = r.get<ImGuiButtonFlags>();
+      bool ret = ImGui::InvisibleButton(str_id, size, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_ArrowButton: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto dir = r.get<ImGuiDir>();
+      bool ret = ImGui::ArrowButton(str_id, dir);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_RadioButton_StrBool: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto active = r.get<bool>();
+      bool ret = ImGui::RadioButton(label, active);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_ProgressBar: {
+      auto fraction = r.get<float>();
+      auto size_arg = r.get<ImVec2>();
+      auto overlay = r.get<char const*>();
+      ImGui::ProgressBar(fraction, size_arg, overlay);
+    } break;
+    case CommandOp_Bullet: {
+      ImGui::Bullet();
+    } break;
+    case CommandOp_BeginCombo: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto preview_value = r.get<char const*>();
+      auto flags = r.get<ImGuiComboFlags>();
+      bool ret = ImGui::BeginCombo(label, preview_value, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndCombo: {
+      ImGui::EndCombo();
+    } break;
+    case CommandOp_BeginListBox: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto size = r.get<ImVec2>();
+      bool ret = ImGui::BeginListBox(label, size);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndListBox: {
+      ImGui::EndListBox();
+    } break;
+    case CommandOp_TreeNode_Str: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      bool ret = ImGui::TreeNode(label);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_TreePush_Str: {
+      auto str_id = r.get<char const*>();
+      ImGui::TreePush(str_id);
+    } break;
+    case CommandOp_TreePop: {
+      ImGui::TreePop();
+    } break;
+    case CommandOp_GetTreeNodeToLabelSpacing: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetTreeNodeToLabelSpacing()));
+    } break;
+    case CommandOp_CollapsingHeader_StrTreeNodeFlags: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto flags = r.get<ImGuiTreeNodeFlags>();
+      bool ret = ImGui::CollapsingHeader(label, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_SetNextItemOpen: {
+      auto is_open = r.get<bool>();
+      auto cond = r.get<ImGuiCond>();
+      ImGui::SetNextItemOpen(is_open, cond);
+    } break;
+    case CommandOp_Selectable_StrBoolSelectableFlagsImVec2: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto selected = r.get<bool>();
+      auto flags = r.get<ImGuiSelectableFlags>();
+      auto size = r.get<ImVec2>();
+      bool ret = ImGui::Selectable(label, selected, flags, size);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_GetMainViewport: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetMainViewport(), py::return_value_policy::reference));
+    } break;
+    case CommandOp_GetWindowDrawList: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetWindowDrawList(), py::return_value_policy::reference));
+    } break;
+    case CommandOp_GetBackgroundDrawList_Void: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetBackgroundDrawList(), py::return_value_policy::reference));
+    } break;
+    case CommandOp_GetForegroundDrawList_Void: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetForegroundDrawList(), py::return_value_policy::reference));
+    } break;
+    case CommandOp_BeginMenuBar: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::BeginMenuBar();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndMenuBar: {
+      ImGui::EndMenuBar();
+    } break;
+    case CommandOp_BeginMainMenuBar: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::BeginMainMenuBar();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndMainMenuBar: {
+      ImGui::EndMainMenuBar();
+    } break;
+    case CommandOp_BeginMenu: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto enabled = r.get<bool>();
+      bool ret = ImGui::BeginMenu(label, enabled);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndMenu: {
+      ImGui::EndMenu();
+    } break;
+    case CommandOp_MenuItem_StrStrBoolBool: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto shortcut = r.get<char const*>();
+      auto selected = r.get<bool>();
+      auto enabled = r.get<bool>();
+      bool ret = ImGui::MenuItem(label, shortcut, selected, enabled);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginTooltip: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::BeginTooltip();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndTooltip: {
+      ImGui::EndTooltip();
+    } break;
+    case CommandOp_BeginItemTooltip: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::BeginItemTooltip();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginPopup: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto flags = r.get<ImGuiWindowFlags>();
+      bool ret = ImGui::BeginPopup(str_id, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndPopup: {
+      ImGui::EndPopup();
+    } break;
+    case CommandOp_OpenPopup_StrPopupFlags: {
+      auto str_id = r.get<char const*>();
+      auto popup_flags = r.get<ImGuiPopupFlags>();
+      ImGui::OpenPopup(str_id, popup_flags);
+    } break;
+    case CommandOp_OpenPopup_IDPopupFlags: {
+      auto id = r.get<ImGuiID>();
+      auto popup_flags = r.get<ImGuiPopupFlags>();
+      ImGui::OpenPopup(id, popup_flags);
+    } break;
+    case CommandOp_OpenPopupOnItemClick: {
+      auto str_id = r.get<char const*>();
+      auto popup_flags = r.get<ImGuiPopupFlags>();
+      ImGui::OpenPopupOnItemClick(str_id, popup_flags);
+    } break;
+    case CommandOp_CloseCurrentPopup: {
+      ImGui::CloseCurrentPopup();
+    } break;
+    case CommandOp_BeginPopupContextItem: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto popup_flags = r.get<ImGuiPopupFlags>();
+      bool ret = ImGui::BeginPopupContextItem(str_id, popup_flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginPopupContextWindow: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto popup_flags = r.get<ImGuiPopupFlags>();
+      bool ret = ImGui::BeginPopupContextWindow(str_id, popup_flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginPopupContextVoid: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto popup_flags = r.get<ImGuiPopupFlags>();
+      bool ret = ImGui::BeginPopupContextVoid(str_id, popup_flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsPopupOpen: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto flags = r.get<ImGuiPopupFlags>();
+      bool ret = ImGui::IsPopupOpen(str_id, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginTable: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto column = r.get<int>();
+      auto flags = r.get<ImGuiTableFlags>();
+      auto outer_size = r.get<ImVec2>();
+      auto inner_width = r.get<float>();
+      bool ret = ImGui::BeginTable(str_id, column, flags, outer_size, inner_width);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndTable: {
+      ImGui::EndTable();
+    } break;
+    case CommandOp_TableNextRow: {
+      auto row_flags = r.get<ImGuiTableRowFlags>();
+      auto min_row_height = r.get<float>();
+      ImGui::TableNextRow(row_flags, min_row_height);
+    } break;
+    case CommandOp_TableNextColumn: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::TableNextColumn();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_TableSetColumnIndex: {
+      auto slot = r.get<int>();
+      auto column_n = r.get<int>();
+      bool ret = ImGui::TableSetColumnIndex(column_n);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_TableSetupColumn: {
+      auto label = r.get<char const*>();
+      auto flags = r.get<ImGuiTableColumnFlags>();
+      auto init_width_or_weight = r.get<float>();
+      auto user_id = r.get<ImGuiID>();
+      ImGui::TableSetupColumn(label, flags, init_width_or_weight, user_id);
+    } break;
+    case CommandOp_TableSetupScrollFreeze: {
+      auto cols = r.get<int>();
+      auto rows = r.get<int>();
+      ImGui::TableSetupScrollFreeze(cols, rows);
+    } break;
+    case CommandOp_TableHeadersRow: {
+      ImGui::TableHeadersRow();
+    } break;
+    case CommandOp_TableHeader: {
+      auto label = r.get<char const*>();
+      ImGui::TableHeader(label);
+    } break;
+    case CommandOp_TableGetColumnCount: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::TableGetColumnCount()));
+    } break;
+    case CommandOp_TableGetColumnIndex: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::TableGetColumnIndex()));
+    } break;
+    case CommandOp_TableGetRowIndex: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::TableGetRowIndex()));
+    } break;
+    case CommandOp_TableGetColumnName: {
+      auto slot = r.get<int>();
+      auto column_n = r.get<int>();
+      result(slot, true, py::cast(ImGui::TableGetColumnName(column_n)));
+    } break;
+    case CommandOp_TableGetColumnFlags: {
+      auto slot = r.get<int>();
+      auto column_n = r.get<int>();
+      result(slot, true, py::cast(ImGui::TableGetColumnFlags(column_n)));
+    } break;
+    case CommandOp_TableSetColumnEnabled: {
+      auto column_n = r.get<int>();
+      auto v = r.get<bool>();
+      ImGui::TableSetColumnEnabled(column_n, v);
+    } break;
+    case CommandOp_TableSetBgColor: {
+      auto target = r.get<ImGuiTableBgTarget>();
+      auto color = r.get<ImU32>();
+      auto column_n = r.get<int>();
+      ImGui::TableSetBgColor(target, color, column_n);
+    } break;
+    case CommandOp_TableGetSortSpecs: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::TableGetSortSpecs(), py::return_value_policy::reference));
+    } break;
+    case CommandOp_ColorButton: {
+      auto slot = r.get<int>();
+      auto desc_id = r.get<char const*>();
+      auto col = r.get<ImVec4>();
+      auto flags = r.get<ImGuiColorEditFlags>();
+      auto size = r.get<ImVec2>();
+      bool ret = ImGui::ColorButton(desc_id, col, flags, size);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginTabBar: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      auto flags = r.get<ImGuiTabBarFlags>();
+      bool ret = ImGui::BeginTabBar(str_id, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndTabBar: {
+      ImGui::EndTabBar();
+    } break;
+    case CommandOp_EndTabItem: {
+      ImGui::EndTabItem();
+    } break;
+    case CommandOp_TabItemButton: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto flags = r.get<ImGuiTabItemFlags>();
+      bool ret = ImGui::TabItemButton(label, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_SetTabItemClosed: {
+      auto tab_or_docked_window_label = r.get<char const*>();
+      ImGui::SetTabItemClosed(tab_or_docked_window_label);
+    } break;
+    case CommandOp_BeginDisabled: {
+      auto disabled = r.get<bool>();
+      ImGui::BeginDisabled(disabled);
+    } break;
+    case CommandOp_EndDisabled: {
+      ImGui::EndDisabled();
+    } break;
+    case CommandOp_SetItemDefaultFocus: {
+      ImGui::SetItemDefaultFocus();
+    } break;
+    case CommandOp_SetKeyboardFocusHere: {
+      auto offset = r.get<int>();
+      ImGui::SetKeyboardFocusHere(offset);
+    } break;
+    case CommandOp_SetNextItemAllowOverlap: {
+      ImGui::SetNextItemAllowOverlap();
+    } break;
+    case CommandOp_IsItemHovered: {
+      auto slot = r.get<int>();
+      auto flags = r.get<ImGuiHoveredFlags>();
+      bool ret = ImGui::IsItemHovered(flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemActive: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemActive();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemFocused: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemFocused();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemClicked: {
+      auto slot = r.get<int>();
+      auto mouse_button = r.get<ImGuiMouseButton>();
+      bool ret = ImGui::IsItemClicked(mouse_button);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemVisible: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemVisible();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemEdited: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemEdited();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemActivated: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemActivated();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemDeactivated: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemDeactivated();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemDeactivatedAfterEdit: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemDeactivatedAfterEdit();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsItemToggledOpen: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsItemToggledOpen();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsAnyItemHovered: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsAnyItemHovered();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsAnyItemActive: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsAnyItemActive();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsAnyItemFocused: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsAnyItemFocused();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_GetItemID: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetItemID()));
+    } break;
+    case CommandOp_GetItemRectMin: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetItemRectMin()));
+    } break;
+    case CommandOp_GetItemRectMax: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetItemRectMax()));
+    } break;
+    case CommandOp_GetItemRectSize: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetItemRectSize()));
+    } break;
+    case CommandOp_IsRectVisible_ImVec2: {
+      auto slot = r.get<int>();
+      auto size = r.get<ImVec2>();
+      bool ret = ImGui::IsRectVisible(size);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsRectVisible_ImVec2ImVec2: {
+      auto slot = r.get<int>();
+      auto rect_min = r.get<ImVec2>();
+      auto rect_max = r.get<ImVec2>();
+      bool ret = ImGui::IsRectVisible(rect_min, rect_max);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_BeginChildFrame: {
+      auto slot = r.get<int>();
+      auto id = r.get<ImGuiID>();
+      auto size = r.get<ImVec2>();
+      auto flags = r.get<ImGuiWindowFlags>();
+      bool ret = ImGui::BeginChildFrame(id, size, flags);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_EndChildFrame: {
+      ImGui::EndChildFrame();
+    } break;
+    case CommandOp_IsKeyDown: {
+      auto slot = r.get<int>();
+      auto key = r.get<ImGuiKey>();
+      bool ret = ImGui::IsKeyDown(key);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsKeyPressed: {
+      auto slot = r.get<int>();
+      auto key = r.get<ImGuiKey>();
+      auto repeat = r.get<bool>();
+      bool ret = ImGui::IsKeyPressed(key, repeat);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsKeyReleased: {
+      auto slot = r.get<int>();
+      auto key = r.get<ImGuiKey>();
+      bool ret = ImGui::IsKeyReleased(key);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_SetNextFrameWantCaptureKeyboard: {
+      auto want_capture_keyboard = r.get<bool>();
+      ImGui::SetNextFrameWantCaptureKeyboard(want_capture_keyboard);
+    } break;
+    case CommandOp_IsMouseDown: {
+      auto slot = r.get<int>();
+      auto button = r.get<ImGuiMouseButton>();
+      bool ret = ImGui::IsMouseDown(button);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsMouseClicked: {
+      auto slot = r.get<int>();
+      auto button = r.get<ImGuiMouseButton>();
+      auto repeat = r.get<bool>();
+      bool ret = ImGui::IsMouseClicked(button, repeat);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsMouseReleased: {
+      auto slot = r.get<int>();
+      auto button = r.get<ImGuiMouseButton>();
+      bool ret = ImGui::IsMouseReleased(button);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsMouseDoubleClicked: {
+      auto slot = r.get<int>();
+      auto button = r.get<ImGuiMouseButton>();
+      bool ret = ImGui::IsMouseDoubleClicked(button);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsMouseHoveringRect: {
+      auto slot = r.get<int>();
+      auto r_min = r.get<ImVec2>();
+      auto r_max = r.get<ImVec2>();
+      auto clip = r.get<bool>();
+      bool ret = ImGui::IsMouseHoveringRect(r_min, r_max, clip);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_IsAnyMouseDown: {
+      auto slot = r.get<int>();
+      bool ret = ImGui::IsAnyMouseDown();
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_GetMousePos: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetMousePos()));
+    } break;
+    case CommandOp_GetMousePosOnOpeningCurrentPopup: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetMousePosOnOpeningCurrentPopup()));
+    } break;
+    case CommandOp_IsMouseDragging: {
+      auto slot = r.get<int>();
+      auto button = r.get<ImGuiMouseButton>();
+      auto lock_threshold = r.get<float>();
+      bool ret = ImGui::IsMouseDragging(button, lock_threshold);
+      result(slot, ret, py::bool_(ret));
+    } break;
+    case CommandOp_GetMouseDragDelta: {
+      auto slot = r.get<int>();
+      auto button = r.get<ImGuiMouseButton>();
+      auto lock_threshold = r.get<float>();
+      result(slot, true, py::cast(ImGui::GetMouseDragDelta(button, lock_threshold)));
+    } break;
+    case CommandOp_ResetMouseDragDelta: {
+      auto button = r.get<ImGuiMouseButton>();
+      ImGui::ResetMouseDragDelta(button);
+    } break;
+    case CommandOp_GetMouseCursor: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetMouseCursor()));
+    } break;
+    case CommandOp_SetMouseCursor: {
+      auto cursor_type = r.get<ImGuiMouseCursor>();
+      ImGui::SetMouseCursor(cursor_type);
+    } break;
+    case CommandOp_SetNextFrameWantCaptureMouse: {
+      auto want_capture_mouse = r.get<bool>();
+      ImGui::SetNextFrameWantCaptureMouse(want_capture_mouse);
+    } break;
+    case CommandOp_GetClipboardText: {
+      auto slot = r.get<int>();
+      result(slot, true, py::cast(ImGui::GetClipboardText()));
+    } break;
+    case CommandOp_SetClipboardText: {
+      auto text = r.get<char const*>();
+      ImGui::SetClipboardText(text);
+    } break;
+    case CommandOp_If: {
+      auto slot = r.get<int>();
+      auto target = r.get<uint32_t>();
+      if (!truth[slot])
+        r.p = cb.data.data() + target;
+    } break;
+    case CommandOp_EndIf:
+      break;
+    case CommandOp_Begin: {
+      auto slot = r.get<int>();
+      auto name = r.get<char const*>();
+      auto open = r.get<bool>();
+      auto flags = r.get<ImGuiWindowFlags>();
+      bool shown = ImGui::Begin(name, &open, flags);
+      result(slot, shown, py::make_tuple(shown, open));
+    } break;
+    case CommandOp_BeginPopupModal: {
+      auto slot = r.get<int>();
+      auto name = r.get<char const*>();
+      auto open = r.get<bool>();
+      auto flags = r.get<ImGuiWindowFlags>();
+      bool shown = ImGui::BeginPopupModal(name, &open, flags);
+      result(slot, shown, py::make_tuple(shown, open));
+    } break;
+    case CommandOp_BeginTabItem: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto open = r.get<bool>();
+      auto flags = r.get<ImGuiTabItemFlags>();
+      bool shown = ImGui::BeginTabItem(label, &open, flags);
+      result(slot, shown, py::make_tuple(shown, open));
+    } break;
+    case CommandOp_PushID_Str:
+      ImGui::PushID(r.get<char const*>());
+      break;
+    case CommandOp_PushID_Int:
+      ImGui::PushID(r.get<int>());
+      break;
+    case CommandOp_GetID: {
+      auto slot = r.get<int>();
+      auto str_id = r.get<char const*>();
+      result(slot, true, py::cast(ImGui::GetID(str_id)));
+    } break;
+    case CommandOp_Text: {
+      auto str = r.get<std::string_view>();
+      ImGui::TextUnformatted(str.data(), str.data() + str.size());
+    } break;
+    case CommandOp_Checkbox: {
+      auto slot = r.get<int>();
+      auto label = r.get<char const*>();
+      auto checked = r.get<bool>();
+      bool mod = ImGui::Checkbox(label, &checked);
+      result(slot, mod, py::make_tuple(mod, checked));
+    } break;
+    case CommandOp_SetTooltip:
+      ImGui::SetTooltip("%s", r.get<char const*>());
+      break;
+    case CommandOp_SetItemTooltip:
+      ImGui::SetItemTooltip("%s", r.get<char const*>());
+      break;
+    default:
+      throw std::runtime_error("corrupted CommandBuffer");
+    }
+  }
+  return results;
+}
+
+} // namespace
+
+
 void bind_imgui_to_py(py::module& m)
 {
 
@@ -37,6 +1996,274 @@ void bind_imgui_to_py(py::module& m)
     .def_readonly("WorkPos", &ImGuiViewport::WorkPos)
     .def_readonly("WorkSize", &ImGuiViewport::WorkSize);
 
+  py::class_<ImDrawList>(m, "DrawList", "Draw list of a window or a viewport, see GetWindowDrawList(). The batched Add* methods take buffers (NumPy arrays...) and draw a whole layer in one call")
+    .def("AddLine", &ImDrawList::AddLine, py::arg("p1"), py::arg("p2"), py::arg("col"), py::arg("thickness") = 1.0f)
+    .def("AddRect", &ImDrawList::AddRect, py::arg("p_min"), py::arg("p_max"), py::arg("col"), py::arg("rounding") = 0.0f, py::arg("flags") = 0, py::arg("thickness") = 1.0f)
+    .def("AddRectFilled", &ImDrawList::AddRectFilled, py::arg("p_min"), py::arg("p_max"), py::arg("col"), py::arg("rounding") = 0.0f, py::arg("flags") = 0)
+    .def("AddCircle", &ImDrawList::AddCircle, py::arg("center"), py::arg("radius"), py::arg("col"), py::arg("num_segments") = 0, py::arg("thickness") = 1.0f)
+    .def("AddCircleFilled", &ImDrawList::AddCircleFilled, py::arg("center"), py::arg("radius"), py::arg("col"), py::arg("num_segments") = 0)
+    .def("AddText", [](ImDrawList& dl, ImVec2 const& pos, ImU32 col, std::string_view text) {
+      dl.AddText(pos, col, text.data(), text.data() + text.size());
+    }, py::arg("pos"), py::arg("col"), py::arg("text"))
+    .def("PushClipRect", &ImDrawList::PushClipRect, py::arg("clip_rect_min"), py::arg("clip_rect_max"), py::arg("intersect_with_current_clip_rect") = false)
+    .def("PopClipRect", &ImDrawList::PopClipRect)
+    .def("AddPolyline", [](ImDrawList& dl, py::buffer points, ImU32 col, ImDrawFlags flags, float thickness) {
+      BufferRows rows = request_rows(points, 2, "points");
+      if (rows.type == ImGuiDataType_Float && rows.row_stride == sizeof(ImVec2) && rows.col_stride == sizeof(float)) {
+        dl.AddPolyline(static_cast<ImVec2 const*>(rows.info.ptr), int(rows.rows), col, flags, thickness);
+        return;
+      }
+      std::vector<ImVec2> copy(size_t(rows.rows));
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        copy[i] = ImVec2(rows.at(i, 0), rows.at(i, 1));
+      dl.AddPolyline(copy.data(), int(rows.rows), col, flags, thickness);
+    }, py::arg("points"), py::arg("col"), py::arg("flags") = 0, py::arg("thickness") = 1.0f,
+    "one polyline through the N x 2 `points`, passed without copy if they are contiguous float32")
+    .def("AddLines", [](ImDrawList& dl, py::buffer segments, py::object colors, float thickness) {
+      BufferRows rows = request_rows(segments, 4, "segments");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddLine(ImVec2(rows.at(i, 0), rows.at(i, 1)), ImVec2(rows.at(i, 2), rows.at(i, 3)), ImU32(cols.at(i)), thickness);
+    }, py::arg("segments"), py::arg("colors"), py::arg("thickness") = 1.0f,
+    "a line per row (x1, y1, x2, y2) of `segments`. colors: a ImU32 for all of them or one per line")
+    .def("AddRects", [](ImDrawList& dl, py::buffer rects, py::object colors, float rounding, float thickness) {
+      BufferRows rows = request_rows(rects, 4, "rects");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddRect(ImVec2(rows.at(i, 0), rows.at(i, 1)), ImVec2(rows.at(i, 2), rows.at(i, 3)), ImU32(cols.at(i)), rounding, 0, thickness);
+    }, py::arg("rects"), py::arg("colors"), py::arg("rounding") = 0.0f, py::arg("thickness") = 1.0f,
+    "a rectangle outline per row (x_min, y_min, x_max, y_max) of `rects`. colors: a ImU32 for all of them or one per rectangle")
+    .def("AddRectsFilled", [](ImDrawList& dl, py::buffer rects, py::object colors, float rounding) {
+      BufferRows rows = request_rows(rects, 4, "rects");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddRectFilled(ImVec2(rows.at(i, 0), rows.at(i, 1)), ImVec2(rows.at(i, 2), rows.at(i, 3)), ImU32(cols.at(i)), rounding);
+    }, py::arg("rects"), py::arg("colors"), py::arg("rounding") = 0.0f,
+    "a filled rectangle per row (x_min, y_min, x_max, y_max) of `rects`. colors: a ImU32 for all of them or one per rectangle")
+    .def("AddCircles", [](ImDrawList& dl, py::buffer centers, py::object radii, py::object colors, int num_segments, float thickness) {
+      BufferRows rows = request_rows(centers, 2, "centers");
+      BufferColumn rads = request_column(radii, rows.rows, "radii");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddCircle(ImVec2(rows.at(i, 0), rows.at(i, 1)), float(rads.at(i)), ImU32(cols.at(i)), num_segments, thickness);
+    }, py::arg("centers"), py::arg("radii"), py::arg("colors"), py::arg("num_segments") = 0, py::arg("thickness") = 1.0f,
+    "a circle per row (x, y) of `centers`. radii, colors: a number for all of them or one per circle")
+    .def("AddCirclesFilled", [](ImDrawList& dl, py::buffer centers, py::object radii, py::object colors, int num_segments) {
+      BufferRows rows = request_rows(centers, 2, "centers");
+      BufferColumn rads = request_column(radii, rows.rows, "radii");
+      BufferColumn cols = request_column(colors, rows.rows, "colors");
+      for (ssize_t i = 0; i < rows.rows; ++i)
+        dl.AddCircleFilled(ImVec2(rows.at(i, 0), rows.at(i, 1)), float(rads.at(i)), ImU32(cols.at(i)), num_segments);
+    }, py::arg("centers"), py::arg("radii"), py::arg("colors"), py::arg("num_segments") = 0,
+    "a filled circle per row (x, y) of `centers`, e.g. for points. radii, colors: a number for all of them or one per circle");
+
+  py::class_<ImGuiTableSortSpecs>(m, "TableSortSpecs", "Sort specs of the current table, see TableGetSortSpecs(). Only valid until the next BeginTable()")
+    .def_property_readonly("Specs", [](ImGuiTableSortSpecs const& specs) {
+      py::list list;
+      for (int i = 0; i < specs.SpecsCount; ++i) {
+        ImGuiTableColumnSortSpecs const& s = specs.Specs[i];
+        list.append(py::make_tuple(int(s.ColumnIndex), s.ColumnUserID, int(s.SortOrder), int(s.SortDirection)));
+      }
+      return list;
+    }, "(column_index, column_user_id, sort_order, sort_direction) of each sorted column, most significant first")
+    .def_readonly("SpecsCount", &ImGuiTableSortSpecs::SpecsCount)
+    .def_readwrite("SpecsDirty", &ImGuiTableSortSpecs::SpecsDirty, "true when the specs changed since last time: sort again, then set it to False");
+
+  py::class_<ImGuiStorage>(m, "StateStore",
+    "Widget values kept natively (an ImGuiStorage), for the overloads of Checkbox, Selectable, DragFloat, Begin... taking a store instead of a value: "
+    "they read and write the value in place, keyed by their own ID, and only return whether it was modified. Keys are ImGuiIDs (int) or labels (str) hashed on the current ID stack. "
+    "Export() copies its (key, value bits) pairs to a N x 2 uint32 array to save it, Import() restores them")
+    .def(py::init<>())
+    .def("GetBool", [](ImGuiStorage const& st, py::handle key, bool default_val) { return st.GetBool(state_key(key), default_val); }, py::arg("key"), py::arg("default_val") = false)
+    .def("SetBool", [](ImGuiStorage& st, py::handle key, bool val) { st.SetBool(state_key(key), val); }, py::arg("key"), py::arg("val"))
+    .def("GetInt", [](ImGuiStorage const& st, py::handle key, int default_val) { return st.GetInt(state_key(key), default_val); }, py::arg("key"), py::arg("default_val") = 0)
+    .def("SetInt", [](ImGuiStorage& st, py::handle key, int val) { st.SetInt(state_key(key), val); }, py::arg("key"), py::arg("val"))
+    .def("GetFloat", [](ImGuiStorage const& st, py::handle key, float default_val) { return st.GetFloat(state_key(key), default_val); }, py::arg("key"), py::arg("default_val") = 0.0f)
+    .def("SetFloat", [](ImGuiStorage& st, py::handle key, float val) { st.SetFloat(state_key(key), val); }, py::arg("key"), py::arg("val"))
+    .def("Clear", &ImGuiStorage::Clear)
+    .def("Import", [](ImGuiStorage& st, py::buffer pairs) {
+      BufferRows rows = request_rows(pairs, 2, "pairs");
+      if (rows.type == ImGuiDataType_Float || rows.type == ImGuiDataType_Double)
+        throw py::type_error("pairs must be a buffer of integers");
+      using Pair = ImGuiStorage::ImGuiStoragePair;
+      std::vector<Pair> pairs_in;
+      pairs_in.reserve(size_t(rows.rows));
+      for (ssize_t i = 0; i < rows.rows; ++i) {
+        uint32_t bits = uint32_t(int64_t(rows.value(i, 1)));
+        int val;
+        std::memcpy(&val, &bits, sizeof(val));
+        pairs_in.emplace_back(ImGuiID(int64_t(rows.value(i, 0))), val);
+      }
+      // one sort and one merge instead of a sorted insert per pair; of equal keys the last pair
+      // wins, and imported pairs replace the stored ones
+      auto by_key = [](Pair const& a, Pair const& b) { return a.key < b.key; };
+      std::stable_sort(pairs_in.begin(), pairs_in.end(), by_key);
+      std::vector<Pair> merged;
+      merged.reserve(pairs_in.size() + size_t(st.Data.Size));
+      Pair const* old = st.Data.begin();
+      for (size_t i = 0; i < pairs_in.size(); ++i) {
+        if (i + 1 < pairs_in.size() && pairs_in[i + 1].key == pairs_in[i].key)
+          continue;
+        for (; old != st.Data.end() && old->key <= pairs_in[i].key; ++old)
+          if (old->key != pairs_in[i].key)
+            merged.push_back(*old);
+        merged.push_back(pairs_in[i]);
+      }
+      merged.insert(merged.end(), old, static_cast<Pair const*>(st.Data.end()));
+      st.Data.resize(int(merged.size()));
+      std::copy(merged.begin(), merged.end(), st.Data.begin());
+    }, py::arg("pairs"), "set the (key, value bits) pairs of a N x 2 integer buffer, as returned by Export()")
+    .def("Export", [](ImGuiStorage const& st) {
+      // a copy: a view of st.Data would dangle once a Set* call reallocates it
+      py::array_t<uint32_t> pairs({ssize_t(st.Data.Size), ssize_t(2)});
+      auto out = pairs.mutable_unchecked<2>();
+      for (int i = 0; i < st.Data.Size; ++i) {
+        out(i, 0) = st.Data[i].key;
+        std::memcpy(&out(i, 1), &st.Data[i].val_i, sizeof(uint32_t));
+      }
+      return pairs;
+    }, "copy of the (key, value bits) pairs, a N x 2 uint32 NumPy array sorted by key")
+    .def("__len__", [](ImGuiStorage const& st) { return st.Data.Size; });
+
+  {
+    // read-only view of an InputSnapshot array, kept up to date by GetInputSnapshot()
+    auto view = [](auto& array) {
+      return py::memoryview::from_buffer(&array[0], {ssize_t(std::size(array))}, {ssize_t(sizeof(array[0]))}, true);
+    };
+    py::class_<InputSnapshot>(m, "InputSnapshot", "Key and mouse state of a frame, filled in place by GetInputSnapshot(). The arrays are read-only memoryviews "
+                                                  "(wrap them once with numpy.asarray), indexed by Key for the keys and by MouseButton for the buttons")
+      .def(py::init<>())
+      .def_property_readonly("KeysDown", [view](InputSnapshot& s) { return view(s.keys_down); }, py::keep_alive<0, 1>(), "IsKeyDown() of every key")
+      .def_property_readonly("KeysPressed", [view](InputSnapshot& s) { return view(s.keys_pressed); }, py::keep_alive<0, 1>(), "IsKeyPressed() of every key, with repeats")
+      .def_property_readonly("KeysReleased", [view](InputSnapshot& s) { return view(s.keys_released); }, py::keep_alive<0, 1>(), "IsKeyReleased() of every key")
+      .def_property_readonly("MouseDown", [view](InputSnapshot& s) { return view(s.mouse_down); }, py::keep_alive<0, 1>(), "IsMouseDown() of every button")
+      .def_property_readonly("MouseClicked", [view](InputSnapshot& s) { return view(s.mouse_clicked); }, py::keep_alive<0, 1>(), "IsMouseClicked() of every button")
+      .def_property_readonly("MouseReleased", [view](InputSnapshot& s) { return view(s.mouse_released); }, py::keep_alive<0, 1>(), "IsMouseReleased() of every button")
+      .def_property_readonly("MouseDoubleClicked", [view](InputSnapshot& s) { return view(s.mouse_double_clicked); }, py::keep_alive<0, 1>(), "IsMouseDoubleClicked() of every button")
+      .def_property_readonly("DragDelta", [](InputSnapshot& s) {
+        return py::memoryview::from_buffer(&s.drag_delta[0][0], {ssize_t(ImGuiMouseButton_COUNT), ssize_t(2)}, {ssize_t(sizeof(s.drag_delta[0])), ssize_t(sizeof(float))}, true);
+      }, py::keep_alive<0, 1>(), "GetMouseDragDelta() of every button, a MouseButton x 2 array")
+      .def_property_readonly("MousePos", [view](InputSnapshot& s) { return view(s.mouse_pos); }, py::keep_alive<0, 1>(), "GetMousePos() as x, y")
+      .def_property_readonly("MouseDelta", [view](InputSnapshot& s) { return view(s.mouse_delta); }, py::keep_alive<0, 1>(), "mouse move since the previous frame as x, y")
+      .def_property_readonly("MouseWheel", [view](InputSnapshot& s) { return view(s.mouse_wheel); }, py::keep_alive<0, 1>(), "vertical, horizontal wheel")
+      .def_readonly("KeyMods", &InputSnapshot::key_mods, "ImGuiMod_ flags of the modifier keys down")
+      .def_readonly("Frame", &InputSnapshot::frame, "GetFrameCount() when the snapshot was taken, -1 before");
+  }
+
+  py::class_<StylePreset>(m, "StylePreset", "A set of style color and style var overrides, captured once and pushed with a single PushStylePreset() call "
+                                            "(or a `with preset:` block) instead of one PushStyleColor/PushStyleVar call each")
+    .def(py::init<>())
+    .def("SetColor", [](StylePreset& p, ImGuiCol idx, ImU32 col) -> StylePreset& {
+      p.set_color(idx, ImGui::ColorConvertU32ToFloat4(col));
+      return p;
+    }, py::arg("idx"), py::arg("col"), py::return_value_policy::reference_internal)
+    .def("SetColor", [](StylePreset& p, ImGuiCol idx, ImVec4 const& col) -> StylePreset& {
+      p.set_color(idx, col);
+      return p;
+    }, py::arg("idx"), py::arg("col"), py::return_value_policy::reference_internal, "override color `idx`, replacing a previous override of it. Returns the preset for chaining")
+    .def("SetVar", [](StylePreset& p, ImGuiStyleVar idx, float val) -> StylePreset& {
+      p.set_var(idx, ImVec2(val, 0.0f), false);
+      return p;
+    }, py::arg("idx"), py::arg("val"), py::return_value_policy::reference_internal)
+    .def("SetVar", [](StylePreset& p, ImGuiStyleVar idx, ImVec2 const& val) -> StylePreset& {
+      p.set_var(idx, val, true);
+      return p;
+    }, py::arg("idx"), py::arg("val"), py::return_value_policy::reference_internal,
+    "override style var `idx` with a float or an ImVec2, whichever PushStyleVar takes for it. Returns the preset for chaining")
+    .def("Clear", [](StylePreset& p) {
+      p.colors.clear();
+      p.vars.clear();
+    })
+    .def("__len__", [](StylePreset const& p) { return p.colors.size() + p.vars.size(); })
+    .def("__enter__", [](StylePreset& p) -> StylePreset& {
+      push_style_preset(p);
+      return p;
+    }, py::return_value_policy::reference_internal)
+    .def("__exit__", [](StylePreset& p, py::args) { pop_style_preset(p); });
+
+  py::class_<FrameWatch>(m, "FrameWatch", "Idle frame detection: Changed() tells, once per frame after NewFrame(), whether input arrived, the display or the layout changed "
+                                          "or a watched data version differs since the previous frame. When it did not, replay the previous submission "
+                                          "(e.g. a recorded CommandBuffer) instead of running the Python UI code again")
+    .def(py::init<int>(), py::arg("settle_frames") = 1)
+    .def("Changed", [](FrameWatch& w, py::handle versions) {
+      int frame = ImGui::GetFrameCount();
+      if (frame == w.frame)
+        return w.changed;
+      char const* what = w.change(versions);
+      w.frame = frame;
+      if (what)
+        w.settle = w.settle_frames;
+      else if (w.settle > 0) {
+        --w.settle;
+        what = "settle";
+      }
+      w.changed = what != nullptr;
+      w.reason = what ? what : "";
+      ++(w.changed ? w.rebuilt : w.skipped);
+      return w.changed;
+    }, py::arg("versions") = py::none(),
+    "true if the UI must be rebuilt this frame. `versions`: an int or a sequence of ints (TextBuffer.Version, a data counter...), a change of any of them counts. "
+    "Calling it again in the same frame returns the same answer without counting the frame twice")
+    .def("Invalidate", [](FrameWatch& w) { w.invalid = true; }, "make the next Changed() return true")
+    .def_property_readonly("Reason", [](FrameWatch const& w) { return w.reason; },
+      "why the last Changed() returned true: invalidated, input, focus, display, layout, version or settle, empty when it returned false")
+    .def_readonly("Rebuilt", &FrameWatch::rebuilt, "frames for which Changed() returned true")
+    .def_readonly("Skipped", &FrameWatch::skipped, "frames for which Changed() returned false")
+    .def_readwrite("SettleFrames", &FrameWatch::settle_frames, "frames still rebuilt after a change")
+    .def("ResetCounters", [](FrameWatch& w) { w.rebuilt = w.skipped = 0; });
+
+  py::class_<SchedulerTask, std::shared_ptr<SchedulerTask>>(m, "SchedulerTask", "A generator or coroutine run by a Scheduler, with its timing")
+    .def_readonly("Name", &SchedulerTask::name)
+    .def_readonly("Done", &SchedulerTask::done, "true once it returned, raised or was cancelled and removed")
+    .def_readonly("Result", &SchedulerTask::result, "value it returned, None until then")
+    .def_readonly("Steps", &SchedulerTask::steps, "number of times it was resumed")
+    .def_readonly("TimeUs", &SchedulerTask::time_us, "total time spent in it, in microseconds")
+    .def_readonly("LastRunUs", &SchedulerTask::last_run_us, "time spent in it during the last Run() it took part in, in microseconds")
+    .def_readonly("MaxStepUs", &SchedulerTask::max_step_us, "longest single step, in microseconds: a task with long steps should yield more often")
+    .def_readonly("Overruns", &SchedulerTask::overruns, "steps that ran past the end of the budget")
+    .def("Cancel", &SchedulerTask::cancel, "close the generator or coroutine, it is removed on the next Run(). A task can cancel itself, it is then closed once its step returns");
+
+  py::class_<Scheduler>(m, "Scheduler", "Runs generator tasks and coroutines on the thread owning the ImGui context, a few steps per frame within a time budget. "
+                                        "A task gives control back with `yield` (or `await asyncio.sleep(0)` in a coroutine); call Run() once per frame, e.g. after Render(). "
+                                        "Coroutines are not run by an asyncio event loop: they cannot await anything else, asyncio.sleep(0.01) fails with "
+                                        "'no running event loop' and awaiting a future raises RuntimeError")
+    .def(py::init<double>(), py::arg("budget_us") = 2000.0)
+    .def("Add", [](Scheduler& s, py::object task, std::string name) {
+      if (!PyGen_Check(task.ptr()) && !PyCoro_CheckExact(task.ptr()))
+        throw py::type_error("task must be a generator or a coroutine");
+      if (name.empty())
+        name = py::str(task.attr("__qualname__"));
+      auto t = std::make_shared<SchedulerTask>();
+      t->task = std::move(task);
+      t->name = std::move(name);
+      s.tasks.push_back(t);
+      return t;
+    }, py::arg("task"), py::arg("name") = "", "schedule a generator or coroutine object, named after its function by default")
+    .def("Run", [](Scheduler& s, std::optional<double> budget_us) { s.run(budget_us.value_or(s.budget_us)); },
+    py::arg("budget_us") = py::none(),
+    "resume the tasks in turn until the budget (BudgetUs by default) is used up or no task is left. "
+    "An exception raised by a task removes it and propagates")
+    .def_readwrite("BudgetUs", &Scheduler::budget_us, "time given to the tasks by each Run(), in microseconds")
+    .def_property_readonly("Tasks", [](Scheduler const& s) { return s.tasks; }, "tasks not finished yet")
+    .def_readonly("Runs", &Scheduler::runs)
+    .def_readonly("LastRunUs", &Scheduler::last_run_us, "time taken by the last Run(), in microseconds")
+    .def_readonly("Overruns", &Scheduler::overruns, "Run() calls that took longer than their budget")
+    .def_readonly("OverrunUs", &Scheduler::overrun_us, "total time spent past the budget, in microseconds")
+    .def("__len__", [](Scheduler const& s) { return s.tasks.size(); });
+
+  py::class_<TextBuffer>(m, "TextBuffer", "Native text storage for InputText/InputTextMultiline, edited in place without converting the text every frame")
+    .def(py::init<>())
+    .def(py::init([](std::string text) { return TextBuffer{std::move(text)}; }), py::arg("text"))
+    .def_property("Text",
+      [](TextBuffer const& buf) { return py::str(buf.text.data(), buf.text.size()); },
+      [](TextBuffer& buf, std::string text) { buf.text = std::move(text); ++buf.version; },
+      "the text as python str, converted on each access")
+    .def_readonly("Version", &TextBuffer::version, "modification counter, compare with a saved value to skip work when the text is unchanged")
+    .def("Clear", [](TextBuffer& buf) { buf.text.clear(); ++buf.version; })
+    .def("Reserve", [](TextBuffer& buf, size_t capacity) { buf.text.reserve(capacity); }, py::arg("capacity"))
+    .def("__len__", [](TextBuffer const& buf) { return buf.text.size(); }, "size in bytes (UTF-8)")
+    .def("__str__", [](TextBuffer const& buf) { return py::str(buf.text.data(), buf.text.size()); });
+
   py::enum_<ImGuiWindowFlags_>(m, "WindowFlags", py::arithmetic())
     .value("NONE", ImGuiWindowFlags_None)
     .value("NoTitleBar", ImGuiWindowFlags_NoTitleBar, "Disable title-bar")
@@ -84,7 +2311,7 @@ void bind_imgui_to_py(py::module& m)
     .value("CallbackHistory", ImGuiInputTextFlags_CallbackHistory, "Callback on pressing Up/Down arrows (for history handling)")
     .value("CallbackAlways", ImGuiInputTextFlags_CallbackAlways, "Callback on each iteration. User code may query cursor position, modify text buffer.")
     .value("CallbackCharFilter", ImGuiInputTextFlags_CallbackCharFilter, "Callback on character inputs to replace or discard them. Modify 'EventChar' to replace or discard, or return 1 in callback to discard.")
-    .value("AllowTabInput", ImGuiInputTextFlags_AllowTabInput, "Pressing TAB input a '\t' character into the text field")
+    .value("AllowTabInput", ImGuiInputTextFlags_AllowTabInput, "Pressing TAB input a '\\t' character into the text field")
     .value("CtrlEnterForNewLine", ImGuiInputTextFlags_CtrlEnterForNewLine, "In multi-line mode, unfocus with Enter, add new line with Ctrl+Enter (default is opposite: unfocus with Ctrl+Enter, add line with Enter).")
     .value("NoHorizontalScroll", ImGuiInputTextFlags_NoHorizontalScroll, "Disable following the cursor horizontally")
     .value("AlwaysOverwrite", ImGuiInputTextFlags_AlwaysOverwrite, "Overwrite mode")
@@ -345,6 +2572,181 @@ void bind_imgui_to_py(py::module& m)
     .value("Descending", ImGuiSortDirection_Descending, "Descending = 9->0, Z->A etc.")
   ;
 
+  py::enum_<ImGuiKey>(m, "Key", py::arithmetic())
+    .value("NONE", ImGuiKey_None)
+    .value("Tab", ImGuiKey_Tab, "== ImGuiKey_NamedKey_BEGIN")
+    .value("LeftArrow", ImGuiKey_LeftArrow)
+    .value("RightArrow", ImGuiKey_RightArrow)
+    .value("UpArrow", ImGuiKey_UpArrow)
+    .value("DownArrow", ImGuiKey_DownArrow)
+    .value("PageUp", ImGuiKey_PageUp)
+    .value("PageDown", ImGuiKey_PageDown)
+    .value("Home", ImGuiKey_Home)
+    .value("End", ImGuiKey_End)
+    .value("Insert", ImGuiKey_Insert)
+    .value("Delete", ImGuiKey_Delete)
+    .value("Backspace", ImGuiKey_Backspace)
+    .value("Space", ImGuiKey_Space)
+    .value("Enter", ImGuiKey_Enter)
+    .value("Escape", ImGuiKey_Escape)
+    .value("LeftCtrl", ImGuiKey_LeftCtrl)
+    .value("LeftShift", ImGuiKey_LeftShift)
+    .value("LeftAlt", ImGuiKey_LeftAlt)
+    .value("LeftSuper", ImGuiKey_LeftSuper)
+    .value("RightCtrl", ImGuiKey_RightCtrl)
+    .value("RightShift", ImGuiKey_RightShift)
+    .value("RightAlt", ImGuiKey_RightAlt)
+    .value("RightSuper", ImGuiKey_RightSuper)
+    .value("Menu", ImGuiKey_Menu)
+    .value("_0", ImGuiKey_0)
+    .value("_1", ImGuiKey_1)
+    .value("_2", ImGuiKey_2)
+    .value("_3", ImGuiKey_3)
+    .value("_4", ImGuiKey_4)
+    .value("_5", ImGuiKey_5)
+    .value("_6", ImGuiKey_6)
+    .value("_7", ImGuiKey_7)
+    .value("_8", ImGuiKey_8)
+    .value("_9", ImGuiKey_9)
+    .value("A", ImGuiKey_A)
+    .value("B", ImGuiKey_B)
+    .value("C", ImGuiKey_C)
+    .value("D", ImGuiKey_D)
+    .value("E", ImGuiKey_E)
+    .value("F", ImGuiKey_F)
+    .value("G", ImGuiKey_G)
+    .value("H", ImGuiKey_H)
+    .value("I", ImGuiKey_I)
+    .value("J", ImGuiKey_J)
+    .value("K", ImGuiKey_K)
+    .value("L", ImGuiKey_L)
+    .value("M", ImGuiKey_M)
+    .value("N", ImGuiKey_N)
+    .value("O", ImGuiKey_O)
+    .value("P", ImGuiKey_P)
+    .value("Q", ImGuiKey_Q)
+    .value("R", ImGuiKey_R)
+    .value("S", ImGuiKey_S)
+    .value("T", ImGuiKey_T)
+    .value("U", ImGuiKey_U)
+    .value("V", ImGuiKey_V)
+    .value("W", ImGuiKey_W)
+    .value("X", ImGuiKey_X)
+    .value("Y", ImGuiKey_Y)
+    .value("Z", ImGuiKey_Z)
+    .value("F1", ImGuiKey_F1)
+    .value("F2", ImGuiKey_F2)
+    .value("F3", ImGuiKey_F3)
+    .value("F4", ImGuiKey_F4)
+    .value("F5", ImGuiKey_F5)
+    .value("F6", ImGuiKey_F6)
+    .value("F7", ImGuiKey_F7)
+    .value("F8", ImGuiKey_F8)
+    .value("F9", ImGuiKey_F9)
+    .value("F10", ImGuiKey_F10)
+    .value("F11", ImGuiKey_F11)
+    .value("F12", ImGuiKey_F12)
+    .value("F13", ImGuiKey_F13)
+    .value("F14", ImGuiKey_F14)
+    .value("F15", ImGuiKey_F15)
+    .value("F16", ImGuiKey_F16)
+    .value("F17", ImGuiKey_F17)
+    .value("F18", ImGuiKey_F18)
+    .value("F19", ImGuiKey_F19)
+    .value("F20", ImGuiKey_F20)
+    .value("F21", ImGuiKey_F21)
+    .value("F22", ImGuiKey_F22)
+    .value("F23", ImGuiKey_F23)
+    .value("F24", ImGuiKey_F24)
+    .value("Apostrophe", ImGuiKey_Apostrophe, "'")
+    .value("Comma", ImGuiKey_Comma, ",")
+    .value("Minus", ImGuiKey_Minus, "-")
+    .value("Period", ImGuiKey_Period, ".")
+    .value("Slash", ImGuiKey_Slash, "/")
+    .value("Semicolon", ImGuiKey_Semicolon, ";")
+    .value("Equal", ImGuiKey_Equal, "=")
+    .value("LeftBracket", ImGuiKey_LeftBracket, "[")
+    .value("Backslash", ImGuiKey_Backslash, "\\ (this text inhibit multiline comment caused by backslash)")
+    .value("RightBracket", ImGuiKey_RightBracket, "]")
+    .value("GraveAccent", ImGuiKey_GraveAccent, "`")
+    .value("CapsLock", ImGuiKey_CapsLock)
+    .value("ScrollLock", ImGuiKey_ScrollLock)
+    .value("NumLock", ImGuiKey_NumLock)
+    .value("PrintScreen", ImGuiKey_PrintScreen)
+    .value("Pause", ImGuiKey_Pause)
+    .value("Keypad0", ImGuiKey_Keypad0)
+    .value("Keypad1", ImGuiKey_Keypad1)
+    .value("Keypad2", ImGuiKey_Keypad2)
+    .value("Keypad3", ImGuiKey_Keypad3)
+    .value("Keypad4", ImGuiKey_Keypad4)
+    .value("Keypad5", ImGuiKey_Keypad5)
+    .value("Keypad6", ImGuiKey_Keypad6)
+    .value("Keypad7", ImGuiKey_Keypad7)
+    .value("Keypad8", ImGuiKey_Keypad8)
+    .value("Keypad9", ImGuiKey_Keypad9)
+    .value("KeypadDecimal", ImGuiKey_KeypadDecimal)
+    .value("KeypadDivide", ImGuiKey_KeypadDivide)
+    .value("KeypadMultiply", ImGuiKey_KeypadMultiply)
+    .value("KeypadSubtract", ImGuiKey_KeypadSubtract)
+    .value("KeypadAdd", ImGuiKey_KeypadAdd)
+    .value("KeypadEnter", ImGuiKey_KeypadEnter)
+    .value("KeypadEqual", ImGuiKey_KeypadEqual)
+    .value("AppBack", ImGuiKey_AppBack, "Available on some keyboard/mouses. Often referred as \"Browser Back\"")
+    .value("AppForward", ImGuiKey_AppForward)
+    .value("GamepadStart", ImGuiKey_GamepadStart, "Menu (Xbox)      + (Switch)   Start/Options (PS)")
+    .value("GamepadBack", ImGuiKey_GamepadBack, "View (Xbox)      - (Switch)   Share (PS)")
+    .value("GamepadFaceLeft", ImGuiKey_GamepadFaceLeft, "X (Xbox)         Y (Switch)   Square (PS)        // Tap: Toggle Menu. Hold: Windowing mode (Focus/Move/Resize windows)")
+    .value("GamepadFaceRight", ImGuiKey_GamepadFaceRight, "B (Xbox)         A (Switch)   Circle (PS)        // Cancel / Close / Exit")
+    .value("GamepadFaceUp", ImGuiKey_GamepadFaceUp, "Y (Xbox)         X (Switch)   Triangle (PS)      // Text Input / On-screen Keyboard")
+    .value("GamepadFaceDown", ImGuiKey_GamepadFaceDown, "A (Xbox)         B (Switch)   Cross (PS)         // Activate / Open / Toggle / Tweak")
+    .value("GamepadDpadLeft", ImGuiKey_GamepadDpadLeft, "D-pad Left                                       // Move / Tweak / Resize Window (in Windowing mode)")
+    .value("GamepadDpadRight", ImGuiKey_GamepadDpadRight, "D-pad Right                                      // Move / Tweak / Resize Window (in Windowing mode)")
+    .value("GamepadDpadUp", ImGuiKey_GamepadDpadUp, "D-pad Up                                         // Move / Tweak / Resize Window (in Windowing mode)")
+    .value("GamepadDpadDown", ImGuiKey_GamepadDpadDown, "D-pad Down                                       // Move / Tweak / Resize Window (in Windowing mode)")
+    .value("GamepadL1", ImGuiKey_GamepadL1, "L Bumper (Xbox)  L (Switch)   L1 (PS)            // Tweak Slower / Focus Previous (in Windowing mode)")
+    .value("GamepadR1", ImGuiKey_GamepadR1, "R Bumper (Xbox)  R (Switch)   R1 (PS)            // Tweak Faster / Focus Next (in Windowing mode)")
+    .value("GamepadL2", ImGuiKey_GamepadL2, "L Trig. (Xbox)   ZL (Switch)  L2 (PS) [Analog]")
+    .value("GamepadR2", ImGuiKey_GamepadR2, "R Trig. (Xbox)   ZR (Switch)  R2 (PS) [Analog]")
+    .value("GamepadL3", ImGuiKey_GamepadL3, "L Stick (Xbox)   L3 (Switch)  L3 (PS)")
+    .value("GamepadR3", ImGuiKey_GamepadR3, "R Stick (Xbox)   R3 (Switch)  R3 (PS)")
+    .value("GamepadLStickLeft", ImGuiKey_GamepadLStickLeft, "[Analog]                                         // Move Window (in Windowing mode)")
+    .value("GamepadLStickRight", ImGuiKey_GamepadLStickRight, "[Analog]                                         // Move Window (in Windowing mode)")
+    .value("GamepadLStickUp", ImGuiKey_GamepadLStickUp, "[Analog]                                         // Move Window (in Windowing mode)")
+    .value("GamepadLStickDown", ImGuiKey_GamepadLStickDown, "[Analog]                                         // Move Window (in Windowing mode)")
+    .value("GamepadRStickLeft", ImGuiKey_GamepadRStickLeft, "[Analog]")
+    .value("GamepadRStickRight", ImGuiKey_GamepadRStickRight, "[Analog]")
+    .value("GamepadRStickUp", ImGuiKey_GamepadRStickUp, "[Analog]")
+    .value("GamepadRStickDown", ImGuiKey_GamepadRStickDown, "[Analog]")
+    .value("MouseLeft", ImGuiKey_MouseLeft)
+    .value("MouseRight", ImGuiKey_MouseRight)
+    .value("MouseMiddle", ImGuiKey_MouseMiddle)
+    .value("MouseX1", ImGuiKey_MouseX1)
+    .value("MouseX2", ImGuiKey_MouseX2)
+    .value("MouseWheelX", ImGuiKey_MouseWheelX)
+    .value("MouseWheelY", ImGuiKey_MouseWheelY)
+    .value("ReservedForModCtrl", ImGuiKey_ReservedForModCtrl)
+    .value("ReservedForModShift", ImGuiKey_ReservedForModShift)
+    .value("ReservedForModAlt", ImGuiKey_ReservedForModAlt)
+    .value("ReservedForModSuper", ImGuiKey_ReservedForModSuper)
+    .value("Ctrl", ImGuiMod_Ctrl, "Ctrl")
+    .value("Shift", ImGuiMod_Shift, "Shift")
+    .value("Alt", ImGuiMod_Alt, "Option/Menu")
+    .value("Super", ImGuiMod_Super, "Cmd/Super/Windows")
+    .value("Shortcut", ImGuiMod_Shortcut, "Alias for Ctrl (non-macOS) _or_ Super (macOS).")
+    .value("Mask_", ImGuiMod_Mask_, "5-bits")
+    .value("NamedKey_BEGIN", ImGuiKey_NamedKey_BEGIN)
+    .value("NamedKey_END", ImGuiKey_NamedKey_END)
+    .value("NamedKey_COUNT", ImGuiKey_NamedKey_COUNT)
+    .value("KeysData_SIZE", ImGuiKey_KeysData_SIZE, "Size of KeysData[]: only hold named keys")
+    .value("KeysData_OFFSET", ImGuiKey_KeysData_OFFSET, "Accesses to io.KeysData[] must use (key - ImGuiKey_KeysData_OFFSET) index.")
+    .value("ModCtrl", ImGuiKey_ModCtrl, "Renamed in 1.89")
+    .value("ModShift", ImGuiKey_ModShift, "Renamed in 1.89")
+    .value("ModAlt", ImGuiKey_ModAlt, "Renamed in 1.89")
+    .value("ModSuper", ImGuiKey_ModSuper, "Renamed in 1.89")
+    .value("KeyPadEnter", ImGuiKey_KeyPadEnter, "Renamed in 1.87")
+  ;
+  py::implicitly_convertible<int, ImGuiKey>();
+
   py::enum_<ImGuiConfigFlags_>(m, "ConfigFlags", py::arithmetic())
     .value("NONE", ImGuiConfigFlags_None)
     .value("NavEnableKeyboard", ImGuiConfigFlags_NavEnableKeyboard, "Master keyboard navigation enable flag. Enable full Tabbing + directional arrows + space/enter to activate.")
@@ -558,8 +2960,8 @@ void bind_imgui_to_py(py::module& m)
   ;
 
   m.def("End", &ImGui::End);
-  m.def("BeginChild", py::overload_cast<ImGuiID, const ImVec2&, bool, ImGuiWindowFlags>(&ImGui::BeginChild), py::arg("id"), py::arg("size") = ImVec2(0, 0), py::arg("border") = false, py::arg("flags") = 0);
   m.def("BeginChild", py::overload_cast<const char*, const ImVec2&, bool, ImGuiWindowFlags>(&ImGui::BeginChild), py::arg("str_id"), py::arg("size") = ImVec2(0, 0), py::arg("border") = false, py::arg("flags") = 0);
+  m.def("BeginChild", py::overload_cast<ImGuiID, const ImVec2&, bool, ImGuiWindowFlags>(&ImGui::BeginChild), py::arg("id"), py::arg("size") = ImVec2(0, 0), py::arg("border") = false, py::arg("flags") = 0);
   m.def("EndChild", &ImGui::EndChild);
   m.def("IsWindowAppearing", &ImGui::IsWindowAppearing);
   m.def("IsWindowCollapsed", &ImGui::IsWindowCollapsed);
@@ -577,12 +2979,12 @@ void bind_imgui_to_py(py::module& m)
   m.def("SetNextWindowBgAlpha", &ImGui::SetNextWindowBgAlpha, py::arg("alpha"), "set next window background color alpha. helper to easily override the Alpha component of ImGuiCol_WindowBg/ChildBg/PopupBg. you may also use ImGuiWindowFlags_NoBackground.");
   m.def("SetWindowPos", py::overload_cast<const ImVec2&, ImGuiCond>(&ImGui::SetWindowPos), py::arg("pos"), py::arg("cond") = 0, "(not recommended) set current window position - call within Begin()/End(). prefer using SetNextWindowPos(), as this may incur tearing and side-effects.");
   m.def("SetWindowPos", py::overload_cast<const char*, const ImVec2&, ImGuiCond>(&ImGui::SetWindowPos), py::arg("name"), py::arg("pos"), py::arg("cond") = 0, "set named window position.");
-  m.def("SetWindowSize", py::overload_cast<const char*, const ImVec2&, ImGuiCond>(&ImGui::SetWindowSize), py::arg("name"), py::arg("size"), py::arg("cond") = 0, "set named window size. set axis to 0.0f to force an auto-fit on this axis.");
   m.def("SetWindowSize", py::overload_cast<const ImVec2&, ImGuiCond>(&ImGui::SetWindowSize), py::arg("size"), py::arg("cond") = 0, "(not recommended) set current window size - call within Begin()/End(). set to ImVec2(0, 0) to force an auto-fit. prefer using SetNextWindowSize(), as this may incur tearing and minor side-effects.");
-  m.def("SetWindowCollapsed", py::overload_cast<const char*, bool, ImGuiCond>(&ImGui::SetWindowCollapsed), py::arg("name"), py::arg("collapsed"), py::arg("cond") = 0, "set named window collapsed state");
+  m.def("SetWindowSize", py::overload_cast<const char*, const ImVec2&, ImGuiCond>(&ImGui::SetWindowSize), py::arg("name"), py::arg("size"), py::arg("cond") = 0, "set named window size. set axis to 0.0f to force an auto-fit on this axis.");
   m.def("SetWindowCollapsed", py::overload_cast<bool, ImGuiCond>(&ImGui::SetWindowCollapsed), py::arg("collapsed"), py::arg("cond") = 0, "(not recommended) set current window collapsed state. prefer using SetNextWindowCollapsed().");
-  m.def("SetWindowFocus", py::overload_cast<const char*>(&ImGui::SetWindowFocus), py::arg("name"), "set named window to be focused / top-most. use NULL to remove focus.");
+  m.def("SetWindowCollapsed", py::overload_cast<const char*, bool, ImGuiCond>(&ImGui::SetWindowCollapsed), py::arg("name"), py::arg("collapsed"), py::arg("cond") = 0, "set named window collapsed state");
   m.def("SetWindowFocus", py::overload_cast<>(&ImGui::SetWindowFocus), "(not recommended) set current window to be focused / top-most. prefer using SetNextWindowFocus().");
+  m.def("SetWindowFocus", py::overload_cast<const char*>(&ImGui::SetWindowFocus), py::arg("name"), "set named window to be focused / top-most. use NULL to remove focus.");
   m.def("SetWindowFontScale", &ImGui::SetWindowFontScale, py::arg("scale"), "[OBSOLETE] set font scale. Adjust IO.FontGlobalScale if you want to scale all windows. This is an old API! For correct scaling, prefer to reload font + rebuild ImFontAtlas + call style.ScaleAllSizes().");
   m.def("GetContentRegionAvail", &ImGui::GetContentRegionAvail, "== GetContentRegionMax() - GetCursorPos()");
   m.def("GetContentRegionMax", &ImGui::GetContentRegionMax, "current content boundaries (typically window boundaries including scrolling, or current column boundaries), in windows coordinates");
@@ -598,11 +3000,11 @@ void bind_imgui_to_py(py::module& m)
   m.def("SetScrollHereY", &ImGui::SetScrollHereY, py::arg("center_y_ratio") = 0.5f, "adjust scrolling amount to make current cursor position visible. center_y_ratio=0.0: top, 0.5: center, 1.0: bottom. When using to make a \"default/current item\" visible, consider using SetItemDefaultFocus() instead.");
   m.def("SetScrollFromPosX", &ImGui::SetScrollFromPosX, py::arg("local_x"), py::arg("center_x_ratio") = 0.5f, "adjust scrolling amount to make given position visible. Generally GetCursorStartPos() + offset to compute a valid position.");
   m.def("SetScrollFromPosY", &ImGui::SetScrollFromPosY, py::arg("local_y"), py::arg("center_y_ratio") = 0.5f, "adjust scrolling amount to make given position visible. Generally GetCursorStartPos() + offset to compute a valid position.");
-  m.def("PushStyleColor", py::overload_cast<ImGuiCol, const ImVec4&>(&ImGui::PushStyleColor), py::arg("idx"), py::arg("col"));
   m.def("PushStyleColor", py::overload_cast<ImGuiCol, ImU32>(&ImGui::PushStyleColor), py::arg("idx"), py::arg("col"), "modify a style color. always use this if you modify the style after NewFrame().");
+  m.def("PushStyleColor", py::overload_cast<ImGuiCol, const ImVec4&>(&ImGui::PushStyleColor), py::arg("idx"), py::arg("col"));
   m.def("PopStyleColor", &ImGui::PopStyleColor, py::arg("count") = 1);
-  m.def("PushStyleVar", py::overload_cast<ImGuiStyleVar, const ImVec2&>(&ImGui::PushStyleVar), py::arg("idx"), py::arg("val"), "modify a style ImVec2 variable. always use this if you modify the style after NewFrame().");
   m.def("PushStyleVar", py::overload_cast<ImGuiStyleVar, float>(&ImGui::PushStyleVar), py::arg("idx"), py::arg("val"), "modify a style float variable. always use this if you modify the style after NewFrame().");
+  m.def("PushStyleVar", py::overload_cast<ImGuiStyleVar, const ImVec2&>(&ImGui::PushStyleVar), py::arg("idx"), py::arg("val"), "modify a style ImVec2 variable. always use this if you modify the style after NewFrame().");
   m.def("PopStyleVar", &ImGui::PopStyleVar, py::arg("count") = 1);
   m.def("PushTabStop", &ImGui::PushTabStop, py::arg("tab_stop"), "== tab stop enable. Allow focusing using TAB/Shift-TAB, enabled by default but you can disable it for certain widgets");
   m.def("PopTabStop", &ImGui::PopTabStop);
@@ -643,7 +3045,7 @@ void bind_imgui_to_py(py::module& m)
   m.def("InvisibleButton", &ImGui::InvisibleButton, py::arg("str_id"), py::arg("size"), py::arg("flags") = 0, "flexible button behavior without the visuals, frequently useful to build custom behaviors using the public api (along with IsItemActive, IsItemHovered, etc.)");
   m.def("ArrowButton", &ImGui::ArrowButton, py::arg("str_id"), py::arg("dir"), "square button with an arrow shape");
   m.def("RadioButton", py::overload_cast<const char*, bool>(&ImGui::RadioButton), py::arg("label"), py::arg("active"), "use with e.g. if (RadioButton(\"one\", my_value==1)) { my_value = 1; }");
-  m.def("ProgressBar", &ImGui::ProgressBar, py::arg("fraction"), py::arg("size_arg") = ImVec2(-FLT_MIN, 0), py::arg("overlay") = NULL);
+  m.def("ProgressBar", &ImGui::ProgressBar, py::arg("fraction"), py::arg("size_arg") = ImVec2(-FLT_MIN, 0), py::arg("overlay") = py::none());
   m.def("Bullet", &ImGui::Bullet, "draw a small circle + keep the cursor on the same line. advance cursor x position by GetTreeNodeToLabelSpacing(), same distance that TreeNode() uses");
   m.def("BeginCombo", &ImGui::BeginCombo, py::arg("label"), py::arg("preview_value"), py::arg("flags") = 0);
   m.def("EndCombo", &ImGui::EndCombo, "only call EndCombo() if BeginCombo() returns true!");
@@ -656,26 +3058,29 @@ void bind_imgui_to_py(py::module& m)
   m.def("CollapsingHeader", py::overload_cast<const char*, ImGuiTreeNodeFlags>(&ImGui::CollapsingHeader), py::arg("label"), py::arg("flags") = 0, "if returning 'true' the header is open. doesn't indent nor push on ID stack. user doesn't have to call TreePop().");
   m.def("SetNextItemOpen", &ImGui::SetNextItemOpen, py::arg("is_open"), py::arg("cond") = 0, "set next TreeNode/CollapsingHeader open state.");
   m.def("Selectable", py::overload_cast<const char*, bool, ImGuiSelectableFlags, const ImVec2&>(&ImGui::Selectable), py::arg("label"), py::arg("selected") = false, py::arg("flags") = 0, py::arg("size") = ImVec2(0, 0), "\"bool selected\" carry the selection state (read-only). Selectable() is clicked is returns true so you can modify your selection state. size.x==0.0: use remaining width, size.x>0.0: specify width. size.y==0.0: use label height, size.y>0.0: specify height");
-  m.def("GetMainViewport", &ImGui::GetMainViewport, "return primary/default viewport. This can never be NULL.");
+  m.def("GetMainViewport", &ImGui::GetMainViewport, py::return_value_policy::reference, "return primary/default viewport. This can never be NULL.");
+  m.def("GetWindowDrawList", &ImGui::GetWindowDrawList, py::return_value_policy::reference, "get draw list associated to the current window, to append your own drawing primitives");
+  m.def("GetBackgroundDrawList", py::overload_cast<>(&ImGui::GetBackgroundDrawList), py::return_value_policy::reference, "get background draw list for the viewport associated to the current window. this draw list will be the first rendering one. Useful to quickly draw shapes/text behind dear imgui contents.");
+  m.def("GetForegroundDrawList", py::overload_cast<>(&ImGui::GetForegroundDrawList), py::return_value_policy::reference, "get foreground draw list for the viewport associated to the current window. this draw list will be the last rendered one. Useful to quickly draw shapes/text over dear imgui contents.");
   m.def("BeginMenuBar", &ImGui::BeginMenuBar, "append to menu-bar of current window (requires ImGuiWindowFlags_MenuBar flag set on parent window).");
   m.def("EndMenuBar", &ImGui::EndMenuBar, "only call EndMenuBar() if BeginMenuBar() returns true!");
   m.def("BeginMainMenuBar", &ImGui::BeginMainMenuBar, "create and append to a full screen menu-bar.");
   m.def("EndMainMenuBar", &ImGui::EndMainMenuBar, "only call EndMainMenuBar() if BeginMainMenuBar() returns true!");
   m.def("BeginMenu", &ImGui::BeginMenu, py::arg("label"), py::arg("enabled") = true, "create a sub-menu entry. only call EndMenu() if this returns true!");
   m.def("EndMenu", &ImGui::EndMenu, "only call EndMenu() if BeginMenu() returns true!");
-  m.def("MenuItem", py::overload_cast<const char*, const char*, bool, bool>(&ImGui::MenuItem), py::arg("label"), py::arg("shortcut") = NULL, py::arg("selected") = false, py::arg("enabled") = true, "return true when activated.");
+  m.def("MenuItem", py::overload_cast<const char*, const char*, bool, bool>(&ImGui::MenuItem), py::arg("label"), py::arg("shortcut") = py::none(), py::arg("selected") = false, py::arg("enabled") = true, "return true when activated.");
   m.def("BeginTooltip", &ImGui::BeginTooltip, "begin/append a tooltip window.");
   m.def("EndTooltip", &ImGui::EndTooltip, "only call EndTooltip() if BeginTooltip()/BeginItemTooltip() returns true!");
   m.def("BeginItemTooltip", &ImGui::BeginItemTooltip, "begin/append a tooltip window if preceding item was hovered.");
   m.def("BeginPopup", &ImGui::BeginPopup, py::arg("str_id"), py::arg("flags") = 0, "return true if the popup is open, and you can start outputting to it.");
   m.def("EndPopup", &ImGui::EndPopup, "only call EndPopup() if BeginPopupXXX() returns true!");
-  m.def("OpenPopup", py::overload_cast<ImGuiID, ImGuiPopupFlags>(&ImGui::OpenPopup), py::arg("id"), py::arg("popup_flags") = 0, "id overload to facilitate calling from nested stacks");
   m.def("OpenPopup", py::overload_cast<const char*, ImGuiPopupFlags>(&ImGui::OpenPopup), py::arg("str_id"), py::arg("popup_flags") = 0, "call to mark popup as open (don't call every frame!).");
-  m.def("OpenPopupOnItemClick", &ImGui::OpenPopupOnItemClick, py::arg("str_id") = NULL, py::arg("popup_flags") = 1, "helper to open popup when clicked on last item. Default to ImGuiPopupFlags_MouseButtonRight == 1. (note: actually triggers on the mouse _released_ event to be consistent with popup behaviors)");
+  m.def("OpenPopup", py::overload_cast<ImGuiID, ImGuiPopupFlags>(&ImGui::OpenPopup), py::arg("id"), py::arg("popup_flags") = 0, "id overload to facilitate calling from nested stacks");
+  m.def("OpenPopupOnItemClick", &ImGui::OpenPopupOnItemClick, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "helper to open popup when clicked on last item. Default to ImGuiPopupFlags_MouseButtonRight == 1. (note: actually triggers on the mouse _released_ event to be consistent with popup behaviors)");
   m.def("CloseCurrentPopup", &ImGui::CloseCurrentPopup, "manually close the popup we have begin-ed into.");
-  m.def("BeginPopupContextItem", &ImGui::BeginPopupContextItem, py::arg("str_id") = NULL, py::arg("popup_flags") = 1, "open+begin popup when clicked on last item. Use str_id==NULL to associate the popup to previous item. If you want to use that on a non-interactive item such as Text() you need to pass in an explicit ID here. read comments in .cpp!");
-  m.def("BeginPopupContextWindow", &ImGui::BeginPopupContextWindow, py::arg("str_id") = NULL, py::arg("popup_flags") = 1, "open+begin popup when clicked on current window.");
-  m.def("BeginPopupContextVoid", &ImGui::BeginPopupContextVoid, py::arg("str_id") = NULL, py::arg("popup_flags") = 1, "open+begin popup when clicked in void (where there are no windows).");
+  m.def("BeginPopupContextItem", &ImGui::BeginPopupContextItem, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "open+begin popup when clicked on last item. Use str_id==NULL to associate the popup to previous item. If you want to use that on a non-interactive item such as Text() you need to pass in an explicit ID here. read comments in .cpp!");
+  m.def("BeginPopupContextWindow", &ImGui::BeginPopupContextWindow, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "open+begin popup when clicked on current window.");
+  m.def("BeginPopupContextVoid", &ImGui::BeginPopupContextVoid, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "open+begin popup when clicked in void (where there are no windows).");
   m.def("IsPopupOpen", &ImGui::IsPopupOpen, py::arg("str_id"), py::arg("flags") = 0, "return true if the popup is open.");
   m.def("BeginTable", &ImGui::BeginTable, py::arg("str_id"), py::arg("column"), py::arg("flags") = 0, py::arg("outer_size") = ImVec2(0.0f, 0.0f), py::arg("inner_width") = 0.0f);
   m.def("EndTable", &ImGui::EndTable, "only call EndTable() if BeginTable() returns true!");
@@ -693,6 +3098,40 @@ void bind_imgui_to_py(py::module& m)
   m.def("TableGetColumnFlags", &ImGui::TableGetColumnFlags, py::arg("column_n") = -1, "return column flags so you can query their Enabled/Visible/Sorted/Hovered status flags. Pass -1 to use current column.");
   m.def("TableSetColumnEnabled", &ImGui::TableSetColumnEnabled, py::arg("column_n"), py::arg("v"), "change user accessible enabled/disabled state of a column. Set to false to hide the column. User can use the context menu to change this themselves (right-click in headers, or right-click in columns body with ImGuiTableFlags_ContextMenuInBody)");
   m.def("TableSetBgColor", &ImGui::TableSetBgColor, py::arg("target"), py::arg("color"), py::arg("column_n") = -1, "change the color of a cell, row, or column. See ImGuiTableBgTarget_ flags for details.");
+  m.def("TableGetSortSpecs", &ImGui::TableGetSortSpecs, py::return_value_policy::reference, "get latest sort specs for the table (NULL if not sorting).  Lifetime: don't hold on this pointer over multiple frames or past any subsequent call to BeginTable().");
+  m.def("DragFloat", [](const char* label, float v, float v_speed, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragFloat(label, &v, v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0.0f, py::arg("v_max") = 0.0f, py::arg("format") = "%.3f", py::arg("flags") = 0, "If v_min >= v_max we have no bound");
+  m.def("DragFloat2", [](const char* label, std::array<float, 2> v, float v_speed, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragFloat2(label, v.data(), v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1])); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0.0f, py::arg("v_max") = 0.0f, py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("DragFloat3", [](const char* label, std::array<float, 3> v, float v_speed, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragFloat3(label, v.data(), v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2])); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0.0f, py::arg("v_max") = 0.0f, py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("DragFloat4", [](const char* label, std::array<float, 4> v, float v_speed, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragFloat4(label, v.data(), v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2], v[3])); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0.0f, py::arg("v_max") = 0.0f, py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("DragInt", [](const char* label, int v, float v_speed, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragInt(label, &v, v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0, py::arg("v_max") = 0, py::arg("format") = "%d", py::arg("flags") = 0, "If v_min >= v_max we have no bound");
+  m.def("DragInt2", [](const char* label, std::array<int, 2> v, float v_speed, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragInt2(label, v.data(), v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1])); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0, py::arg("v_max") = 0, py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("DragInt3", [](const char* label, std::array<int, 3> v, float v_speed, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragInt3(label, v.data(), v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2])); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0, py::arg("v_max") = 0, py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("DragInt4", [](const char* label, std::array<int, 4> v, float v_speed, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::DragInt4(label, v.data(), v_speed, v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2], v[3])); }, py::arg("label"), py::arg("v"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0, py::arg("v_max") = 0, py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("SliderFloat", [](const char* label, float v, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderFloat(label, &v, v_min, v_max, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%.3f", py::arg("flags") = 0, "adjust format to decorate the value with a prefix or a suffix for in-slider labels or unit display.");
+  m.def("SliderFloat2", [](const char* label, std::array<float, 2> v, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderFloat2(label, v.data(), v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1])); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("SliderFloat3", [](const char* label, std::array<float, 3> v, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderFloat3(label, v.data(), v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2])); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("SliderFloat4", [](const char* label, std::array<float, 4> v, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderFloat4(label, v.data(), v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2], v[3])); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("SliderAngle", [](const char* label, float v_rad, float v_degrees_min, float v_degrees_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderAngle(label, &v_rad, v_degrees_min, v_degrees_max, format, flags); return py::make_tuple(mod, v_rad); }, py::arg("label"), py::arg("v_rad"), py::arg("v_degrees_min") = -360.0f, py::arg("v_degrees_max") = +360.0f, py::arg("format") = "%.0f deg", py::arg("flags") = 0);
+  m.def("SliderInt", [](const char* label, int v, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderInt(label, &v, v_min, v_max, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("SliderInt2", [](const char* label, std::array<int, 2> v, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderInt2(label, v.data(), v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1])); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("SliderInt3", [](const char* label, std::array<int, 3> v, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderInt3(label, v.data(), v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2])); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("SliderInt4", [](const char* label, std::array<int, 4> v, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::SliderInt4(label, v.data(), v_min, v_max, format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2], v[3])); }, py::arg("label"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("VSliderFloat", [](const char* label, const ImVec2& size, float v, float v_min, float v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::VSliderFloat(label, size, &v, v_min, v_max, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("size"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("VSliderInt", [](const char* label, const ImVec2& size, int v, int v_min, int v_max, const char* format, ImGuiSliderFlags flags) { bool mod = ImGui::VSliderInt(label, size, &v, v_min, v_max, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("size"), py::arg("v"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("InputFloat", [](const char* label, float v, float step, float step_fast, const char* format, ImGuiInputTextFlags flags) { bool mod = ImGui::InputFloat(label, &v, step, step_fast, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("v"), py::arg("step") = 0.0f, py::arg("step_fast") = 0.0f, py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("InputFloat2", [](const char* label, std::array<float, 2> v, const char* format, ImGuiInputTextFlags flags) { bool mod = ImGui::InputFloat2(label, v.data(), format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1])); }, py::arg("label"), py::arg("v"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("InputFloat3", [](const char* label, std::array<float, 3> v, const char* format, ImGuiInputTextFlags flags) { bool mod = ImGui::InputFloat3(label, v.data(), format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2])); }, py::arg("label"), py::arg("v"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("InputFloat4", [](const char* label, std::array<float, 4> v, const char* format, ImGuiInputTextFlags flags) { bool mod = ImGui::InputFloat4(label, v.data(), format, flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2], v[3])); }, py::arg("label"), py::arg("v"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("InputInt", [](const char* label, int v, int step, int step_fast, ImGuiInputTextFlags flags) { bool mod = ImGui::InputInt(label, &v, step, step_fast, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("v"), py::arg("step") = 1, py::arg("step_fast") = 100, py::arg("flags") = 0);
+  m.def("InputInt2", [](const char* label, std::array<int, 2> v, ImGuiInputTextFlags flags) { bool mod = ImGui::InputInt2(label, v.data(), flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1])); }, py::arg("label"), py::arg("v"), py::arg("flags") = 0);
+  m.def("InputInt3", [](const char* label, std::array<int, 3> v, ImGuiInputTextFlags flags) { bool mod = ImGui::InputInt3(label, v.data(), flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2])); }, py::arg("label"), py::arg("v"), py::arg("flags") = 0);
+  m.def("InputInt4", [](const char* label, std::array<int, 4> v, ImGuiInputTextFlags flags) { bool mod = ImGui::InputInt4(label, v.data(), flags); return py::make_tuple(mod, py::make_tuple(v[0], v[1], v[2], v[3])); }, py::arg("label"), py::arg("v"), py::arg("flags") = 0);
+  m.def("InputDouble", [](const char* label, double v, double step, double step_fast, const char* format, ImGuiInputTextFlags flags) { bool mod = ImGui::InputDouble(label, &v, step, step_fast, format, flags); return py::make_tuple(mod, v); }, py::arg("label"), py::arg("v"), py::arg("step") = 0.0, py::arg("step_fast") = 0.0, py::arg("format") = "%.6f", py::arg("flags") = 0);
+  m.def("ColorEdit3", [](const char* label, std::array<float, 3> col, ImGuiColorEditFlags flags) { bool mod = ImGui::ColorEdit3(label, col.data(), flags); return py::make_tuple(mod, py::make_tuple(col[0], col[1], col[2])); }, py::arg("label"), py::arg("col"), py::arg("flags") = 0);
+  m.def("ColorEdit4", [](const char* label, std::array<float, 4> col, ImGuiColorEditFlags flags) { bool mod = ImGui::ColorEdit4(label, col.data(), flags); return py::make_tuple(mod, py::make_tuple(col[0], col[1], col[2], col[3])); }, py::arg("label"), py::arg("col"), py::arg("flags") = 0);
+  m.def("ColorPicker3", [](const char* label, std::array<float, 3> col, ImGuiColorEditFlags flags) { bool mod = ImGui::ColorPicker3(label, col.data(), flags); return py::make_tuple(mod, py::make_tuple(col[0], col[1], col[2])); }, py::arg("label"), py::arg("col"), py::arg("flags") = 0);
+  m.def("ColorPicker4", [](const char* label, std::array<float, 4> col, ImGuiColorEditFlags flags) { bool mod = ImGui::ColorPicker4(label, col.data(), flags, NULL); return py::make_tuple(mod, py::make_tuple(col[0], col[1], col[2], col[3])); }, py::arg("label"), py::arg("col"), py::arg("flags") = 0);
+  m.def("ColorButton", &ImGui::ColorButton, py::arg("desc_id"), py::arg("col"), py::arg("flags") = 0, py::arg("size") = ImVec2(0, 0), "display a color square/button, hover for details, return true when pressed.");
   m.def("BeginTabBar", &ImGui::BeginTabBar, py::arg("str_id"), py::arg("flags") = 0, "create and append into a TabBar");
   m.def("EndTabBar", &ImGui::EndTabBar, "only call EndTabBar() if BeginTabBar() returns true!");
   m.def("EndTabItem", &ImGui::EndTabItem, "only call EndTabItem() if BeginTabItem() returns true!");
@@ -720,8 +3159,8 @@ void bind_imgui_to_py(py::module& m)
   m.def("GetItemRectMin", &ImGui::GetItemRectMin, "get upper-left bounding rectangle of the last item (screen space)");
   m.def("GetItemRectMax", &ImGui::GetItemRectMax, "get lower-right bounding rectangle of the last item (screen space)");
   m.def("GetItemRectSize", &ImGui::GetItemRectSize, "get size of last item");
-  m.def("IsRectVisible", py::overload_cast<const ImVec2&, const ImVec2&>(&ImGui::IsRectVisible), py::arg("rect_min"), py::arg("rect_max"), "test if rectangle (in screen space) is visible / not clipped. to perform coarse clipping on user's side.");
   m.def("IsRectVisible", py::overload_cast<const ImVec2&>(&ImGui::IsRectVisible), py::arg("size"), "test if rectangle (of given size, starting from cursor position) is visible / not clipped.");
+  m.def("IsRectVisible", py::overload_cast<const ImVec2&, const ImVec2&>(&ImGui::IsRectVisible), py::arg("rect_min"), py::arg("rect_max"), "test if rectangle (in screen space) is visible / not clipped. to perform coarse clipping on user's side.");
   m.def("BeginChildFrame", &ImGui::BeginChildFrame, py::arg("id"), py::arg("size"), py::arg("flags") = 0, "helper to create a child window / scrolling region that looks like a normal widget frame");
   m.def("EndChildFrame", &ImGui::EndChildFrame, "always call EndChildFrame() regardless of BeginChildFrame() return values (which indicates a collapsed/clipped window)");
   m.def("IsKeyDown", &ImGui::IsKeyDown, py::arg("key"), "is key being held.");
@@ -764,6 +3203,209 @@ void bind_imgui_to_py(py::module& m)
   m.def("Text", [](std::string_view str){
     ImGui::TextUnformatted(&*str.begin(), &*str.end());
   }, py::arg("text"));
+  m.def("TextLines", [](py::buffer data, py::buffer offsets, py::object colors) {
+    py::buffer_info datainfo = data.request();
+    if (datainfo.ndim != 1 || datainfo.itemsize != 1 || (datainfo.size > 1 && datainfo.strides[0] != 1))
+      throw py::value_error("data must be a contiguous buffer of bytes");
+    ImGuiDataType offtype;
+    py::buffer_info offinfo = request_int_buffer(offsets, offtype, "offsets");
+    char const* text = static_cast<char const*>(datainfo.ptr);
+    uint64_t textsize = uint64_t(datainfo.size);
+    ssize_t count = offinfo.size;
+    clipped_text_lines(count, colors, [&](int i) {
+      uint64_t begin = std::min(int_buffer_at(offinfo, offtype, i), textsize);
+      uint64_t end = i+1 < count ? std::min(int_buffer_at(offinfo, offtype, i+1), textsize) : textsize;
+      if (end > begin && text[end-1] == '\n')
+        --end;
+      return std::string_view(text + begin, size_t(std::max(begin, end) - begin));
+    });
+  }, py::arg("data"), py::arg("offsets"), py::arg("colors") = py::none(),
+  "draw the visible lines of UTF-8 `data`, line i starts at offsets[i] and ends before the next line start. colors: optional ImU32 text color per line");
+  m.def("TextLines", [](py::sequence lines, py::object colors) {
+    py::object line; // keeps the current item, and its UTF-8 representation, alive while it is drawn
+    clipped_text_lines(ssize_t(lines.size()), colors, [&](int i) {
+      line = lines[i];
+      Py_ssize_t size;
+      char const* str = PyUnicode_AsUTF8AndSize(line.ptr(), &size);
+      if (!str)
+        throw py::error_already_set();
+      return std::string_view(str, size_t(size));
+    });
+  }, py::arg("lines"), py::arg("colors") = py::none(),
+  "draw the visible strings of `lines`. colors: optional ImU32 text color per line");
+  m.def("TableColumns", [](char const* str_id, py::sequence columns, py::object headers, py::object formats,
+                           ImGuiTableFlags flags, ImVec2 outer_size, uint64_t version) {
+    // row order of each table, sorted again when its sort specs or `version` change
+    struct Order
+    {
+      std::vector<int> rows;
+      uint64_t version = 0;
+      ImGuiContext* context = nullptr;
+      int frame = 0; // last frame the table was drawn in
+    };
+    static std::unordered_map<ImGuiID, Order> orders;
+    static int swept_frame = -1;
+
+    int count = int(columns.size());
+    if (count < 1 || count > 512)
+      throw py::value_error("TableColumns takes 1 to 512 columns");
+    if (!headers.is_none() && py::len(headers) != size_t(count))
+      throw py::value_error("headers must have one entry per column");
+    if (!formats.is_none() && py::len(formats) != size_t(count))
+      throw py::value_error("formats must have one entry per column");
+    std::vector<TableColumn> cols(count);
+    ssize_t rows = -1;
+    for (int c = 0; c < count; ++c) {
+      py::object column = columns[c];
+      ssize_t size;
+      if (PyObject_CheckBuffer(column.ptr())) {
+        cols[c].info = py::reinterpret_borrow<py::buffer>(column).request();
+        cols[c].type = buffer_data_type(cols[c].info);
+        if (cols[c].type == ImGuiDataType_COUNT)
+          throw py::type_error("column " + std::to_string(c) + ": unsupported buffer format '" + cols[c].info.format + "'");
+        if (cols[c].info.ndim != 1)
+          throw py::value_error("column " + std::to_string(c) + " must be a 1-d buffer");
+        py::object format = formats.is_none() ? py::object(py::none()) : py::object(formats[py::int_(c)]);
+        bool real = cols[c].type == ImGuiDataType_Float || cols[c].type == ImGuiDataType_Double;
+        cols[c].format = column_format(format.is_none() ? (real ? "%g" : "%d") : format.cast<std::string>(), cols[c].type);
+        size = cols[c].info.size;
+      } else {
+        // converted now: an error once BeginTable() ran would leave the table open
+        py::sequence seq = py::reinterpret_borrow<py::sequence>(column);
+        size = ssize_t(seq.size());
+        cols[c].items.reserve(size_t(size));
+        cols[c].strings.reserve(size_t(size));
+        for (ssize_t i = 0; i < size; ++i) {
+          py::object item = seq[i];
+          if (!PyUnicode_Check(item.ptr()))
+            throw py::type_error("column " + std::to_string(c) + ": item " + std::to_string(i) + " is not a str");
+          Py_ssize_t len;
+          char const* str = PyUnicode_AsUTF8AndSize(item.ptr(), &len);
+          if (!str)
+            throw py::error_already_set();
+          cols[c].strings.emplace_back(str, size_t(len));
+          cols[c].items.push_back(std::move(item));
+        }
+      }
+      if (rows >= 0 && size != rows)
+        throw py::value_error("columns must all have the same length");
+      rows = size;
+    }
+    if (rows > INT_MAX)
+      throw py::value_error("too many rows, ImGuiListClipper counts them in an int");
+    std::vector<std::string> header_names(headers.is_none() ? 0 : size_t(count));
+    for (size_t c = 0; c < header_names.size(); ++c) {
+      py::object header = headers[py::int_(c)];
+      if (!PyUnicode_Check(header.ptr()))
+        throw py::type_error("header " + std::to_string(c) + " is not a str");
+      header_names[c] = header.cast<std::string>();
+    }
+
+    // once per frame, forget the tables not drawn in the previous frame or drawn by another context
+    ImGuiContext* context = ImGui::GetCurrentContext();
+    int frame = ImGui::GetFrameCount();
+    if (frame != swept_frame) {
+      for (auto it = orders.begin(); it != orders.end();) {
+        if (it->second.context != context || it->second.frame < frame - 1 || it->second.frame > frame)
+          it = orders.erase(it);
+        else
+          ++it;
+      }
+      swept_frame = frame;
+    }
+
+    ImGuiID id = ImGui::GetID(str_id);
+    if (auto it = orders.find(id); it != orders.end())
+      it->second.frame = frame; // kept while the table is submitted, even when clipped
+    if (!ImGui::BeginTable(str_id, count, flags, outer_size))
+      return false;
+    struct End { ~End() { ImGui::EndTable(); } } end;
+    ImGui::TableSetupScrollFreeze(0, header_names.empty() ? 0 : 1);
+    for (int c = 0; c < count; ++c)
+      ImGui::TableSetupColumn(header_names.empty() ? "" : header_names[c].c_str());
+    if (!header_names.empty())
+      ImGui::TableHeadersRow();
+
+    Order& order = orders[id];
+    order.context = context;
+    order.frame = frame;
+    ImGuiTableSortSpecs* specs = ImGui::TableGetSortSpecs();
+    if (!specs || specs->SpecsCount == 0) {
+      order.rows.clear();
+    } else if (specs->SpecsDirty || order.version != version || order.rows.size() != size_t(rows)) {
+      order.rows.resize(size_t(rows));
+      for (int i = 0; i < int(rows); ++i)
+        order.rows[i] = i;
+      std::stable_sort(order.rows.begin(), order.rows.end(), [&](int a, int b) {
+        for (int s = 0; s < specs->SpecsCount; ++s) {
+          int r = cols[specs->Specs[s].ColumnIndex].compare(a, b);
+          if (r != 0)
+            return specs->Specs[s].SortDirection == ImGuiSortDirection_Descending ? r > 0 : r < 0;
+        }
+        return false;
+      });
+      order.version = version;
+      specs->SpecsDirty = false;
+    }
+
+    char buf[128];
+    ImGuiListClipper clipper;
+    clipper.Begin(int(rows));
+    while (clipper.Step()) {
+      for (int i = clipper.DisplayStart; i < clipper.DisplayEnd; ++i) {
+        int row = order.rows.empty() ? i : order.rows[i];
+        ImGui::TableNextRow();
+        for (int c = 0; c < count; ++c) {
+          if (!ImGui::TableSetColumnIndex(c))
+            continue;
+          std::string_view text = cols[c].text(row, buf);
+          ImGui::TextUnformatted(text.data(), text.data() + text.size());
+        }
+      }
+    }
+    clipper.End();
+    return true;
+  }, py::arg("str_id"), py::arg("columns"), py::arg("headers") = py::none(), py::arg("formats") = py::none(),
+  py::arg("flags") = ImGuiTableFlags_Sortable | ImGuiTableFlags_ScrollY | ImGuiTableFlags_RowBg | ImGuiTableFlags_BordersOuter | ImGuiTableFlags_BordersV | ImGuiTableFlags_Resizable,
+  py::arg("outer_size") = ImVec2(0, 0), py::arg("version") = 0,
+  "draw a table of `columns`, each a 1-d numeric buffer or a sequence of str, only visiting the visible rows. headers: optional column names. formats: optional printf format per numeric column (None for the default). "
+  "Rows are sorted natively when the sort specs change or `version` differs from the previous call, bump it when the data changes. Returns False when the table is not visible");
+  m.def("PushStylePreset", &push_style_preset, py::arg("preset"), "push all the overrides of `preset` in one call");
+  m.def("PopStylePreset", &pop_style_preset, py::arg("preset"), "pop the overrides pushed by the last PushStylePreset(preset)");
+  m.def("GetInputSnapshot", [](InputSnapshot& s) -> InputSnapshot& {
+    take_input_snapshot(s);
+    return s;
+  }, py::arg("snapshot"), py::return_value_policy::reference,
+  "fill `snapshot` with the key and mouse state of the current frame in one call and return it, its arrays are updated in place");
+  m.def("GetInputSnapshot", []() {
+    InputSnapshot s;
+    take_input_snapshot(s);
+    return s;
+  }, "a new InputSnapshot of the current frame, pass one back to GetInputSnapshot(snapshot) to reuse it");
+  m.def("PlotLines", [](char const* label, py::buffer values, int values_offset, char const* overlay_text, float scale_min, float scale_max, ImVec2 graph_size) {
+    plot_buffer(py::overload_cast<char const*, float const*, int, int, char const*, float, float, ImVec2, int>(&ImGui::PlotLines),
+                py::overload_cast<char const*, float (*)(void*, int), void*, int, int, char const*, float, float, ImVec2>(&ImGui::PlotLines),
+                label, values, values_offset, overlay_text, scale_min, scale_max, graph_size);
+  }, py::arg("label"), py::arg("values"), py::arg("values_offset") = 0, py::arg("overlay_text") = nullptr,
+  py::arg("scale_min") = FLT_MAX, py::arg("scale_max") = FLT_MAX, py::arg("graph_size") = ImVec2(0, 0),
+  "plot a 1-d float32 or float64 buffer (NumPy array, array.array, memoryview), read in place. values_offset: index of the oldest sample of a ring buffer");
+  m.def("PlotHistogram", [](char const* label, py::buffer values, int values_offset, char const* overlay_text, float scale_min, float scale_max, ImVec2 graph_size) {
+    plot_buffer(py::overload_cast<char const*, float const*, int, int, char const*, float, float, ImVec2, int>(&ImGui::PlotHistogram),
+                py::overload_cast<char const*, float (*)(void*, int), void*, int, int, char const*, float, float, ImVec2>(&ImGui::PlotHistogram),
+                label, values, values_offset, overlay_text, scale_min, scale_max, graph_size);
+  }, py::arg("label"), py::arg("values"), py::arg("values_offset") = 0, py::arg("overlay_text") = nullptr,
+  py::arg("scale_min") = FLT_MAX, py::arg("scale_max") = FLT_MAX, py::arg("graph_size") = ImVec2(0, 0),
+  "histogram of a 1-d float32 or float64 buffer (NumPy array, array.array, memoryview), read in place. values_offset: index of the oldest sample of a ring buffer");
+  m.def("InputText", [](char const* label, TextBuffer& buf, ImGuiInputTextFlags flags) {
+    bool mod = ImGui::InputText(label, &buf.text, flags);
+    buf.version += mod;
+    return mod;
+  }, py::arg("label"), py::arg("text"), py::arg("flags") = 0);
+  m.def("InputTextMultiline", [](char const* label, TextBuffer& buf, ImVec2 const& size, ImGuiInputTextFlags flags) {
+    bool mod = ImGui::InputTextMultiline(label, &buf.text, size, flags);
+    buf.version += mod;
+    return mod;
+  }, py::arg("label"), py::arg("text"), py::arg("size") = ImVec2(0,0), py::arg("flags") = 0);
   m.def("InputText", [](char const* label, std::string str, ImGuiInputTextFlags flags) {
     bool mod = ImGui::InputText(label, &str, flags);
     return py::make_tuple(mod, str);
@@ -776,6 +3418,34 @@ void bind_imgui_to_py(py::module& m)
     bool mod = ImGui::Checkbox(label, &checked);
     return py::make_tuple(mod, checked);
   }, py::arg("label"), py::arg("checked"));
+  // StateStore overloads: the value lives in `store` under the ID of the widget (`key` for RadioButton)
+  m.def("Begin", [](char const* name, ImGuiStorage& store, ImGuiWindowFlags flags) {
+    return ImGui::Begin(name, store.GetBoolRef(ImGui::GetID(name), true), flags);
+  }, py::arg("name"), py::arg("store"), py::arg("flags") = 0, "the open state is stored, True at first");
+  m.def("Checkbox", [](char const* label, ImGuiStorage& store) {
+    return ImGui::Checkbox(label, store.GetBoolRef(ImGui::GetID(label)));
+  }, py::arg("label"), py::arg("store"));
+  m.def("RadioButton", [](char const* label, ImGuiStorage& store, py::handle key, int v_button) {
+    return ImGui::RadioButton(label, store.GetIntRef(state_key(key)), v_button);
+  }, py::arg("label"), py::arg("store"), py::arg("key"), py::arg("v_button"), "the int value shared by the buttons of a group is stored under `key`");
+  m.def("Selectable", [](char const* label, ImGuiStorage& store, ImGuiSelectableFlags flags, ImVec2 const& size) {
+    return ImGui::Selectable(label, store.GetBoolRef(ImGui::GetID(label)), flags, size);
+  }, py::arg("label"), py::arg("store"), py::arg("flags") = 0, py::arg("size") = ImVec2(0, 0));
+  m.def("MenuItem", [](char const* label, char const* shortcut, ImGuiStorage& store, bool enabled) {
+    return ImGui::MenuItem(label, shortcut, store.GetBoolRef(ImGui::GetID(label)), enabled);
+  }, py::arg("label"), py::arg("shortcut"), py::arg("store"), py::arg("enabled") = true);
+  m.def("DragFloat", [](char const* label, ImGuiStorage& store, float v_speed, float v_min, float v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::DragFloat(label, store.GetFloatRef(ImGui::GetID(label)), v_speed, v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0.0f, py::arg("v_max") = 0.0f, py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("DragInt", [](char const* label, ImGuiStorage& store, float v_speed, int v_min, int v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::DragInt(label, store.GetIntRef(ImGui::GetID(label)), v_speed, v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_speed") = 1.0f, py::arg("v_min") = 0, py::arg("v_max") = 0, py::arg("format") = "%d", py::arg("flags") = 0);
+  m.def("SliderFloat", [](char const* label, ImGuiStorage& store, float v_min, float v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::SliderFloat(label, store.GetFloatRef(ImGui::GetID(label)), v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%.3f", py::arg("flags") = 0);
+  m.def("SliderInt", [](char const* label, ImGuiStorage& store, int v_min, int v_max, char const* format, ImGuiSliderFlags flags) {
+    return ImGui::SliderInt(label, store.GetIntRef(ImGui::GetID(label)), v_min, v_max, format, flags);
+  }, py::arg("label"), py::arg("store"), py::arg("v_min"), py::arg("v_max"), py::arg("format") = "%d", py::arg("flags") = 0);
   m.def("BeginTabItem", [](char const* label, bool open, ImGuiTabItemFlags flags){
     bool shown = ImGui::BeginTabItem(label, &open, flags);
     return py::make_tuple(shown, open);
@@ -787,6 +3457,51 @@ void bind_imgui_to_py(py::module& m)
     ImGui::SetItemTooltip("%s", tip);
   }, py::arg("tooltip"));
   
+  // buffer protocol overloads edit the buffer in place, and return only the modified flag
+  m.def("DragScalar", [](char const* label, py::buffer value, float speed, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    uint64_t minmax[2];
+    void *pmin = nullptr, *pmax = nullptr;
+    if (!vmin.is_none()) { cast_data_type(vmin, type, minmax); pmin = minmax; }
+    if (!vmax.is_none()) { cast_data_type(vmax, type, minmax+1); pmax = minmax+1; }
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::DragScalarN(label, type, info.ptr, int(info.size), speed, pmin, pmax, format, flags);
+  }, py::arg("label"), py::arg("value"), py::arg("speed")=1.f, py::arg("min")=py::none(), py::arg("max")=py::none(), py::arg("format")="", py::arg("flags")=0);
+
+  m.def("SliderScalar", [](char const* label, py::buffer value, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    uint64_t minmax[2];
+    cast_data_type(vmin, type, minmax);
+    cast_data_type(vmax, type, minmax+1);
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::SliderScalarN(label, type, info.ptr, int(info.size), minmax, minmax+1, format, flags);
+  }, py::arg("label"), py::arg("value"), py::arg("min")=0, py::arg("max")=10, py::arg("format")="", py::arg("flags")=0);
+
+  m.def("VSliderScalar", [](char const* label, ImVec2 const& size, py::buffer value, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    if (info.size != 1)
+      throw py::value_error("VSliderScalar takes a single component buffer");
+    uint64_t minmax[2];
+    cast_data_type(vmin, type, minmax);
+    cast_data_type(vmax, type, minmax+1);
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::VSliderScalar(label, size, type, info.ptr, minmax, minmax+1, format, flags);
+  }, py::arg("label"), py::arg("size"), py::arg("value"), py::arg("min")=0, py::arg("max")=10, py::arg("format")="", py::arg("flags")=0);
+
+  m.def("InputScalar", [](char const* label, py::buffer value, py::object step, py::object step_fast, char const* format, ImGuiInputTextFlags flags){
+    ImGuiDataType type;
+    py::buffer_info info = request_scalar_buffer(value, type);
+    uint64_t steps[2];
+    void *pstep = nullptr, *pstep_fast = nullptr;
+    if (!step.is_none()) { cast_data_type(step, type, steps); pstep = steps; }
+    if (!step_fast.is_none()) { cast_data_type(step_fast, type, steps+1); pstep_fast = steps+1; }
+    if (format && format[0]==0) format = nullptr;
+    return ImGui::InputScalarN(label, type, info.ptr, int(info.size), pstep, pstep_fast, format, flags);
+  }, py::arg("label"), py::arg("value"), py::arg("step")=py::none(), py::arg("step_fast")=py::none(), py::arg("format")="", py::arg("flags")=0);
+
   m.def("DragScalar", [](char const* label, ImGuiDataType type, py::object value, float speed, py::object vmin, py::object vmax, char const* format, ImGuiSliderFlags flags){
     int8_t   i8[4]  = {0}, i8minmax[2];
     uint8_t  u8[4]  = {0}, u8minmax[2];
@@ -805,8 +3520,8 @@ void bind_imgui_to_py(py::module& m)
 #define TYPE_CASE(X, Y, T) \
         case ImGuiDataType_##X:\
           pdata = Y; Y[comp] = py::cast<T>(val);\
-          if (!pmin && vmin) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
-          if (!pmax && vmax) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
+          if (!pmin && !vmin.is_none()) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
+          if (!pmax && !vmax.is_none()) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
           break
     auto assign = [&](int comp, py::handle val) {
       switch(type) {
@@ -890,8 +3605,8 @@ void bind_imgui_to_py(py::module& m)
 #define TYPE_CASE(X, Y, T) \
         case ImGuiDataType_##X:\
           pdata = Y; Y[comp] = py::cast<T>(val);\
-          if (!pmin && vmin) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
-          if (!pmax && vmax) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
+          if (!pmin && !vmin.is_none()) { Y##minmax[0] = py::cast<T>(vmin); pmin = Y##minmax; }\
+          if (!pmax && !vmax.is_none()) { Y##minmax[1] = py::cast<T>(vmax); pmax = Y##minmax+1; }\
           break
     auto assign = [&](int comp, py::handle val) {
       switch(type) {
@@ -956,6 +3671,274 @@ void bind_imgui_to_py(py::module& m)
       return py::make_tuple(mod, retval[0]);
   }, py::arg("label"), py::arg("type"), py::arg("value"), py::arg("min")=0, py::arg("max")=10, py::arg("format")="%.3f", py::arg("flags")=0);
 
-  // TODO: VSliderScalar, InputScalarN, ColorEdit3, ColorEdit4, ColorPicker3, ColorPicker3, ColorButton
+  py::class_<CommandBuffer> cmdbuf(m, "CommandBuffer", "Records calls into a compact binary stream for Replay(). Methods mirror the module API; those with a return value return the index of their result slot.");
+
+  cmdbuf
+    .def(py::init<>())
+    .def("__len__", [](CommandBuffer const& cb) { return cb.numCommands; })
+    .def_readonly("NumResults", &CommandBuffer::numResults, "number of result slots Replay() will return")
+    .def_property_readonly("NumBytes", [](CommandBuffer const& cb) { return cb.data.size(); })
+    .def("Clear", &CommandBuffer::clear, "drop all recorded commands, so the buffer can be recorded again")
+    .def("If", [](CommandBuffer& cb, int slot) {
+      if (slot < 0 || slot >= cb.numResults)
+        throw std::out_of_range("result slot out of range");
+      cb.op(CommandOp_If);
+      cb.put(slot);
+      cb.openIfs.push_back(cb.data.size());
+      cb.put(uint32_t(0));
+    }, py::arg("slot"), "replay the following commands up to the matching EndIf() only if result `slot` is true (for tuple results: its first element)")
+    .def("EndIf", [](CommandBuffer& cb) {
+      if (cb.openIfs.empty())
+        throw std::runtime_error("EndIf() without matching If()");
+      cb.op(CommandOp_EndIf);
+      uint32_t target = uint32_t(cb.data.size());
+      memcpy(cb.data.data() + cb.openIfs.back(), &target, sizeof(target));
+      cb.openIfs.pop_back();
+    })
+    .def("Begin", [](CommandBuffer& cb, char const* name, bool open, ImGuiWindowFlags flags) {
+      cb.op(CommandOp_Begin);
+      int slot = cb.result();
+      cb.put(name); cb.put(open); cb.put(flags);
+      return slot;
+    }, py::arg("name"), py::arg("open") = true, py::arg("flags") = 0)
+    .def("BeginPopupModal", [](CommandBuffer& cb, char const* name, bool open, ImGuiWindowFlags flags) {
+      cb.op(CommandOp_BeginPopupModal);
+      int slot = cb.result();
+      cb.put(name); cb.put(open); cb.put(flags);
+      return slot;
+    }, py::arg("name"), py::arg("open") = true, py::arg("flags") = 0)
+    .def("BeginTabItem", [](CommandBuffer& cb, char const* label, bool open, ImGuiTabItemFlags flags) {
+      cb.op(CommandOp_BeginTabItem);
+      int slot = cb.result();
+      cb.put(label); cb.put(open); cb.put(flags);
+      return slot;
+    }, py::arg("name"), py::arg("open") = true, py::arg("flags") = 0)
+    .def("PushID", [](CommandBuffer& cb, char const* str_id) {
+      cb.op(CommandOp_PushID_Str);
+      cb.put(str_id);
+    }, py::arg("str_id"))
+    .def("PushID", [](CommandBuffer& cb, int int_id) {
+      cb.op(CommandOp_PushID_Int);
+      cb.put(int_id);
+    }, py::arg("int_id"))
+    .def("GetID", [](CommandBuffer& cb, char const* str_id) {
+      cb.op(CommandOp_GetID);
+      int slot = cb.result();
+      cb.put(str_id);
+      return slot;
+    }, py::arg("str_id"))
+    .def("Text", [](CommandBuffer& cb, std::string_view str) {
+      cb.op(CommandOp_Text);
+      cb.put(str);
+    }, py::arg("text"))
+    .def("Checkbox", [](CommandBuffer& cb, char const* label, bool checked) {
+      cb.op(CommandOp_Checkbox);
+      int slot = cb.result();
+      cb.put(label); cb.put(checked);
+      return slot;
+    }, py::arg("label"), py::arg("checked"))
+    .def("SetTooltip", [](CommandBuffer& cb, char const* tip) {
+      cb.op(CommandOp_SetTooltip);
+      cb.put(tip);
+    }, py::arg("tooltip"))
+    .def("SetItemTooltip", [](CommandBuffer& cb, char const* tip) {
+      cb.op(CommandOp_SetItemTooltip);
+      cb.put(tip);
+    }, py::arg("tooltip"))
+    .def("End", [](CommandBuffer& cb) { cb.op(CommandOp_End); })
+    .def("BeginChild", [](CommandBuffer& cb, const char* str_id, const ImVec2& size, bool border, ImGuiWindowFlags window_flags) { cb.op(CommandOp_BeginChild_StrImVec2BoolWindowFlags); int slot = cb.result(); cb.put(str_id); cb.put(size); cb.put(border); cb.put(window_flags); return slot; }, py::arg("str_id"), py::arg("size") = ImVec2(0, 0), py::arg("border") = false, py::arg("window_flags") = 0)
+    .def("BeginChild", [](CommandBuffer& cb, ImGuiID id, const ImVec2& size, bool border, ImGuiWindowFlags window_flags) { cb.op(CommandOp_BeginChild_IDImVec2BoolWindowFlags); int slot = cb.result(); cb.put(id); cb.put(size); cb.put(border); cb.put(window_flags); return slot; }, py::arg("id"), py::arg("size") = ImVec2(0, 0), py::arg("border") = false, py::arg("window_flags") = 0)
+    .def("EndChild", [](CommandBuffer& cb) { cb.op(CommandOp_EndChild); })
+    .def("IsWindowAppearing", [](CommandBuffer& cb) { cb.op(CommandOp_IsWindowAppearing); int slot = cb.result(); return slot; })
+    .def("IsWindowCollapsed", [](CommandBuffer& cb) { cb.op(CommandOp_IsWindowCollapsed); int slot = cb.result(); return slot; })
+    .def("IsWindowFocused", [](CommandBuffer& cb, ImGuiFocusedFlags flags) { cb.op(CommandOp_IsWindowFocused); int slot = cb.result(); cb.put(flags); return slot; }, py::arg("flags") = 0, "is current window focused? or its root/child, depending on flags. see flags for options.")
+    .def("IsWindowHovered", [](CommandBuffer& cb, ImGuiHoveredFlags flags) { cb.op(CommandOp_IsWindowHovered); int slot = cb.result(); cb.put(flags); return slot; }, py::arg("flags") = 0, "is current window hovered (and typically: not blocked by a popup/modal)? see flags for options. NB: If you are trying to check whether your mouse should be dispatched to imgui or to your app, you should use the 'io.WantCaptureMouse' boolean for that! Please read the FAQ!")
+    .def("GetWindowPos", [](CommandBuffer& cb) { cb.op(CommandOp_GetWindowPos); int slot = cb.result(); return slot; }, "get current window position in screen space (note: it is unlikely you need to use this. Consider using current layout pos instead, GetCursorScreenPos())")
+    .def("GetWindowSize", [](CommandBuffer& cb) { cb.op(CommandOp_GetWindowSize); int slot = cb.result(); return slot; }, "get current window size (note: it is unlikely you need to use this. Consider using GetCursorScreenPos() and e.g. GetContentRegionAvail() instead)")
+    .def("GetWindowWidth", [](CommandBuffer& cb) { cb.op(CommandOp_GetWindowWidth); int slot = cb.result(); return slot; }, "get current window width (shortcut for GetWindowSize().x)")
+    .def("GetWindowHeight", [](CommandBuffer& cb) { cb.op(CommandOp_GetWindowHeight); int slot = cb.result(); return slot; }, "get current window height (shortcut for GetWindowSize().y)")
+    .def("SetNextWindowPos", [](CommandBuffer& cb, const ImVec2& pos, ImGuiCond cond, const ImVec2& pivot) { cb.op(CommandOp_SetNextWindowPos); cb.put(pos); cb.put(cond); cb.put(pivot); }, py::arg("pos"), py::arg("cond") = 0, py::arg("pivot") = ImVec2(0, 0), "set next window position. call before Begin(). use pivot=(0.5f,0.5f) to center on given point, etc.")
+    .def("SetNextWindowSize", [](CommandBuffer& cb, const ImVec2& size, ImGuiCond cond) { cb.op(CommandOp_SetNextWindowSize); cb.put(size); cb.put(cond); }, py::arg("size"), py::arg("cond") = 0, "set next window size. set axis to 0.0f to force an auto-fit on this axis. call before Begin()")
+    .def("SetNextWindowContentSize", [](CommandBuffer& cb, const ImVec2& size) { cb.op(CommandOp_SetNextWindowContentSize); cb.put(size); }, py::arg("size"), "set next window content size (~ scrollable client area, which enforce the range of scrollbars). Not including window decorations (title bar, menu bar, etc.) nor WindowPadding. set an axis to 0.0f to leave it automatic. call before Begin()")
+    .def("SetNextWindowCollapsed", [](CommandBuffer& cb, bool collapsed, ImGuiCond cond) { cb.op(CommandOp_SetNextWindowCollapsed); cb.put(collapsed); cb.put(cond); }, py::arg("collapsed"), py::arg("cond") = 0, "set next window collapsed state. call before Begin()")
+    .def("SetNextWindowFocus", [](CommandBuffer& cb) { cb.op(CommandOp_SetNextWindowFocus); }, "set next window to be focused / top-most. call before Begin()")
+    .def("SetNextWindowBgAlpha", [](CommandBuffer& cb, float alpha) { cb.op(CommandOp_SetNextWindowBgAlpha); cb.put(alpha); }, py::arg("alpha"), "set next window background color alpha. helper to easily override the Alpha component of ImGuiCol_WindowBg/ChildBg/PopupBg. you may also use ImGuiWindowFlags_NoBackground.")
+    .def("SetWindowPos", [](CommandBuffer& cb, const ImVec2& pos, ImGuiCond cond) { cb.op(CommandOp_SetWindowPos_ImVec2Cond); cb.put(pos); cb.put(cond); }, py::arg("pos"), py::arg("cond") = 0, "(not recommended) set current window position - call within Begin()/End(). prefer using SetNextWindowPos(), as this may incur tearing and side-effects.")
+    .def("SetWindowPos", [](CommandBuffer& cb, const char* name, const ImVec2& pos, ImGuiCond cond) { cb.op(CommandOp_SetWindowPos_StrImVec2Cond); cb.put(name); cb.put(pos); cb.put(cond); }, py::arg("name"), py::arg("pos"), py::arg("cond") = 0, "set named window position.")
+    .def("SetWindowSize", [](CommandBuffer& cb, const ImVec2& size, ImGuiCond cond) { cb.op(CommandOp_SetWindowSize_ImVec2Cond); cb.put(size); cb.put(cond); }, py::arg("size"), py::arg("cond") = 0, "(not recommended) set current window size - call within Begin()/End(). set to ImVec2(0, 0) to force an auto-fit. prefer using SetNextWindowSize(), as this may incur tearing and minor side-effects.")
+    .def("SetWindowSize", [](CommandBuffer& cb, const char* name, const ImVec2& size, ImGuiCond cond) { cb.op(CommandOp_SetWindowSize_StrImVec2Cond); cb.put(name); cb.put(size); cb.put(cond); }, py::arg("name"), py::arg("size"), py::arg("cond") = 0, "set named window size. set axis to 0.0f to force an auto-fit on this axis.")
+    .def("SetWindowCollapsed", [](CommandBuffer& cb, bool collapsed, ImGuiCond cond) { cb.op(CommandOp_SetWindowCollapsed_BoolCond); cb.put(collapsed); cb.put(cond); }, py::arg("collapsed"), py::arg("cond") = 0, "(not recommended) set current window collapsed state. prefer using SetNextWindowCollapsed().")
+    .def("SetWindowCollapsed", [](CommandBuffer& cb, const char* name, bool collapsed, ImGuiCond cond) { cb.op(CommandOp_SetWindowCollapsed_StrBoolCond); cb.put(name); cb.put(collapsed); cb.put(cond); }, py::arg("name"), py::arg("collapsed"), py::arg("cond") = 0, "set named window collapsed state")
+    .def("SetWindowFocus", [](CommandBuffer& cb) { cb.op(CommandOp_SetWindowFocus_Void); }, "(not recommended) set current window to be focused / top-most. prefer using SetNextWindowFocus().")
+    .def("SetWindowFocus", [](CommandBuffer& cb, const char* name) { cb.op(CommandOp_SetWindowFocus_Str); cb.put(name); }, py::arg("name"), "set named window to be focused / top-most. use NULL to remove focus.")
+    .def("SetWindowFontScale", [](CommandBuffer& cb, float scale) { cb.op(CommandOp_SetWindowFontScale); cb.put(scale); }, py::arg("scale"), "[OBSOLETE] set font scale. Adjust IO.FontGlobalScale if you want to scale all windows. This is an old API! For correct scaling, prefer to reload font + rebuild ImFontAtlas + call style.ScaleAllSizes().")
+    .def("GetContentRegionAvail", [](CommandBuffer& cb) { cb.op(CommandOp_GetContentRegionAvail); int slot = cb.result(); return slot; }, "== GetContentRegionMax() - GetCursorPos()")
+    .def("GetContentRegionMax", [](CommandBuffer& cb) { cb.op(CommandOp_GetContentRegionMax); int slot = cb.result(); return slot; }, "current content boundaries (typically window boundaries including scrolling, or current column boundaries), in windows coordinates")
+    .def("GetWindowContentRegionMin", [](CommandBuffer& cb) { cb.op(CommandOp_GetWindowContentRegionMin); int slot = cb.result(); return slot; }, "content boundaries min for the full window (roughly (0,0)-Scroll), in window coordinates")
+    .def("GetWindowContentRegionMax", [](CommandBuffer& cb) { cb.op(CommandOp_GetWindowContentRegionMax); int slot = cb.result(); return slot; }, "content boundaries max for the full window (roughly (0,0)+Size-Scroll) where Size can be overridden with SetNextWindowContentSize(), in window coordinates")
+    .def("GetScrollX", [](CommandBuffer& cb) { cb.op(CommandOp_GetScrollX); int slot = cb.result(); return slot; }, "get scrolling amount [0 .. GetScrollMaxX()]")
+    .def("GetScrollY", [](CommandBuffer& cb) { cb.op(CommandOp_GetScrollY); int slot = cb.result(); return slot; }, "get scrolling amount [0 .. GetScrollMaxY()]")
+    .def("SetScrollX", [](CommandBuffer& cb, float scroll_x) { cb.op(CommandOp_SetScrollX); cb.put(scroll_x); }, py::arg("scroll_x"), "set scrolling amount [0 .. GetScrollMaxX()]")
+    .def("SetScrollY", [](CommandBuffer& cb, float scroll_y) { cb.op(CommandOp_SetScrollY); cb.put(scroll_y); }, py::arg("scroll_y"), "set scrolling amount [0 .. GetScrollMaxY()]")
+    .def("GetScrollMaxX", [](CommandBuffer& cb) { cb.op(CommandOp_GetScrollMaxX); int slot = cb.result(); return slot; }, "get maximum scrolling amount ~~ ContentSize.x - WindowSize.x - DecorationsSize.x")
+    .def("GetScrollMaxY", [](CommandBuffer& cb) { cb.op(CommandOp_GetScrollMaxY); int slot = cb.result(); return slot; }, "get maximum scrolling amount ~~ ContentSize.y - WindowSize.y - DecorationsSize.y")
+    .def("SetScrollHereX", [](CommandBuffer& cb, float center_x_ratio) { cb.op(CommandOp_SetScrollHereX); cb.put(center_x_ratio); }, py::arg("center_x_ratio") = 0.5f, "adjust scrolling amount to make current cursor position visible. center_x_ratio=0.0: left, 0.5: center, 1.0: right. When using to make a \"default/current item\" visible, consider using SetItemDefaultFocus() instead.")
+    .def("SetScrollHereY", [](CommandBuffer& cb, float center_y_ratio) { cb.op(CommandOp_SetScrollHereY); cb.put(center_y_ratio); }, py::arg("center_y_ratio") = 0.5f, "adjust scrolling amount to make current cursor position visible. center_y_ratio=0.0: top, 0.5: center, 1.0: bottom. When using to make a \"default/current item\" visible, consider using SetItemDefaultFocus() instead.")
+    .def("SetScrollFromPosX", [](CommandBuffer& cb, float local_x, float center_x_ratio) { cb.op(CommandOp_SetScrollFromPosX); cb.put(local_x); cb.put(center_x_ratio); }, py::arg("local_x"), py::arg("center_x_ratio") = 0.5f, "adjust scrolling amount to make given position visible. Generally GetCursorStartPos() + offset to compute a valid position.")
+    .def("SetScrollFromPosY", [](CommandBuffer& cb, float local_y, float center_y_ratio) { cb.op(CommandOp_SetScrollFromPosY); cb.put(local_y); cb.put(center_y_ratio); }, py::arg("local_y"), py::arg("center_y_ratio") = 0.5f, "adjust scrolling amount to make given position visible. Generally GetCursorStartPos() + offset to compute a valid position.")
+    .def("PushStyleColor", [](CommandBuffer& cb, ImGuiCol idx, ImU32 col) { cb.op(CommandOp_PushStyleColor_ColImU32); cb.put(idx); cb.put(col); }, py::arg("idx"), py::arg("col"), "modify a style color. always use this if you modify the style after NewFrame().")
+    .def("PushStyleColor", [](CommandBuffer& cb, ImGuiCol idx, const ImVec4& col) { cb.op(CommandOp_PushStyleColor_ColImVec4); cb.put(idx); cb.put(col); }, py::arg("idx"), py::arg("col"))
+    .def("PopStyleColor", [](CommandBuffer& cb, int count) { cb.op(CommandOp_PopStyleColor); cb.put(count); }, py::arg("count") = 1)
+    .def("PushStyleVar", [](CommandBuffer& cb, ImGuiStyleVar idx, float val) { cb.op(CommandOp_PushStyleVar_StyleVarFloat); cb.put(idx); cb.put(val); }, py::arg("idx"), py::arg("val"), "modify a style float variable. always use this if you modify the style after NewFrame().")
+    .def("PushStyleVar", [](CommandBuffer& cb, ImGuiStyleVar idx, const ImVec2& val) { cb.op(CommandOp_PushStyleVar_StyleVarImVec2); cb.put(idx); cb.put(val); }, py::arg("idx"), py::arg("val"), "modify a style ImVec2 variable. always use this if you modify the style after NewFrame().")
+    .def("PopStyleVar", [](CommandBuffer& cb, int count) { cb.op(CommandOp_PopStyleVar); cb.put(count); }, py::arg("count") = 1)
+    .def("PushTabStop", [](CommandBuffer& cb, bool tab_stop) { cb.op(CommandOp_PushTabStop); cb.put(tab_stop); }, py::arg("tab_stop"), "== tab stop enable. Allow focusing using TAB/Shift-TAB, enabled by default but you can disable it for certain widgets")
+    .def("PopTabStop", [](CommandBuffer& cb) { cb.op(CommandOp_PopTabStop); })
+    .def("PushButtonRepeat", [](CommandBuffer& cb, bool repeat) { cb.op(CommandOp_PushButtonRepeat); cb.put(repeat); }, py::arg("repeat"), "in 'repeat' mode, Button*() functions return repeated true in a typematic manner (using io.KeyRepeatDelay/io.KeyRepeatRate setting). Note that you can call IsItemActive() after any Button() to tell if the button is held in the current frame.")
+    .def("PopButtonRepeat", [](CommandBuffer& cb) { cb.op(CommandOp_PopButtonRepeat); })
+    .def("PushItemWidth", [](CommandBuffer& cb, float item_width) { cb.op(CommandOp_PushItemWidth); cb.put(item_width); }, py::arg("item_width"), "push width of items for common large \"item+label\" widgets. >0.0f: width in pixels, <0.0f align xx pixels to the right of window (so -FLT_MIN always align width to the right side).")
+    .def("PopItemWidth", [](CommandBuffer& cb) { cb.op(CommandOp_PopItemWidth); })
+    .def("SetNextItemWidth", [](CommandBuffer& cb, float item_width) { cb.op(CommandOp_SetNextItemWidth); cb.put(item_width); }, py::arg("item_width"), "set width of the _next_ common large \"item+label\" widget. >0.0f: width in pixels, <0.0f align xx pixels to the right of window (so -FLT_MIN always align width to the right side)")
+    .def("CalcItemWidth", [](CommandBuffer& cb) { cb.op(CommandOp_CalcItemWidth); int slot = cb.result(); return slot; }, "width of item given pushed settings and current cursor position. NOT necessarily the width of last item unlike most 'Item' functions.")
+    .def("PushTextWrapPos", [](CommandBuffer& cb, float wrap_local_pos_x) { cb.op(CommandOp_PushTextWrapPos); cb.put(wrap_local_pos_x); }, py::arg("wrap_local_pos_x") = 0.0f, "push word-wrapping position for Text*() commands. < 0.0f: no wrapping; 0.0f: wrap to end of window (or column); > 0.0f: wrap at 'wrap_pos_x' position in window local space")
+    .def("PopTextWrapPos", [](CommandBuffer& cb) { cb.op(CommandOp_PopTextWrapPos); })
+    .def("Separator", [](CommandBuffer& cb) { cb.op(CommandOp_Separator); }, "separator, generally horizontal. inside a menu bar or in horizontal layout mode, this becomes a vertical separator.")
+    .def("SameLine", [](CommandBuffer& cb, float offset_from_start_x, float spacing) { cb.op(CommandOp_SameLine); cb.put(offset_from_start_x); cb.put(spacing); }, py::arg("offset_from_start_x") = 0.0f, py::arg("spacing") = -1.0f, "call between widgets or groups to layout them horizontally. X position given in window coordinates.")
+    .def("NewLine", [](CommandBuffer& cb) { cb.op(CommandOp_NewLine); }, "undo a SameLine() or force a new line when in a horizontal-layout context.")
+    .def("Spacing", [](CommandBuffer& cb) { cb.op(CommandOp_Spacing); }, "add vertical spacing.")
+    .def("Dummy", [](CommandBuffer& cb, const ImVec2& size) { cb.op(CommandOp_Dummy); cb.put(size); }, py::arg("size"), "add a dummy item of given size. unlike InvisibleButton(), Dummy() won't take the mouse click or be navigable into.")
+    .def("Indent", [](CommandBuffer& cb, float indent_w) { cb.op(CommandOp_Indent); cb.put(indent_w); }, py::arg("indent_w") = 0.0f, "move content position toward the right, by indent_w, or style.IndentSpacing if indent_w <= 0")
+    .def("Unindent", [](CommandBuffer& cb, float indent_w) { cb.op(CommandOp_Unindent); cb.put(indent_w); }, py::arg("indent_w") = 0.0f, "move content position back to the left, by indent_w, or style.IndentSpacing if indent_w <= 0")
+    .def("BeginGroup", [](CommandBuffer& cb) { cb.op(CommandOp_BeginGroup); }, "lock horizontal starting position")
+    .def("EndGroup", [](CommandBuffer& cb) { cb.op(CommandOp_EndGroup); }, "unlock horizontal starting position + capture the whole group bounding box into one \"item\" (so you can use IsItemHovered() or layout primitives such as SameLine() on whole group, etc.)")
+    .def("GetCursorPos", [](CommandBuffer& cb) { cb.op(CommandOp_GetCursorPos); int slot = cb.result(); return slot; }, "[window-local] cursor position in window coordinates (relative to window position)")
+    .def("GetCursorPosX", [](CommandBuffer& cb) { cb.op(CommandOp_GetCursorPosX); int slot = cb.result(); return slot; }, "[window-local] \"")
+    .def("GetCursorPosY", [](CommandBuffer& cb) { cb.op(CommandOp_GetCursorPosY); int slot = cb.result(); return slot; }, "[window-local] \"")
+    .def("SetCursorPos", [](CommandBuffer& cb, const ImVec2& local_pos) { cb.op(CommandOp_SetCursorPos); cb.put(local_pos); }, py::arg("local_pos"), "[window-local] \"")
+    .def("SetCursorPosX", [](CommandBuffer& cb, float local_x) { cb.op(CommandOp_SetCursorPosX); cb.put(local_x); }, py::arg("local_x"), "[window-local] \"")
+    .def("SetCursorPosY", [](CommandBuffer& cb, float local_y) { cb.op(CommandOp_SetCursorPosY); cb.put(local_y); }, py::arg("local_y"), "[window-local] \"")
+    .def("GetCursorStartPos", [](CommandBuffer& cb) { cb.op(CommandOp_GetCursorStartPos); int slot = cb.result(); return slot; }, "[window-local] initial cursor position, in window coordinates")
+    .def("GetCursorScreenPos", [](CommandBuffer& cb) { cb.op(CommandOp_GetCursorScreenPos); int slot = cb.result(); return slot; }, "cursor position in absolute coordinates (prefer using this, also more useful to work with ImDrawList API).")
+    .def("SetCursorScreenPos", [](CommandBuffer& cb, const ImVec2& pos) { cb.op(CommandOp_SetCursorScreenPos); cb.put(pos); }, py::arg("pos"), "cursor position in absolute coordinates")
+    .def("AlignTextToFramePadding", [](CommandBuffer& cb) { cb.op(CommandOp_AlignTextToFramePadding); }, "vertically align upcoming text baseline to FramePadding.y so that it will align properly to regularly framed items (call if you have text on a line before a framed item)")
+    .def("GetTextLineHeight", [](CommandBuffer& cb) { cb.op(CommandOp_GetTextLineHeight); int slot = cb.result(); return slot; }, "~ FontSize")
+    .def("GetTextLineHeightWithSpacing", [](CommandBuffer& cb) { cb.op(CommandOp_GetTextLineHeightWithSpacing); int slot = cb.result(); return slot; }, "~ FontSize + style.ItemSpacing.y (distance in pixels between 2 consecutive lines of text)")
+    .def("GetFrameHeight", [](CommandBuffer& cb) { cb.op(CommandOp_GetFrameHeight); int slot = cb.result(); return slot; }, "~ FontSize + style.FramePadding.y * 2")
+    .def("GetFrameHeightWithSpacing", [](CommandBuffer& cb) { cb.op(CommandOp_GetFrameHeightWithSpacing); int slot = cb.result(); return slot; }, "~ FontSize + style.FramePadding.y * 2 + style.ItemSpacing.y (distance in pixels between 2 consecutive lines of framed widgets)")
+    .def("PopID", [](CommandBuffer& cb) { cb.op(CommandOp_PopID); }, "pop from the ID stack.")
+    .def("Button", [](CommandBuffer& cb, const char* label, const ImVec2& size) { cb.op(CommandOp_Button); int slot = cb.result(); cb.put(label); cb.put(size); return slot; }, py::arg("label"), py::arg("size") = ImVec2(0, 0), "button")
+    .def("SmallButton", [](CommandBuffer& cb, const char* label) { cb.op(CommandOp_SmallButton); int slot = cb.result(); cb.put(label); return slot; }, py::arg("label"), "button with (FramePadding.y == 0) to easily embed within text")
+    .def("InvisibleButton", [](CommandBuffer& cb, const char* str_id, const ImVec2& size, ImGuiButtonFlags flags) { cb.op(CommandOp_InvisibleButton); int slot = cb.result(); cb.put(str_id); cb.put(size); cb.put(flags); return slot; }, py::arg("str_id"), py::arg("size"), py::arg("flags") = 0, "flexible button behavior without the visuals, frequently useful to build custom behaviors using the public api (along with IsItemActive, IsItemHovered, etc.)")
+    .def("ArrowButton", [](CommandBuffer& cb, const char* str_id, ImGuiDir dir) { cb.op(CommandOp_ArrowButton); int slot = cb.result(); cb.put(str_id); cb.put(dir); return slot; }, py::arg("str_id"), py::arg("dir"), "square button with an arrow shape")
+    .def("RadioButton", [](CommandBuffer& cb, const char* label, bool active) { cb.op(CommandOp_RadioButton_StrBool); int slot = cb.result(); cb.put(label); cb.put(active); return slot; }, py::arg("label"), py::arg("active"), "use with e.g. if (RadioButton(\"one\", my_value==1)) { my_value = 1; }")
+    .def("ProgressBar", [](CommandBuffer& cb, float fraction, const ImVec2& size_arg, const char* overlay) { cb.op(CommandOp_ProgressBar); cb.put(fraction); cb.put(size_arg); cb.put(overlay); }, py::arg("fraction"), py::arg("size_arg") = ImVec2(-FLT_MIN, 0), py::arg("overlay") = py::none())
+    .def("Bullet", [](CommandBuffer& cb) { cb.op(CommandOp_Bullet); }, "draw a small circle + keep the cursor on the same line. advance cursor x position by GetTreeNodeToLabelSpacing(), same distance that TreeNode() uses")
+    .def("BeginCombo", [](CommandBuffer& cb, const char* label, const char* preview_value, ImGuiComboFlags flags) { cb.op(CommandOp_BeginCombo); int slot = cb.result(); cb.put(label); cb.put(preview_value); cb.put(flags); return slot; }, py::arg("label"), py::arg("preview_value"), py::arg("flags") = 0)
+    .def("EndCombo", [](CommandBuffer& cb) { cb.op(CommandOp_EndCombo); }, "only call EndCombo() if BeginCombo() returns true!")
+    .def("BeginListBox", [](CommandBuffer& cb, const char* label, const ImVec2& size) { cb.op(CommandOp_BeginListBox); int slot = cb.result(); cb.put(label); cb.put(size); return slot; }, py::arg("label"), py::arg("size") = ImVec2(0, 0), "open a framed scrolling region")
+    .def("EndListBox", [](CommandBuffer& cb) { cb.op(CommandOp_EndListBox); }, "only call EndListBox() if BeginListBox() returned true!")
+    .def("TreeNode", [](CommandBuffer& cb, const char* label) { cb.op(CommandOp_TreeNode_Str); int slot = cb.result(); cb.put(label); return slot; }, py::arg("label"))
+    .def("TreePush", [](CommandBuffer& cb, const char* str_id) { cb.op(CommandOp_TreePush_Str); cb.put(str_id); }, py::arg("str_id"), "~ Indent()+PushId(). Already called by TreeNode() when returning true, but you can call TreePush/TreePop yourself if desired.")
+    .def("TreePop", [](CommandBuffer& cb) { cb.op(CommandOp_TreePop); }, "~ Unindent()+PopId()")
+    .def("GetTreeNodeToLabelSpacing", [](CommandBuffer& cb) { cb.op(CommandOp_GetTreeNodeToLabelSpacing); int slot = cb.result(); return slot; }, "horizontal distance preceding label when using TreeNode*() or Bullet() == (g.FontSize + style.FramePadding.x*2) for a regular unframed TreeNode")
+    .def("CollapsingHeader", [](CommandBuffer& cb, const char* label, ImGuiTreeNodeFlags flags) { cb.op(CommandOp_CollapsingHeader_StrTreeNodeFlags); int slot = cb.result(); cb.put(label); cb.put(flags); return slot; }, py::arg("label"), py::arg("flags") = 0, "if returning 'true' the header is open. doesn't indent nor push on ID stack. user doesn't have to call TreePop().")
+    .def("SetNextItemOpen", [](CommandBuffer& cb, bool is_open, ImGuiCond cond) { cb.op(CommandOp_SetNextItemOpen); cb.put(is_open); cb.put(cond); }, py::arg("is_open"), py::arg("cond") = 0, "set next TreeNode/CollapsingHeader open state.")
+    .def("Selectable", [](CommandBuffer& cb, const char* label, bool selected, ImGuiSelectableFlags flags, const ImVec2& size) { cb.op(CommandOp_Selectable_StrBoolSelectableFlagsImVec2); int slot = cb.result(); cb.put(label); cb.put(selected); cb.put(flags); cb.put(size); return slot; }, py::arg("label"), py::arg("selected") = false, py::arg("flags") = 0, py::arg("size") = ImVec2(0, 0), "\"bool selected\" carry the selection state (read-only). Selectable() is clicked is returns true so you can modify your selection state. size.x==0.0: use remaining width, size.x>0.0: specify width. size.y==0.0: use label height, size.y>0.0: specify height")
+    .def("GetMainViewport", [](CommandBuffer& cb) { cb.op(CommandOp_GetMainViewport); int slot = cb.result(); return slot; }, "return primary/default viewport. This can never be NULL.")
+    .def("GetWindowDrawList", [](CommandBuffer& cb) { cb.op(CommandOp_GetWindowDrawList); int slot = cb.result(); return slot; }, "get draw list associated to the current window, to append your own drawing primitives")
+    .def("GetBackgroundDrawList", [](CommandBuffer& cb) { cb.op(CommandOp_GetBackgroundDrawList_Void); int slot = cb.result(); return slot; }, "get background draw list for the viewport associated to the current window. this draw list will be the first rendering one. Useful to quickly draw shapes/text behind dear imgui contents.")
+    .def("GetForegroundDrawList", [](CommandBuffer& cb) { cb.op(CommandOp_GetForegroundDrawList_Void); int slot = cb.result(); return slot; }, "get foreground draw list for the viewport associated to the current window. this draw list will be the last rendered one. Useful to quickly draw shapes/text over dear imgui contents.")
+    .def("BeginMenuBar", [](CommandBuffer& cb) { cb.op(CommandOp_BeginMenuBar); int slot = cb.result(); return slot; }, "append to menu-bar of current window (requires ImGuiWindowFlags_MenuBar flag set on parent window).")
+    .def("EndMenuBar", [](CommandBuffer& cb) { cb.op(CommandOp_EndMenuBar); }, "only call EndMenuBar() if BeginMenuBar() returns true!")
+    .def("BeginMainMenuBar", [](CommandBuffer& cb) { cb.op(CommandOp_BeginMainMenuBar); int slot = cb.result(); return slot; }, "create and append to a full screen menu-bar.")
+    .def("EndMainMenuBar", [](CommandBuffer& cb) { cb.op(CommandOp_EndMainMenuBar); }, "only call EndMainMenuBar() if BeginMainMenuBar() returns true!")
+    .def("BeginMenu", [](CommandBuffer& cb, const char* label, bool enabled) { cb.op(CommandOp_BeginMenu); int slot = cb.result(); cb.put(label); cb.put(enabled); return slot; }, py::arg("label"), py::arg("enabled") = true, "create a sub-menu entry. only call EndMenu() if this returns true!")
+    .def("EndMenu", [](CommandBuffer& cb) { cb.op(CommandOp_EndMenu); })
+    .def("MenuItem", [](CommandBuffer& cb, const char* label, const char* shortcut, bool selected, bool enabled) { cb.op(CommandOp_MenuItem_StrStrBoolBool); int slot = cb.result(); cb.put(label); cb.put(shortcut); cb.put(selected); cb.put(enabled); return slot; }, py::arg("label"), py::arg("shortcut") = py::none(), py::arg("selected") = false, py::arg("enabled") = true, "return true when activated.")
+    .def("BeginTooltip", [](CommandBuffer& cb) { cb.op(CommandOp_BeginTooltip); int slot = cb.result(); return slot; }, "begin/append a tooltip window.")
+    .def("EndTooltip", [](CommandBuffer& cb) { cb.op(CommandOp_EndTooltip); }, "only call EndTooltip() if BeginTooltip()/BeginItemTooltip() returns true!")
+    .def("BeginItemTooltip", [](CommandBuffer& cb) { cb.op(CommandOp_BeginItemTooltip); int slot = cb.result(); return slot; }, "begin/append a tooltip window if preceding item was hovered.")
+    .def("BeginPopup", [](CommandBuffer& cb, const char* str_id, ImGuiWindowFlags flags) { cb.op(CommandOp_BeginPopup); int slot = cb.result(); cb.put(str_id); cb.put(flags); return slot; }, py::arg("str_id"), py::arg("flags") = 0, "return true if the popup is open, and you can start outputting to it.")
+    .def("EndPopup", [](CommandBuffer& cb) { cb.op(CommandOp_EndPopup); }, "only call EndPopup() if BeginPopupXXX() returns true!")
+    .def("OpenPopup", [](CommandBuffer& cb, const char* str_id, ImGuiPopupFlags popup_flags) { cb.op(CommandOp_OpenPopup_StrPopupFlags); cb.put(str_id); cb.put(popup_flags); }, py::arg("str_id"), py::arg("popup_flags") = 0, "call to mark popup as open (don't call every frame!).")
+    .def("OpenPopup", [](CommandBuffer& cb, ImGuiID id, ImGuiPopupFlags popup_flags) { cb.op(CommandOp_OpenPopup_IDPopupFlags); cb.put(id); cb.put(popup_flags); }, py::arg("id"), py::arg("popup_flags") = 0, "id overload to facilitate calling from nested stacks")
+    .def("OpenPopupOnItemClick", [](CommandBuffer& cb, const char* str_id, ImGuiPopupFlags popup_flags) { cb.op(CommandOp_OpenPopupOnItemClick); cb.put(str_id); cb.put(popup_flags); }, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "helper to open popup when clicked on last item. Default to ImGuiPopupFlags_MouseButtonRight == 1. (note: actually triggers on the mouse _released_ event to be consistent with popup behaviors)")
+    .def("CloseCurrentPopup", [](CommandBuffer& cb) { cb.op(CommandOp_CloseCurrentPopup); }, "manually close the popup we have begin-ed into.")
+    .def("BeginPopupContextItem", [](CommandBuffer& cb, const char* str_id, ImGuiPopupFlags popup_flags) { cb.op(CommandOp_BeginPopupContextItem); int slot = cb.result(); cb.put(str_id); cb.put(popup_flags); return slot; }, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "open+begin popup when clicked on last item. Use str_id==NULL to associate the popup to previous item. If you want to use that on a non-interactive item such as Text() you need to pass in an explicit ID here. read comments in .cpp!")
+    .def("BeginPopupContextWindow", [](CommandBuffer& cb, const char* str_id, ImGuiPopupFlags popup_flags) { cb.op(CommandOp_BeginPopupContextWindow); int slot = cb.result(); cb.put(str_id); cb.put(popup_flags); return slot; }, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "open+begin popup when clicked on current window.")
+    .def("BeginPopupContextVoid", [](CommandBuffer& cb, const char* str_id, ImGuiPopupFlags popup_flags) { cb.op(CommandOp_BeginPopupContextVoid); int slot = cb.result(); cb.put(str_id); cb.put(popup_flags); return slot; }, py::arg("str_id") = py::none(), py::arg("popup_flags") = 1, "open+begin popup when clicked in void (where there are no windows).")
+    .def("IsPopupOpen", [](CommandBuffer& cb, const char* str_id, ImGuiPopupFlags flags) { cb.op(CommandOp_IsPopupOpen); int slot = cb.result(); cb.put(str_id); cb.put(flags); return slot; }, py::arg("str_id"), py::arg("flags") = 0, "return true if the popup is open.")
+    .def("BeginTable", [](CommandBuffer& cb, const char* str_id, int column, ImGuiTableFlags flags, const ImVec2& outer_size, float inner_width) { cb.op(CommandOp_BeginTable); int slot = cb.result(); cb.put(str_id); cb.put(column); cb.put(flags); cb.put(outer_size); cb.put(inner_width); return slot; }, py::arg("str_id"), py::arg("column"), py::arg("flags") = 0, py::arg("outer_size") = ImVec2(0.0f, 0.0f), py::arg("inner_width") = 0.0f)
+    .def("EndTable", [](CommandBuffer& cb) { cb.op(CommandOp_EndTable); }, "only call EndTable() if BeginTable() returns true!")
+    .def("TableNextRow", [](CommandBuffer& cb, ImGuiTableRowFlags row_flags, float min_row_height) { cb.op(CommandOp_TableNextRow); cb.put(row_flags); cb.put(min_row_height); }, py::arg("row_flags") = 0, py::arg("min_row_height") = 0.0f, "append into the first cell of a new row.")
+    .def("TableNextColumn", [](CommandBuffer& cb) { cb.op(CommandOp_TableNextColumn); int slot = cb.result(); return slot; }, "append into the next column (or first column of next row if currently in last column). Return true when column is visible.")
+    .def("TableSetColumnIndex", [](CommandBuffer& cb, int column_n) { cb.op(CommandOp_TableSetColumnIndex); int slot = cb.result(); cb.put(column_n); return slot; }, py::arg("column_n"), "append into the specified column. Return true when column is visible.")
+    .def("TableSetupColumn", [](CommandBuffer& cb, const char* label, ImGuiTableColumnFlags flags, float init_width_or_weight, ImGuiID user_id) { cb.op(CommandOp_TableSetupColumn); cb.put(label); cb.put(flags); cb.put(init_width_or_weight); cb.put(user_id); }, py::arg("label"), py::arg("flags") = 0, py::arg("init_width_or_weight") = 0.0f, py::arg("user_id") = 0)
+    .def("TableSetupScrollFreeze", [](CommandBuffer& cb, int cols, int rows) { cb.op(CommandOp_TableSetupScrollFreeze); cb.put(cols); cb.put(rows); }, py::arg("cols"), py::arg("rows"), "lock columns/rows so they stay visible when scrolled.")
+    .def("TableHeadersRow", [](CommandBuffer& cb) { cb.op(CommandOp_TableHeadersRow); }, "submit a row with headers cells based on data provided to TableSetupColumn() + submit context menu")
+    .def("TableHeader", [](CommandBuffer& cb, const char* label) { cb.op(CommandOp_TableHeader); cb.put(label); }, py::arg("label"), "submit one header cell manually (rarely used)")
+    .def("TableGetColumnCount", [](CommandBuffer& cb) { cb.op(CommandOp_TableGetColumnCount); int slot = cb.result(); return slot; }, "return number of columns (value passed to BeginTable)")
+    .def("TableGetColumnIndex", [](CommandBuffer& cb) { cb.op(CommandOp_TableGetColumnIndex); int slot = cb.result(); return slot; }, "return current column index.")
+    .def("TableGetRowIndex", [](CommandBuffer& cb) { cb.op(CommandOp_TableGetRowIndex); int slot = cb.result(); return slot; }, "return current row index.")
+    .def("TableGetColumnName", [](CommandBuffer& cb, int column_n) { cb.op(CommandOp_TableGetColumnName); int slot = cb.result(); cb.put(column_n); return slot; }, py::arg("column_n") = -1, "return \"\" if column didn't have a name declared by TableSetupColumn(). Pass -1 to use current column.")
+    .def("TableGetColumnFlags", [](CommandBuffer& cb, int column_n) { cb.op(CommandOp_TableGetColumnFlags); int slot = cb.result(); cb.put(column_n); return slot; }, py::arg("column_n") = -1, "return column flags so you can query their Enabled/Visible/Sorted/Hovered status flags. Pass -1 to use current column.")
+    .def("TableSetColumnEnabled", [](CommandBuffer& cb, int column_n, bool v) { cb.op(CommandOp_TableSetColumnEnabled); cb.put(column_n); cb.put(v); }, py::arg("column_n"), py::arg("v"), "change user accessible enabled/disabled state of a column. Set to false to hide the column. User can use the context menu to change this themselves (right-click in headers, or right-click in columns body with ImGuiTableFlags_ContextMenuInBody)")
+    .def("TableSetBgColor", [](CommandBuffer& cb, ImGuiTableBgTarget target, ImU32 color, int column_n) { cb.op(CommandOp_TableSetBgColor); cb.put(target); cb.put(color); cb.put(column_n); }, py::arg("target"), py::arg("color"), py::arg("column_n") = -1, "change the color of a cell, row, or column. See ImGuiTableBgTarget_ flags for details.")
+    .def("TableGetSortSpecs", [](CommandBuffer& cb) { cb.op(CommandOp_TableGetSortSpecs); int slot = cb.result(); return slot; }, "get latest sort specs for the table (NULL if not sorting).  Lifetime: don't hold on this pointer over multiple frames or past any subsequent call to BeginTable().")
+    .def("ColorButton", [](CommandBuffer& cb, const char* desc_id, const ImVec4& col, ImGuiColorEditFlags flags, const ImVec2& size) { cb.op(CommandOp_ColorButton); int slot = cb.result(); cb.put(desc_id); cb.put(col); cb.put(flags); cb.put(size); return slot; }, py::arg("desc_id"), py::arg("col"), py::arg("flags") = 0, py::arg("size") = ImVec2(0, 0), "display a color square/button, hover for details, return true when pressed.")
+    .def("BeginTabBar", [](CommandBuffer& cb, const char* str_id, ImGuiTabBarFlags flags) { cb.op(CommandOp_BeginTabBar); int slot = cb.result(); cb.put(str_id); cb.put(flags); return slot; }, py::arg("str_id"), py::arg("flags") = 0, "create and append into a TabBar")
+    .def("EndTabBar", [](CommandBuffer& cb) { cb.op(CommandOp_EndTabBar); }, "only call EndTabBar() if BeginTabBar() returns true!")
+    .def("EndTabItem", [](CommandBuffer& cb) { cb.op(CommandOp_EndTabItem); }, "only call EndTabItem() if BeginTabItem() returns true!")
+    .def("TabItemButton", [](CommandBuffer& cb, const char* label, ImGuiTabItemFlags flags) { cb.op(CommandOp_TabItemButton); int slot = cb.result(); cb.put(label); cb.put(flags); return slot; }, py::arg("label"), py::arg("flags") = 0, "create a Tab behaving like a button. return true when clicked. cannot be selected in the tab bar.")
+    .def("SetTabItemClosed", [](CommandBuffer& cb, const char* tab_or_docked_window_label) { cb.op(CommandOp_SetTabItemClosed); cb.put(tab_or_docked_window_label); }, py::arg("tab_or_docked_window_label"), "notify TabBar or Docking system of a closed tab/window ahead (useful to reduce visual flicker on reorderable tab bars). For tab-bar: call after BeginTabBar() and before Tab submissions. Otherwise call with a window name.")
+    .def("BeginDisabled", [](CommandBuffer& cb, bool disabled) { cb.op(CommandOp_BeginDisabled); cb.put(disabled); }, py::arg("disabled") = true)
+    .def("EndDisabled", [](CommandBuffer& cb) { cb.op(CommandOp_EndDisabled); })
+    .def("SetItemDefaultFocus", [](CommandBuffer& cb) { cb.op(CommandOp_SetItemDefaultFocus); }, "make last item the default focused item of a window.")
+    .def("SetKeyboardFocusHere", [](CommandBuffer& cb, int offset) { cb.op(CommandOp_SetKeyboardFocusHere); cb.put(offset); }, py::arg("offset") = 0, "focus keyboard on the next widget. Use positive 'offset' to access sub components of a multiple component widget. Use -1 to access previous widget.")
+    .def("SetNextItemAllowOverlap", [](CommandBuffer& cb) { cb.op(CommandOp_SetNextItemAllowOverlap); }, "allow next item to be overlapped by a subsequent item. Useful with invisible buttons, selectable, treenode covering an area where subsequent items may need to be added. Note that both Selectable() and TreeNode() have dedicated flags doing this.")
+    .def("IsItemHovered", [](CommandBuffer& cb, ImGuiHoveredFlags flags) { cb.op(CommandOp_IsItemHovered); int slot = cb.result(); cb.put(flags); return slot; }, py::arg("flags") = 0, "is the last item hovered? (and usable, aka not blocked by a popup, etc.). See ImGuiHoveredFlags for more options.")
+    .def("IsItemActive", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemActive); int slot = cb.result(); return slot; }, "is the last item active? (e.g. button being held, text field being edited. This will continuously return true while holding mouse button on an item. Items that don't interact will always return false)")
+    .def("IsItemFocused", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemFocused); int slot = cb.result(); return slot; }, "is the last item focused for keyboard/gamepad navigation?")
+    .def("IsItemClicked", [](CommandBuffer& cb, ImGuiMouseButton mouse_button) { cb.op(CommandOp_IsItemClicked); int slot = cb.result(); cb.put(mouse_button); return slot; }, py::arg("mouse_button") = 0, "is the last item hovered and mouse clicked on? (**)  == IsMouseClicked(mouse_button) && IsItemHovered()Important. (**) this is NOT equivalent to the behavior of e.g. Button(). Read comments in function definition.")
+    .def("IsItemVisible", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemVisible); int slot = cb.result(); return slot; }, "is the last item visible? (items may be out of sight because of clipping/scrolling)")
+    .def("IsItemEdited", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemEdited); int slot = cb.result(); return slot; }, "did the last item modify its underlying value this frame? or was pressed? This is generally the same as the \"bool\" return value of many widgets.")
+    .def("IsItemActivated", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemActivated); int slot = cb.result(); return slot; }, "was the last item just made active (item was previously inactive).")
+    .def("IsItemDeactivated", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemDeactivated); int slot = cb.result(); return slot; }, "was the last item just made inactive (item was previously active). Useful for Undo/Redo patterns with widgets that require continuous editing.")
+    .def("IsItemDeactivatedAfterEdit", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemDeactivatedAfterEdit); int slot = cb.result(); return slot; }, "was the last item just made inactive and made a value change when it was active? (e.g. Slider/Drag moved). Useful for Undo/Redo patterns with widgets that require continuous editing. Note that you may get false positives (some widgets such as Combo()/ListBox()/Selectable() will return true even when clicking an already selected item).")
+    .def("IsItemToggledOpen", [](CommandBuffer& cb) { cb.op(CommandOp_IsItemToggledOpen); int slot = cb.result(); return slot; }, "was the last item open state toggled? set by TreeNode().")
+    .def("IsAnyItemHovered", [](CommandBuffer& cb) { cb.op(CommandOp_IsAnyItemHovered); int slot = cb.result(); return slot; }, "is any item hovered?")
+    .def("IsAnyItemActive", [](CommandBuffer& cb) { cb.op(CommandOp_IsAnyItemActive); int slot = cb.result(); return slot; }, "is any item active?")
+    .def("IsAnyItemFocused", [](CommandBuffer& cb) { cb.op(CommandOp_IsAnyItemFocused); int slot = cb.result(); return slot; }, "is any item focused?")
+    .def("GetItemID", [](CommandBuffer& cb) { cb.op(CommandOp_GetItemID); int slot = cb.result(); return slot; }, "get ID of last item (~~ often same ImGui::GetID(label) beforehand)")
+    .def("GetItemRectMin", [](CommandBuffer& cb) { cb.op(CommandOp_GetItemRectMin); int slot = cb.result(); return slot; }, "get upper-left bounding rectangle of the last item (screen space)")
+    .def("GetItemRectMax", [](CommandBuffer& cb) { cb.op(CommandOp_GetItemRectMax); int slot = cb.result(); return slot; }, "get lower-right bounding rectangle of the last item (screen space)")
+    .def("GetItemRectSize", [](CommandBuffer& cb) { cb.op(CommandOp_GetItemRectSize); int slot = cb.result(); return slot; }, "get size of last item")
+    .def("IsRectVisible", [](CommandBuffer& cb, const ImVec2& size) { cb.op(CommandOp_IsRectVisible_ImVec2); int slot = cb.result(); cb.put(size); return slot; }, py::arg("size"), "test if rectangle (of given size, starting from cursor position) is visible / not clipped.")
+    .def("IsRectVisible", [](CommandBuffer& cb, const ImVec2& rect_min, const ImVec2& rect_max) { cb.op(CommandOp_IsRectVisible_ImVec2ImVec2); int slot = cb.result(); cb.put(rect_min); cb.put(rect_max); return slot; }, py::arg("rect_min"), py::arg("rect_max"), "test if rectangle (in screen space) is visible / not clipped. to perform coarse clipping on user's side.")
+    .def("BeginChildFrame", [](CommandBuffer& cb, ImGuiID id, const ImVec2& size, ImGuiWindowFlags flags) { cb.op(CommandOp_BeginChildFrame); int slot = cb.result(); cb.put(id); cb.put(size); cb.put(flags); return slot; }, py::arg("id"), py::arg("size"), py::arg("flags") = 0, "helper to create a child window / scrolling region that looks like a normal widget frame")
+    .def("EndChildFrame", [](CommandBuffer& cb) { cb.op(CommandOp_EndChildFrame); }, "always call EndChildFrame() regardless of BeginChildFrame() return values (which indicates a collapsed/clipped window)")
+    .def("IsKeyDown", [](CommandBuffer& cb, ImGuiKey key) { cb.op(CommandOp_IsKeyDown); int slot = cb.result(); cb.put(key); return slot; }, py::arg("key"), "is key being held.")
+    .def("IsKeyPressed", [](CommandBuffer& cb, ImGuiKey key, bool repeat) { cb.op(CommandOp_IsKeyPressed); int slot = cb.result(); cb.put(key); cb.put(repeat); return slot; }, py::arg("key"), py::arg("repeat") = true, "was key pressed (went from !Down to Down)? if repeat=true, uses io.KeyRepeatDelay / KeyRepeatRate")
+    .def("IsKeyReleased", [](CommandBuffer& cb, ImGuiKey key) { cb.op(CommandOp_IsKeyReleased); int slot = cb.result(); cb.put(key); return slot; }, py::arg("key"), "was key released (went from Down to !Down)?")
+    .def("SetNextFrameWantCaptureKeyboard", [](CommandBuffer& cb, bool want_capture_keyboard) { cb.op(CommandOp_SetNextFrameWantCaptureKeyboard); cb.put(want_capture_keyboard); }, py::arg("want_capture_keyboard"), "Override io.WantCaptureKeyboard flag next frame (said flag is left for your application to handle, typically when true it instructs your app to ignore inputs). e.g. force capture keyboard when your widget is being hovered. This is equivalent to setting \"io.WantCaptureKeyboard = want_capture_keyboard\"; after the next NewFrame() call.")
+    .def("IsMouseDown", [](CommandBuffer& cb, ImGuiMouseButton button) { cb.op(CommandOp_IsMouseDown); int slot = cb.result(); cb.put(button); return slot; }, py::arg("button"), "is mouse button held?")
+    .def("IsMouseClicked", [](CommandBuffer& cb, ImGuiMouseButton button, bool repeat) { cb.op(CommandOp_IsMouseClicked); int slot = cb.result(); cb.put(button); cb.put(repeat); return slot; }, py::arg("button"), py::arg("repeat") = false, "did mouse button clicked? (went from !Down to Down). Same as GetMouseClickedCount() == 1.")
+    .def("IsMouseReleased", [](CommandBuffer& cb, ImGuiMouseButton button) { cb.op(CommandOp_IsMouseReleased); int slot = cb.result(); cb.put(button); return slot; }, py::arg("button"), "did mouse button released? (went from Down to !Down)")
+    .def("IsMouseDoubleClicked", [](CommandBuffer& cb, ImGuiMouseButton button) { cb.op(CommandOp_IsMouseDoubleClicked); int slot = cb.result(); cb.put(button); return slot; }, py::arg("button"), "did mouse button double-clicked? Same as GetMouseClickedCount() == 2. (note that a double-click will also report IsMouseClicked() == true)")
+    .def("IsMouseHoveringRect", [](CommandBuffer& cb, const ImVec2& r_min, const ImVec2& r_max, bool clip) { cb.op(CommandOp_IsMouseHoveringRect); int slot = cb.result(); cb.put(r_min); cb.put(r_max); cb.put(clip); return slot; }, py::arg("r_min"), py::arg("r_max"), py::arg("clip") = true, "is mouse hovering given bounding rect (in screen space). clipped by current clipping settings, but disregarding of other consideration of focus/window ordering/popup-block.")
+    .def("IsAnyMouseDown", [](CommandBuffer& cb) { cb.op(CommandOp_IsAnyMouseDown); int slot = cb.result(); return slot; }, "[WILL OBSOLETE] is any mouse button held? This was designed for backends, but prefer having backend maintain a mask of held mouse buttons, because upcoming input queue system will make this invalid.")
+    .def("GetMousePos", [](CommandBuffer& cb) { cb.op(CommandOp_GetMousePos); int slot = cb.result(); return slot; }, "shortcut to ImGui::GetIO().MousePos provided by user, to be consistent with other calls")
+    .def("GetMousePosOnOpeningCurrentPopup", [](CommandBuffer& cb) { cb.op(CommandOp_GetMousePosOnOpeningCurrentPopup); int slot = cb.result(); return slot; }, "retrieve mouse position at the time of opening popup we have BeginPopup() into (helper to avoid user backing that value themselves)")
+    .def("IsMouseDragging", [](CommandBuffer& cb, ImGuiMouseButton button, float lock_threshold) { cb.op(CommandOp_IsMouseDragging); int slot = cb.result(); cb.put(button); cb.put(lock_threshold); return slot; }, py::arg("button"), py::arg("lock_threshold") = -1.0f, "is mouse dragging? (if lock_threshold < -1.0f, uses io.MouseDraggingThreshold)")
+    .def("GetMouseDragDelta", [](CommandBuffer& cb, ImGuiMouseButton button, float lock_threshold) { cb.op(CommandOp_GetMouseDragDelta); int slot = cb.result(); cb.put(button); cb.put(lock_threshold); return slot; }, py::arg("button") = 0, py::arg("lock_threshold") = -1.0f, "return the delta from the initial clicking position while the mouse button is pressed or was just released. This is locked and return 0.0f until the mouse moves past a distance threshold at least once (if lock_threshold < -1.0f, uses io.MouseDraggingThreshold)")
+    .def("ResetMouseDragDelta", [](CommandBuffer& cb, ImGuiMouseButton button) { cb.op(CommandOp_ResetMouseDragDelta); cb.put(button); }, py::arg("button") = 0)
+    .def("GetMouseCursor", [](CommandBuffer& cb) { cb.op(CommandOp_GetMouseCursor); int slot = cb.result(); return slot; }, "get desired mouse cursor shape. Important: reset in ImGui::NewFrame(), this is updated during the frame. valid before Render(). If you use software rendering by setting io.MouseDrawCursor ImGui will render those for you")
+    .def("SetMouseCursor", [](CommandBuffer& cb, ImGuiMouseCursor cursor_type) { cb.op(CommandOp_SetMouseCursor); cb.put(cursor_type); }, py::arg("cursor_type"), "set desired mouse cursor shape")
+    .def("SetNextFrameWantCaptureMouse", [](CommandBuffer& cb, bool want_capture_mouse) { cb.op(CommandOp_SetNextFrameWantCaptureMouse); cb.put(want_capture_mouse); }, py::arg("want_capture_mouse"), "Override io.WantCaptureMouse flag next frame (said flag is left for your application to handle, typical when true it instucts your app to ignore inputs). This is equivalent to setting \"io.WantCaptureMouse = want_capture_mouse;\" after the next NewFrame() call.")
+    .def("GetClipboardText", [](CommandBuffer& cb) { cb.op(CommandOp_GetClipboardText); int slot = cb.result(); return slot; })
+    .def("SetClipboardText", [](CommandBuffer& cb, const char* text) { cb.op(CommandOp_SetClipboardText); cb.put(text); }, py::arg("text"))
+  ;
+
+  m.def("Replay", &ReplayCommandBuffer, py::arg("buffer"), "run every command recorded in `buffer`, returns the list of results indexed by slot (None for calls skipped by If())");
 
 }
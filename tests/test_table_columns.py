@@ -0,0 +1,41 @@
+# Regression tests of TableColumns against the headless module of bench/imgui_bench.cpp,
+# skipped when it is not built:
+#
+#   PYTHONPATH=<build dir> python -m pytest tests
+import array
+
+import pytest
+
+ImGui = pytest.importorskip('imgui_bench')
+
+
+@pytest.fixture
+def frame():
+    ImGui.CreateHeadlessContext()
+    ImGui.NewFrame()
+    ImGui.Begin('tests')
+    yield
+    ImGui.End()
+    ImGui.EndFrame()
+    ImGui.DestroyContext()
+
+
+def test_draws_numeric_and_str_columns(frame):
+    assert ImGui.TableColumns('t', [array.array('i', [3, 1, 2]), ['c', 'a', 'b']], headers=['n', 's'])
+
+
+@pytest.mark.parametrize('columns, error', [
+    ([array.array('i', [1, 2]), ['a', 2]], TypeError),
+    ([array.array('i', [1, 2]), ['a']], ValueError),
+    ([array.array('i', [1, 2]), 5], TypeError),
+])
+def test_bad_column_leaves_no_table_open(frame, columns, error):
+    with pytest.raises(error):
+        ImGui.TableColumns('t', columns)
+    # the frame still ends normally, instead of asserting on an unclosed table
+    assert ImGui.TableColumns('t', [array.array('i', [1, 2]), ['a', 'b']])
+
+
+def test_bad_header_leaves_no_table_open(frame):
+    with pytest.raises(TypeError):
+        ImGui.TableColumns('t', [['a']], headers=[1])